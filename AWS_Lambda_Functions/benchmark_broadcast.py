@@ -0,0 +1,187 @@
+# AWS_Lambda_Functions/benchmark_broadcast.py
+"""
+Newsletter broadcast against in-process DynamoDB and SES (moto)
+
+Fills a subscriber table (every tenth subscriber unsubscribed), then sends
+one broadcast in four runs:
+
+  ses      - SES reports the daily quota used up part way through a bulk call,
+             after accepting some of its destinations and before others
+  quota    - a pacer with only a third of the list left in its daily quota stops early
+  crash    - a run killed during a bulk call, right after its in-flight checkpoint
+  resume   - a run that carries on from the checkpoint to the end
+
+and checks that every active subscriber has exactly one outcome, nobody
+unsubscribed got one, and SES accepted exactly as many messages as were
+recorded sent. The pacer runs on a simulated clock, so the send-rate
+wait is reported rather than slept.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_broadcast.py --subscribers 5000 --rate 14
+
+Requires boto3 and moto locally. Nothing is sent to AWS.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from collections import Counter
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+TABLE_NAME = 'benchmark-subscribers'
+TEMPLATE = 'benchmark-newsletter'
+SENDER = 'noreply@nashandsmashed.com'
+BROADCAST_ID = 'benchmark-broadcast'
+
+class SimulatedClock:
+    """Clock for the pacer whose sleep() only moves time forward"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class Crash(BaseException):
+    """Stands in for the process dying; not an Exception, so nothing catches it"""
+
+class CrashingStore:
+    """Passes through to a store, dying after the checkpoint of the nth bulk call"""
+
+    def __init__(self, store, crash_on_call):
+        self.store = store
+        self.calls = 0
+        self.crash_on_call = crash_on_call
+
+    def load_checkpoint(self):
+        return self.store.load_checkpoint()
+
+    def record_outcomes(self, outcomes):
+        self.store.record_outcomes(outcomes)
+
+    def save_checkpoint(self, checkpoint):
+        self.store.save_checkpoint(checkpoint)
+        if checkpoint['inFlight']:
+            self.calls += 1
+            if self.calls == self.crash_on_call:
+                raise Crash()
+
+def fill_table(dynamodb, count):
+    table = dynamodb.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{'AttributeName': 'email', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': 'email', 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    active = set()
+    with table.batch_writer() as batch:
+        for i in range(count):
+            email = f'subscriber{i}@example.com'
+            status = 'unsubscribed' if i % 10 == 9 else 'active'
+            if status == 'active':
+                active.add(email)
+            batch.put_item(Item={
+                'email': email,
+                'firstName': f'First{i}' if i % 7 else '',
+                'lastName': f'Last{i}',
+                'status': status,
+                'createdAt': str(1700000000000 + i)
+            })
+    return active
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the newsletter broadcast engine')
+    parser.add_argument('--subscribers', type=int, default=5000, help='Subscribers in the table (default: 5000)')
+    parser.add_argument('--rate', type=float, default=14, help='Simulated SES send rate per second (default: 14)')
+    parser.add_argument('--page-size', type=int, default=500, help='Subscribers per Scan request (default: 500)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+
+    from moto import mock_aws
+    with mock_aws(), tempfile.TemporaryDirectory() as state_dir:
+        from form_pipeline.aws_clients import get_dynamodb, get_ses
+        from form_pipeline.broadcast import (
+            run_broadcast, FileBroadcastStore, SendRatePacer, BULK_BATCH_SIZE, COMPLETE, QUOTA_EXHAUSTED
+        )
+
+        active = fill_table(get_dynamodb(), args.subscribers)
+        ses = get_ses()
+        ses.verify_email_identity(EmailAddress=SENDER)
+        ses.create_template(Template={
+            'TemplateName': TEMPLATE,
+            'SubjectPart': 'News from Nash & Smashed',
+            'TextPart': 'Hi {{firstName}}, here is what is new this month.'
+        })
+        bulk_calls = Counter()
+        ses.meta.events.register('before-call.ses.SendBulkTemplatedEmail',
+                                 lambda **kwargs: bulk_calls.update(['calls']))
+
+        def quota_mid_batch(parsed, **kwargs):
+            # On the third call, one destination in the middle hits the quota; moto
+            # has sent it anyway, so it counts once more in SentLast24Hours
+            if bulk_calls['calls'] == 3 and not bulk_calls['injected']:
+                parsed['Status'][BULK_BATCH_SIZE // 2] = {'Status': 'AccountDailyQuotaExceeded',
+                                                          'Error': 'Daily message quota exceeded.'}
+                bulk_calls.update(['injected'])
+
+        ses.meta.events.register('after-call.ses.SendBulkTemplatedEmail', quota_mid_batch)
+        store = FileBroadcastStore(state_dir, BROADCAST_ID)
+        clock = SimulatedClock()
+
+        def run(store, daily_remaining=None):
+            pacer = SendRatePacer(args.rate, daily_remaining, clock=clock, sleep=clock.sleep)
+            return run_broadcast(BROADCAST_ID, TEMPLATE, SENDER, store, TABLE_NAME, pacer=pacer,
+                                 default_data={'firstName': 'friend'}, page_size=args.page_size)
+
+        started = time.perf_counter()
+        result = run(store)
+        assert result['status'] == QUOTA_EXHAUSTED, result
+        # Destinations after the failing one were accepted and must count as sent
+        assert result['sent'] == 3 * BULK_BATCH_SIZE - 1, result
+        print(f"ses     {result['status']}: {result['sent']} sent")
+
+        result = run(store, daily_remaining=len(active) // 3)
+        assert result['status'] == QUOTA_EXHAUSTED, result
+        print(f"quota   {result['status']}: {result['sent']} sent")
+
+        try:
+            run(CrashingStore(store, crash_on_call=2))
+            raise AssertionError("the crashing run finished")
+        except Crash:
+            print(f"crash   killed during a bulk call after {store.load_checkpoint()['sent']} sent")
+
+        result = run(store)
+        elapsed = time.perf_counter() - started
+        assert result['status'] == COMPLETE, result
+        print(f"resume  {result['status']}: {result['sent']} sent, {result['failed']} failed, "
+              f"{result['unknown']} unknown")
+
+        with open(store.outcomes_path, encoding='utf-8') as f:
+            outcomes = [json.loads(line) for line in f]
+        counts = Counter(outcome['email'] for outcome in outcomes)
+        statuses = Counter(outcome['status'] for outcome in outcomes)
+        ses_sent = int(ses.get_send_quota()['SentLast24Hours'])
+        assert set(counts) == active, "outcomes do not cover exactly the active subscribers"
+        assert max(counts.values()) == 1, "a subscriber has more than one outcome"
+        assert 0 < statuses['unknown'] <= BULK_BATCH_SIZE, statuses
+        assert ses_sent == statuses['sent'] + bulk_calls['injected'] and statuses['sent'] == result['sent'], \
+            (ses_sent, statuses)
+
+        print(f"{len(active)} active of {args.subscribers}: {dict(statuses)}")
+        print(f"SES calls: {bulk_calls['calls']} bulk vs {statuses['sent']} with send_email; "
+              f"paced send time at {args.rate:g}/s: {clock.now:.0f}s simulated; {elapsed:.1f}s under moto")
+
+    print("✓ Every active subscriber handled exactly once")
+
+if __name__ == '__main__':
+    main()
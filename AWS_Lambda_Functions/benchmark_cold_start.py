@@ -0,0 +1,178 @@
+# AWS_Lambda_Functions/benchmark_cold_start.py
+"""
+Cold start benchmark for the form Lambdas
+
+Starts a local stub of the DynamoDB and SES endpoints (with configurable
+round-trip latency), then imports each form's lambda_function in a fresh
+Python process and times:
+
+  init   - module import, i.e. the Lambda init phase
+  first  - the first invocation in that container
+  warm   - a second invocation in the same container
+  cold   - init + first, what the first visitor actually waits for
+
+Set AWS_LAMBDA_INITIALIZATION_TYPE=provisioned-concurrency to measure the
+preloaded-client path instead of the lazy one.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_cold_start.py --runs 5 --latency-ms 40
+    python AWS_Lambda_Functions/benchmark_cold_start.py --forms nashsmash-submit-contact-form
+
+Requires boto3 locally. Nothing is sent to AWS.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+SAMPLE_BODIES = {
+    'nashsmash-submit-contact-form': {
+        'firstName': 'Test', 'lastName': 'User', 'email': 'test@example.com', 'phone': '5555555555',
+        'interestType': 'general', 'message': 'Benchmark contact message'
+    },
+    'nashsmash-submit-contact-form-uk': {
+        'firstName': 'Test', 'lastName': 'User', 'email': 'test@example.com', 'phone': '07123456789',
+        'inquiryType': 'general', 'message': 'Benchmark contact message', 'location': 'London'
+    },
+    'nashsmash-submit-franchise-form': {
+        'firstName': 'Test', 'lastName': 'User', 'email': 'test@example.com', 'phone': '5555555555',
+        'homeAddress': '1 Main St', 'areaOfInterest': 'Arlington', 'stateCountryOfInterest': 'VA',
+        'cityOfInterest': 'Arlington', 'stateOfResidence': 'VA', 'cityOfResidence': 'Arlington',
+        'liquidCapital': '500000', 'businessExperience': 'Ten years running restaurants', 'referralSource': 'web'
+    },
+    'nashsmash-submit-fundraising-form': {
+        'organizationName': 'Test School', 'orgType': 'school', 'contactName': 'Test User',
+        'email': 'test@example.com', 'phone': '5555555555', 'location': 'Arlington',
+        'preferredDate': '2030-01-01', 'description': 'Benchmark fundraising request', 'termsAgreed': True
+    },
+    'nashsmash-submit-job-application-form': {
+        'firstName': 'Test', 'lastName': 'User', 'email': 'test@example.com', 'phone': '5555555555',
+        'eligibleToWork': 'yes', 'age': '18+', 'address': '1 Main St', 'cityState': 'Arlington, VA',
+        'interestType': 'cook', 'weekendAvailability': 'yes', 'startDate': '2030-01-01', 'terminated': 'no',
+        'workExperience': 'Line cook', 'references': 'Available', 'storeOwnerEmails': ['owner@example.com']
+    },
+    'nashsmash-submit-subscriber-form': {
+        'email': 'test@example.com', 'firstName': 'Test', 'lastName': 'User'
+    },
+}
+
+# Runs inside the fresh interpreter; prints one JSON line of timings in ms
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import lambda_function
+init = time.perf_counter()
+event = {
+    'httpMethod': 'POST',
+    'headers': {'User-Agent': 'benchmark'},
+    'requestContext': {'identity': {'sourceIp': '203.0.113.10'}},
+    'body': sys.argv[1]
+}
+first_response = lambda_function.lambda_handler(event, None)
+first = time.perf_counter()
+lambda_function.lambda_handler(event, None)
+warm = time.perf_counter()
+print(json.dumps({
+    'init': (init - start) * 1000,
+    'first': (first - init) * 1000,
+    'warm': (warm - first) * 1000,
+    'status': first_response['statusCode']
+}))
+"""
+
+class StubAWSHandler(BaseHTTPRequestHandler):
+    """Answers DynamoDB (JSON protocol) and SES (query protocol) calls with empty successes"""
+    latency = 0.0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.latency)
+
+        target = self.headers.get('X-Amz-Target')
+        if target:
+            operation = target.split('.')[-1]
+            payload = b'{"Responses": {}}' if operation == 'BatchGetItem' else b'{}'
+            content_type = 'application/x-amz-json-1.0'
+        else:
+            operation = parse_qs(body.decode()).get('Action', ['Unknown'])[0]
+            result = '<MessageId>stub</MessageId>' if operation == 'SendEmail' else ''
+            if operation == 'GetIdentityVerificationAttributes':
+                result = '<VerificationAttributes/>'
+            payload = (
+                f'<{operation}Response xmlns="http://ses.amazonaws.com/doc/2010-12-01/">'
+                f'<{operation}Result>{result}</{operation}Result>'
+                f'<ResponseMetadata><RequestId>stub</RequestId></ResponseMetadata>'
+                f'</{operation}Response>'
+            ).encode()
+            content_type = 'text/xml'
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server(latency_ms):
+    """Start the stub endpoint on a free local port"""
+    StubAWSHandler.latency = latency_ms / 1000
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubAWSHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def run_once(form_name, endpoint_url):
+    """Time one cold start of form_name in a fresh process"""
+    env = dict(
+        os.environ,
+        AWS_ENDPOINT_URL=endpoint_url,
+        AWS_ACCESS_KEY_ID='stub',
+        AWS_SECRET_ACCESS_KEY='stub',
+        AWS_DEFAULT_REGION='us-east-1',
+        PYTHONPATH=os.pathsep.join([os.path.join(LAMBDA_ROOT, form_name), LAMBDA_ROOT]),
+        PYTHONDONTWRITEBYTECODE='1',
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, json.dumps(SAMPLE_BODIES[form_name])],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark form Lambda cold starts against stubbed AWS endpoints')
+    parser.add_argument('--runs', type=int, default=5, help='Cold starts per form (default: 5)')
+    parser.add_argument('--latency-ms', type=float, default=40, help='Stub round-trip latency in ms (default: 40)')
+    parser.add_argument('--forms', nargs='*', default=sorted(SAMPLE_BODIES), help='Form Lambda directories to benchmark')
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency_ms)
+    endpoint_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    print(f"{args.runs} cold starts per form, {args.latency_ms:.0f} ms stub latency (median ms)")
+    print(f"{'form':<40}{'init':>8}{'first':>8}{'warm':>8}{'cold':>8}  status")
+    for form_name in args.forms:
+        runs = [run_once(form_name, endpoint_url) for _ in range(args.runs)]
+        for run in runs:
+            run['cold'] = run['init'] + run['first']
+        medians = {key: statistics.median(run[key] for run in runs) for key in ('init', 'first', 'warm', 'cold')}
+        print(
+            f"{form_name:<40}{medians['init']:>8.1f}{medians['first']:>8.1f}{medians['warm']:>8.1f}"
+            f"{medians['cold']:>8.1f}  {runs[0]['status']}"
+        )
+
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
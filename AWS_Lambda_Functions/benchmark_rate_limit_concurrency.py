@@ -0,0 +1,118 @@
+# AWS_Lambda_Functions/benchmark_rate_limit_concurrency.py
+"""
+Concurrency check: parallel submissions from one IP against the rate limiter
+
+Fires --threads submissions from the same IP at once, every thread with its
+own RateLimiter (a stand-in for one Lambda container each, so no local
+cache is shared), against an hourly limit of --limit in an in-process
+DynamoDB (moto). Each mode runs --rounds times on a fresh table:
+
+  atomic         - must admit exactly --limit, and the stored hourly and
+                   daily counters must equal what was admitted
+  token_bucket   - must admit exactly --limit
+  read_write     - the old get/put flow, shown for comparison only; it
+                   over-admits whenever two threads read the same count
+
+moto applies each write in several Python steps with no lock, so on its
+own it would let two threads' conditional writes interleave. DynamoDB makes
+every single-item write and every transaction atomic; serialize_moto_writes
+gives moto's backend the same guarantee before the runs.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_rate_limit_concurrency.py --threads 50 --limit 5
+
+Requires boto3 and moto locally. Nothing is sent to AWS.
+"""
+import os
+import sys
+import argparse
+import threading
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+TABLE_NAME = 'benchmark-rate-limits'
+IP_ADDRESS = '203.0.113.7'
+
+def serialize_moto_writes():
+    """Make moto's item reads, writes and transactions atomic, as they are in DynamoDB"""
+    from moto.dynamodb.models import DynamoDBBackend
+    lock = threading.RLock()
+    for name in ('get_item', 'put_item', 'update_item', 'delete_item', 'transact_write_items'):
+        def locked(self, *args, _method=getattr(DynamoDBBackend, name), **kwargs):
+            with lock:
+                return _method(self, *args, **kwargs)
+        setattr(DynamoDBBackend, name, locked)
+
+def create_table(dynamodb):
+    return dynamodb.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{'AttributeName': 'rate_limit_key', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': 'rate_limit_key', 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST'
+    )
+
+def run_round(rate_limiting, mode, algorithm, threads, limit):
+    """Admitted count for one burst of parallel submissions"""
+    limiters = [
+        rate_limiting.RateLimiter(TABLE_NAME, hourly_limit=limit, daily_limit=limit * 10,
+                                  mode=mode, cache_size=0, algorithm=algorithm)
+        for _ in range(threads)
+    ]
+    for limiter in limiters:
+        # Open every table handle before the burst so threads start together
+        assert limiter.table is not None
+    start = threading.Barrier(threads)
+    results = [None] * threads
+
+    def submit(index):
+        start.wait()
+        results[index] = limiters[index].check_rate_limit(IP_ADDRESS)[0]
+
+    pool = [threading.Thread(target=submit, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return sum(results), limiters[0]
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the rate limiter for over-admission under parallel requests')
+    parser.add_argument('--threads', type=int, default=50, help='Parallel submissions per round (default: 50)')
+    parser.add_argument('--limit', type=int, default=5, help='Hourly limit (default: 5)')
+    parser.add_argument('--rounds', type=int, default=5, help='Bursts per mode (default: 5)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+
+    from moto import mock_aws
+    from form_pipeline import rate_limiting
+    serialize_moto_writes()
+
+    # Every thread but one loses each conflict, so give them room to retry
+    rate_limiting.MAX_TRANSACTION_ATTEMPTS = args.threads + 1
+
+    print(f"{args.threads} parallel submissions from one IP, hourly limit {args.limit}, {args.rounds} rounds")
+    for mode, algorithm in (('atomic', 'fixed_window'), ('atomic', 'token_bucket'), ('read_write', 'fixed_window')):
+        label = algorithm if algorithm == 'token_bucket' else mode
+        admitted = []
+        for _ in range(args.rounds):
+            with mock_aws():
+                from form_pipeline.aws_clients import get_dynamodb
+                create_table(get_dynamodb())
+                count, limiter = run_round(rate_limiting, mode, algorithm, args.threads, args.limit)
+                admitted.append(count)
+                if label == 'atomic':
+                    hour_key, day_key = limiter._get_rate_limit_keys(IP_ADDRESS)
+                    stored = limiter._get_submission_counts(hour_key, day_key)
+                    assert stored == (count, count), f"stored counters {stored} after admitting {count}"
+            if label != 'read_write':
+                assert count == args.limit, f"{label} admitted {count} of {args.threads}, limit {args.limit}"
+        print(f"  {label:12} admitted per round: {admitted}")
+
+    print(f"✓ atomic and token_bucket admitted exactly {args.limit} every round")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+# AWS_Lambda_Functions/benchmark_sanitizer.py
+"""
+Micro-benchmark: precompiled sanitisers vs the old re.sub chains
+
+Checks that the UK, job and franchise sanitize_input return exactly what
+the old chains returned on a golden corpus (realistic fields plus random
+strings built from tag, attribute, control and whitespace fragments),
+then times them per field and per form.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_sanitizer.py --fuzz 20000
+"""
+import os
+import re
+import sys
+import random
+import argparse
+import importlib.util
+import timeit
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+# The chains as they were, one uncompiled re.sub after another
+def legacy_uk_sanitize(value):
+    if not isinstance(value, str):
+        return value
+    clean_value = re.sub(r'<[^>]*>', '', value)
+    clean_value = re.sub(r'javascript:', '', clean_value, flags=re.IGNORECASE)
+    clean_value = re.sub(r'on\w+\s*=', '', clean_value, flags=re.IGNORECASE)
+    clean_value = re.sub(r'style\s*=', '', clean_value, flags=re.IGNORECASE)
+    clean_value = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', clean_value)
+    clean_value = re.sub(r'[ \t]+', ' ', clean_value)
+    clean_value = re.sub(r'\n+', '\n', clean_value)
+    return clean_value.strip()
+
+def legacy_job_clean(value):
+    # sanitize_input before its keyword logging and 1,000 character cut
+    clean_value = re.sub(r'<[^>]*>', '', value)
+    clean_value = re.sub(r'javascript:', '', clean_value, flags=re.IGNORECASE)
+    clean_value = re.sub(r'on\w+\s*=', '', clean_value, flags=re.IGNORECASE)
+    return clean_value
+
+def legacy_job_sanitize(value, spam_keywords):
+    if not isinstance(value, str):
+        return value
+    clean_value = legacy_job_clean(value)
+    for keyword in spam_keywords:
+        if keyword.lower() in clean_value.lower():
+            pass
+    if len(clean_value) > 1000:
+        clean_value = clean_value[:1000]
+    return clean_value.strip()
+
+def legacy_franchise_sanitize(input_string):
+    if not input_string:
+        return ""
+    input_string = re.sub(r'<[^>]+>', '', input_string)
+    input_string = re.sub(r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>', '', input_string, flags=re.IGNORECASE)
+    input_string = re.sub(r'javascript:', '', input_string, flags=re.IGNORECASE)
+    input_string = re.sub(r'\s+', ' ', input_string).strip()
+    return input_string
+
+SENTENCES = [
+    "I'd love to know whether you cater for events in Manchester.",
+    "We're a team of 40 and would need the order ready by 12:30 on Friday.",
+    "Could someone call me back on 07700 900123? Afternoons are best.",
+    "The branded sauces sold online - are they available in supermarkets yet?",
+    "Two of my staff are coeliac, so allergen information would be helpful.",
+    "Thanks again, the Nashville hot tenders at the opening were outstanding!",
+]
+
+GOLDEN_VALUES = [
+    '', ' ', 'Jordan', '  Jordan  Smith ', 'jordan@example.com', '+44 20 7946 0958',
+    'Line one\nLine two\n\n\nLine three', 'tabs\tand  spaces \t here', '\r\nwindows\r\n\r\nlines\r\n',
+    '<b>Hello</b> there', '<script>alert(1)</script>Hi', 'java<b>script:</b>alert(1)',
+    '<a href="x" onclick = "go()">link</a>', 'onmouseover=steal() text', 'ONLOAD =x', 'on=not-a-handler',
+    'style = "color:red"', 'STYLE=bad', 'JavaScript:void(0)', 'javajavascript:script:x',
+    'stjavascript:yle=x', 'onjavascript:x=1', 'I <3 fried chicken > burgers', '<>empty<>tags',
+    '<<nested>>tags>', '<scr<x>ipt>alert(1)</script>', 'null\x00byte', 'bell\x07 and \x7f del',
+    'vertical\x0btab\x0cfeed', 'keep\ttab', 'unicode nbsp em　wide', 'café — naïve',
+    'line sep', '\x1cfile\x1dgroup\x1erecord\x1funit', 'bitcoin crypto casino',
+]
+
+FRAGMENTS = [
+    '<', '>', '</', '<b>', '</b>', '<script>', '</script>', '<img src=x onerror=alert(1)>', 'java', 'script',
+    ':', 'javascript:', 'JAVASCRIPT:', 'on', 'click', 'ON', 'load', '=', ' =', 'style', 'STYLE', 'st', 'yle',
+    ' ', '  ', '\t', '\n', '\n\n', '\r', '\r\n', '\x00', '\x07', '\x0b', '\x0c', '\x1c', '\x1f', '\x7f',
+    ' ', ' ', ' ', 'a', 'Z', '9', '_', 'café', 'hello', 'x',
+]
+
+def fuzz_values(rng, count):
+    """Random strings built from the fragments the chains react to"""
+    return [''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 24))) for _ in range(count)]
+
+def build_message(rng, length=2000):
+    parts = []
+    while sum(len(part) + 1 for part in parts) < length:
+        parts.append(rng.choice(SENTENCES))
+        if rng.random() < 0.1:
+            parts.append('\n\n')
+    return ' '.join(parts)[:length]
+
+def load_module(name, path):
+    """Import a form's validation.py under a unique module name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the precompiled sanitisers')
+    parser.add_argument('--fuzz', type=int, default=20000, help='Random strings checked for identical output (default: 20000)')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    uk = load_module('uk_validation', os.path.join(LAMBDA_ROOT, 'nashsmash-submit-contact-form-uk', 'validation.py'))
+    career = load_module('career_validation', os.path.join(LAMBDA_ROOT, 'nashsmash-submit-job-application-form', 'validation.py'))
+    franchise = load_module('franchise_validation', os.path.join(LAMBDA_ROOT, 'nashsmash-submit-franchise-form', 'validation.py'))
+
+    # Byte-identical output on the golden corpus
+    corpus = GOLDEN_VALUES + [build_message(rng) for _ in range(20)] + fuzz_values(rng, args.fuzz)
+    for value in corpus:
+        assert uk.sanitize_input(value) == legacy_uk_sanitize(value), repr(value)
+        assert career.SANITIZER.clean(value) == legacy_job_clean(value), repr(value)
+        assert franchise.sanitize_input(value) == legacy_franchise_sanitize(value), repr(value)
+    print(f"Identical output on {len(corpus)} golden values")
+
+    message = build_message(rng)
+    fields = [
+        ('short name', 'Jordan'),
+        ('email', 'jordan.smith@example.co.uk'),
+        ('2,000 char message', message),
+        ('message with markup', message[:1000] + '<b onclick="x()">hi</b>' + message[1000:]),
+    ]
+    print("\nPer field (us per call, old -> new)")
+    for label, value in fields:
+        for form, old_func, new_func in (
+            ('uk', legacy_uk_sanitize, uk.sanitize_input),
+            ('franchise', legacy_franchise_sanitize, franchise.sanitize_input),
+        ):
+            old = per_call_us(lambda: old_func(value), 2000)
+            new = per_call_us(lambda: new_func(value), 2000)
+            print(f"{form + ' ' + label:<36}{old:>9.2f} -> {new:>7.2f}  ({old / new:.1f}x)")
+
+    submission = {
+        'firstName': 'Jordan', 'lastName': 'Smith', 'email': 'jordan.smith@example.co.uk',
+        'phone': '+44 20 7946 0958', 'inquiryType': 'catering', 'message': message,
+        'notificationEmails': ['info@example.com', 'events@example.com'], 'website': '',
+    }
+    print("\nPer form submission (us per call, old -> new)")
+    old = per_call_us(lambda: {k: legacy_uk_sanitize(v) if isinstance(v, str) else [legacy_uk_sanitize(i) for i in v] for k, v in submission.items()}, 1000)
+    new = per_call_us(lambda: uk.sanitize_uk_form_data(submission), 1000)
+    print(f"{'uk sanitize_uk_form_data':<36}{old:>9.2f} -> {new:>7.2f}  ({old / new:.1f}x)")
+    old = per_call_us(lambda: {k: legacy_job_sanitize(v, career.SPAM_KEYWORDS) if isinstance(v, str) else v for k, v in submission.items()}, 1000)
+    new = per_call_us(lambda: career.sanitize_form_data(submission), 1000)
+    print(f"{'job sanitize_form_data':<36}{old:>9.2f} -> {new:>7.2f}  ({old / new:.1f}x)")
+    old = per_call_us(lambda: {k: legacy_franchise_sanitize(v) if isinstance(v, str) else v for k, v in submission.items()}, 1000)
+    new = per_call_us(lambda: franchise.sanitize_form_data(submission), 1000)
+    print(f"{'franchise sanitize_form_data':<36}{old:>9.2f} -> {new:>7.2f}  ({old / new:.1f}x)")
+
+if __name__ == '__main__':
+    main()
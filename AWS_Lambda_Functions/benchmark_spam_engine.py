@@ -0,0 +1,147 @@
+# AWS_Lambda_Functions/benchmark_spam_engine.py
+"""
+Micro-benchmark: precompiled spam engine vs the old per-keyword loops
+
+Times the franchise detector and the job form's sanitize_input keyword
+check on realistic ~2,000 character messages, old vs new, and checks both
+return the same indicators. Also shows where KeywordMatcher switches from
+substring scans to a single regex pass as keyword lists grow.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_spam_engine.py --messages 200
+"""
+import os
+import re
+import sys
+import random
+import string
+import argparse
+import importlib.util
+import timeit
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+from form_pipeline.spam import KeywordMatcher
+
+SENTENCES = [
+    "I have managed quick service restaurants in Northern Virginia for over twelve years.",
+    "My team ran two locations with forty staff, handling payroll, scheduling and inventory.",
+    "We grew same-store sales by eighteen percent after reworking the drive-thru process.",
+    "I am looking to open three units in the Richmond area over the next five years.",
+    "Our family has owned a pizza franchise since 2009 and we understand brand standards.",
+    "Food safety and consistent training are the parts of operations I care about most.",
+    "I can put together a strong local marketing plan with schools and sports leagues.",
+    "Please call me any weekday afternoon to discuss the opportunity further.",
+]
+SPAM_SENTENCES = [
+    "URGENT: make money fast with this bitcoin investment opportunity, click here!",
+    "Work from home and earn $5000 a week, guaranteed income, no experience required.",
+    "Congratulations you have won the lottery, send a bank transfer via western union.",
+]
+
+def build_message(rng, length=2000, spam=False):
+    """Build a realistic message of about `length` characters"""
+    parts = []
+    while sum(len(part) + 1 for part in parts) < length:
+        pool = SPAM_SENTENCES if spam and rng.random() < 0.15 else SENTENCES
+        parts.append(rng.choice(pool))
+    return ' '.join(parts)[:length]
+
+def load_module(name, path):
+    """Import a form's validation.py under a unique module name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# The franchise detector as it was: every keyword checked per field, patterns looked up per call
+def legacy_franchise_detect(form_data, spam_keywords, suspicious_domains):
+    spam_indicators = []
+    email = form_data.get('email', '').lower()
+    if email:
+        domain = email.split('@')[-1] if '@' in email else ''
+        if domain in suspicious_domains:
+            spam_indicators.append(f"Suspicious email domain: {domain}")
+    text_fields = ['businessExperience', 'firstName', 'lastName', 'homeAddress']
+    for field in text_fields:
+        content = str(form_data.get(field, '')).lower()
+        for keyword in spam_keywords:
+            if keyword in content:
+                spam_indicators.append(f"Spam keyword '{keyword}' found in {field}")
+    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+    business_exp = str(form_data.get('businessExperience', ''))
+    urls_found = re.findall(url_pattern, business_exp)
+    if len(urls_found) > 2:
+        spam_indicators.append(f"Excessive URLs found: {len(urls_found)} URLs")
+    for field in text_fields:
+        content = str(form_data.get(field, ''))
+        if re.search(r'(.)\1{10,}', content):
+            spam_indicators.append(f"Repetitive characters found in {field}")
+    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    if re.search(phone_pattern, business_exp):
+        spam_indicators.append("Phone number found in business experience")
+    for field in text_fields:
+        content = str(form_data.get(field, ''))
+        if len(content) > 20 and sum(1 for c in content if c.isupper()) / len(content) > 0.5:
+            spam_indicators.append(f"Excessive capitalization in {field}")
+    return spam_indicators
+
+# The job form's sanitize_input keyword check as it was: both sides lowercased per keyword
+def legacy_keyword_log(value, spam_keywords):
+    return [keyword for keyword in spam_keywords if keyword.lower() in value.lower()]
+
+def per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the precompiled spam engine')
+    parser.add_argument('--messages', type=int, default=200, help='Messages per run (default: 200)')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    franchise = load_module('franchise_validation', os.path.join(LAMBDA_ROOT, 'nashsmash-submit-franchise-form', 'validation.py'))
+    career = load_module('career_validation', os.path.join(LAMBDA_ROOT, 'nashsmash-submit-job-application-form', 'validation.py'))
+
+    submissions = [
+        {
+            'firstName': 'Jordan', 'lastName': 'Smith', 'homeAddress': '12 Main St, Arlington, VA',
+            'email': rng.choice(['jordan@example.com', 'x@mailinator.com']),
+            'businessExperience': build_message(rng, spam=index % 4 == 0)
+        }
+        for index in range(args.messages)
+    ]
+
+    # Same answers first
+    for submission in submissions:
+        expected = legacy_franchise_detect(submission, franchise.SPAM_KEYWORDS, franchise.SUSPICIOUS_DOMAINS)
+        assert franchise.detect_spam_content(submission) == expected, submission
+        value = submission['businessExperience']
+        assert career.SPAM_ENGINE.find_keywords(value) == legacy_keyword_log(value, career.SPAM_KEYWORDS)
+
+    print(f"{args.messages} submissions, ~2,000 character messages (us per submission)")
+    old = per_call_us(lambda: [legacy_franchise_detect(s, franchise.SPAM_KEYWORDS, franchise.SUSPICIOUS_DOMAINS) for s in submissions], 5) / args.messages
+    new = per_call_us(lambda: [franchise.scan_spam_content(s) for s in submissions], 5) / args.messages
+    print(f"{'franchise detect_spam_content':<40}{old:>9.1f} -> {new:>7.1f}  ({old / new:.1f}x)")
+
+    values = [s['businessExperience'] for s in submissions]
+    old = per_call_us(lambda: [legacy_keyword_log(v, career.SPAM_KEYWORDS) for v in values], 5) / args.messages
+    new = per_call_us(lambda: [career.SPAM_ENGINE.find_keywords(v) for v in values], 5) / args.messages
+    print(f"{'career sanitize_input keyword check':<40}{old:>9.1f} -> {new:>7.1f}  ({old / new:.1f}x)")
+
+    print("\nKeywordMatcher on one lowercased message: substring scans vs regex pass (us)")
+    text = values[0].lower()
+    for count in (30, 100, 150, 300, 600):
+        keywords = list(franchise.SPAM_KEYWORDS) + [
+            ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12)))
+            for _ in range(max(0, count - len(franchise.SPAM_KEYWORDS)))
+        ]
+        scans = KeywordMatcher(keywords, regex_threshold=len(keywords))
+        regex = KeywordMatcher(keywords, regex_threshold=0)
+        assert scans.find(text, lowered=True) == regex.find(text, lowered=True)
+        print(f"{count:>5} keywords{per_call_us(lambda: scans.find(text, lowered=True), 200):>10.1f}"
+              f"{per_call_us(lambda: regex.find(text, lowered=True), 200):>10.1f}")
+
+if __name__ == '__main__':
+    main()
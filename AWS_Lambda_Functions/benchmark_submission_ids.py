@@ -0,0 +1,119 @@
+# AWS_Lambda_Functions/benchmark_submission_ids.py
+"""
+Concurrency check: submission IDs from several containers at once
+
+Starts --containers processes (each a stand-in for one Lambda container
+with its own IdGenerator), each running --threads threads, and makes IDs
+at --rate per second in total for --seconds, the old way
+(PREFIX_<milliseconds>) and with form_pipeline/ids.py. Checks the new IDs:
+
+  unique      - no ID made twice, across every container and thread
+  monotonic   - each thread's IDs strictly increasing, as strings
+  timestamps  - id_timestamp() of every ID within the run's time window
+
+then times the generator flat out on one thread.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_submission_ids.py --rate 10000 --seconds 5
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+import multiprocessing
+from collections import Counter
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+PREFIX = 'CAREER'
+
+def old_id(prefix):
+    timestamp = int(time.time() * 1000)
+    return f"{prefix}_{timestamp}", timestamp
+
+def container(scheme, threads, per_thread_rate, seconds, results):
+    """One container: threads making IDs at a steady rate; puts each thread's IDs on results"""
+    from form_pipeline.ids import IdGenerator
+    make_id = IdGenerator().new_id if scheme == 'ulid' else old_id
+    per_thread = int(per_thread_rate * seconds)
+    interval = 1 / per_thread_rate
+    start = threading.Barrier(threads)
+    made = [None] * threads
+
+    def worker(index):
+        ids = []
+        start.wait()
+        began = time.perf_counter()
+        for n in range(per_thread):
+            # Keep to the schedule in bursts of 10 rather than sleeping per ID
+            if n % 10 == 0:
+                delay = began + n * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            ids.append(make_id(PREFIX)[0])
+        made[index] = ids
+
+    pool = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put(made)
+
+def run(scheme, containers, threads, rate, seconds):
+    """Every thread's list of IDs, the elapsed seconds and the run's time window in ms"""
+    results = multiprocessing.Queue()
+    per_thread_rate = rate / (containers * threads)
+    window_start = int(time.time() * 1000)
+    started = time.perf_counter()
+    processes = [
+        multiprocessing.Process(target=container, args=(scheme, threads, per_thread_rate, seconds, results))
+        for _ in range(containers)
+    ]
+    for process in processes:
+        process.start()
+    lists = [ids for _ in processes for ids in results.get()]
+    for process in processes:
+        process.join()
+    return lists, time.perf_counter() - started, (window_start, int(time.time() * 1000))
+
+def main():
+    parser = argparse.ArgumentParser(description='Check submission IDs for collisions under concurrency')
+    parser.add_argument('--containers', type=int, default=4, help='Processes standing in for Lambda containers (default: 4)')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per container (default: 4)')
+    parser.add_argument('--rate', type=int, default=10000, help='IDs per second across all containers (default: 10000)')
+    parser.add_argument('--seconds', type=float, default=5, help='Length of each run (default: 5)')
+    args = parser.parse_args()
+
+    from form_pipeline.ids import IdGenerator, id_timestamp
+
+    print(f"{args.containers} containers x {args.threads} threads, {args.rate} IDs/s for {args.seconds:g}s")
+    for scheme in ('old', 'ulid'):
+        lists, elapsed, (window_start, window_end) = run(scheme, args.containers, args.threads, args.rate, args.seconds)
+        all_ids = [form_id for ids in lists for form_id in ids]
+        counts = Counter(all_ids)
+        lost = len(all_ids) - len(counts)
+        print(f"  {scheme:5} {len(all_ids)} IDs at {len(all_ids) / elapsed:,.0f}/s: "
+              f"{lost} overwritten by a duplicate ID, {len(counts)} distinct partition keys")
+        if scheme != 'ulid':
+            continue
+
+        assert lost == 0, f"{lost} duplicate IDs"
+        for ids in lists:
+            assert all(a < b for a, b in zip(ids, ids[1:])), "a thread's IDs went backwards"
+        assert all(window_start <= id_timestamp(form_id) <= window_end + 1 for form_id in all_ids), \
+            "an ID's timestamp is outside the run"
+
+    generator = IdGenerator()
+    count = 200000
+    started = time.perf_counter()
+    for _ in range(count):
+        generator.new_id(PREFIX)
+    elapsed = time.perf_counter() - started
+    print(f"Flat out, one thread: {count / elapsed:,.0f} IDs/s ({elapsed / count * 1e6:.2f} µs each)")
+    print("✓ No collisions; every thread's IDs in order")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+# AWS_Lambda_Functions/benchmark_submission_query.py
+"""
+Admin submission queries against an in-process DynamoDB (moto)
+
+Fills a career table, adds the query indexes with create_submission_indexes,
+then compares an inbox view (the 25 newest 'new' submissions) read with a
+full Scan against query_submissions on the status index: items read and
+time per view. It also pages through every view with cursors (status,
+email, date range, filters, projection, oldest first) and checks each
+returns exactly the matching submissions once, in timestamp order.
+
+moto keeps the table in memory, so times only show the trend; the number
+of items read is what DynamoDB bills and what grows with the table.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_submission_query.py --items 20000
+
+Requires boto3 and moto locally. Nothing is sent to AWS.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+STATUSES = ['new'] * 1 + ['read'] * 6 + ['archived'] * 3
+POSITIONS = ['Manager', 'Cook', 'Cashier', 'Shift Lead']
+START_MS = 1767225600000  # 2026-01-01
+
+def fill_table(dynamodb, table_name, count, senders):
+    table = dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{'AttributeName': 'formID', 'KeyType': 'HASH'}, {'AttributeName': 'timestamp', 'KeyType': 'RANGE'}],
+        AttributeDefinitions=[{'AttributeName': 'formID', 'AttributeType': 'S'},
+                              {'AttributeName': 'timestamp', 'AttributeType': 'N'}],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    rng = random.Random(7)
+    items = []
+    with table.batch_writer() as batch:
+        for i in range(count):
+            timestamp = START_MS + i * 60000
+            item = {
+                'formID': f'CAREER_{timestamp}',
+                'timestamp': timestamp,
+                'formType': 'career',
+                'status': rng.choice(STATUSES),
+                'email': f'applicant{rng.randrange(senders)}@example.com',
+                'name': f'Applicant {i}',
+                'position': rng.choice(POSITIONS),
+                'message': 'I would love to join the team. ' * 20
+            }
+            batch.put_item(Item=item)
+            items.append(item)
+    return items
+
+def page_all(query_submissions, form_type, **kwargs):
+    """Every item of a query, following cursors; returns items and pages"""
+    items, pages, cursor = [], 0, None
+    while True:
+        page = query_submissions(form_type, cursor=cursor, **kwargs)
+        items.extend(page['items'])
+        pages += 1
+        cursor = page['cursor']
+        if not cursor:
+            return items, pages
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark GSI queries against scans for submissions')
+    parser.add_argument('--items', type=int, default=20000, help='Submissions in the table (default: 20000)')
+    parser.add_argument('--senders', type=int, default=2000, help='Distinct applicant emails (default: 2000)')
+    parser.add_argument('--runs', type=int, default=5, help='Timed inbox views per method (default: 5)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+
+    from moto import mock_aws
+    with mock_aws():
+        from form_pipeline.aws_clients import get_dynamodb, get_table
+        from form_pipeline.submission_query import SUBMISSION_TABLES, query_submissions
+        from create_submission_indexes import create_indexes
+
+        table_name = SUBMISSION_TABLES['career']
+        started = time.perf_counter()
+        items = fill_table(get_dynamodb(), table_name, args.items, args.senders)
+        create_indexes(table_name, poll_seconds=0)
+        print(f"Filled {args.items} submissions and built the indexes in {time.perf_counter() - started:.1f}s")
+
+        read = {'items': 0}
+        client = get_dynamodb().meta.client
+        for operation in ('Scan', 'Query'):
+            client.meta.events.register(f'after-call.dynamodb.{operation}',
+                                        lambda parsed, **kwargs: read.update(items=read['items'] + parsed.get('ScannedCount', 0)))
+
+        def scan_inbox():
+            # What listing by status took before: read the whole table, filter, sort
+            table = get_table(table_name)
+            found, kwargs = [], {'FilterExpression': '#s = :s', 'ExpressionAttributeNames': {'#s': 'status'},
+                                 'ExpressionAttributeValues': {':s': 'new'}}
+            while True:
+                response = table.scan(**kwargs)
+                found.extend(response['Items'])
+                if 'LastEvaluatedKey' not in response:
+                    break
+                kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            return sorted(found, key=lambda item: item['timestamp'], reverse=True)[:25]
+
+        def query_inbox():
+            return query_submissions('career', status='new', limit=25)['items']
+
+        expected_inbox = [item['formID'] for item in sorted(items, key=lambda item: -item['timestamp'])
+                          if item['status'] == 'new'][:25]
+        for label, view in (('scan', scan_inbox), ('query', query_inbox)):
+            read['items'] = 0
+            started = time.perf_counter()
+            for _ in range(args.runs):
+                result = view()
+            elapsed = (time.perf_counter() - started) / args.runs
+            assert [item['formID'] for item in result] == expected_inbox, label
+            print(f"  inbox via {label:5}: {read['items'] // args.runs:6} items read, {elapsed * 1000:8.1f} ms per view")
+
+        def check(label, predicate, reverse=True, **kwargs):
+            got, pages = page_all(query_submissions, 'career', **kwargs)
+            want = [item for item in items if predicate(item)]
+            want.sort(key=lambda item: item['timestamp'], reverse=reverse)
+            assert [item['formID'] for item in got] == [item['formID'] for item in want], label
+            print(f"  {label:32} {len(got):6} items in {pages} page(s)")
+            return got
+
+        print("Cursor pagination:")
+        check("status=new", lambda item: item['status'] == 'new', status='new', limit=100)
+        check("all, oldest first", lambda item: True, reverse=False, oldest_first=True, limit=100)
+        window = (START_MS + 1000 * 60000, START_MS + 3000 * 60000)
+        check("date range", lambda item: window[0] <= item['timestamp'] <= window[1],
+              since=window[0], until=window[1], limit=100)
+        sender = items[0]['email']
+        check("one email", lambda item: item['email'] == sender, email=sender, limit=3)
+        check("email + status", lambda item: item['email'] == sender and item['status'] == 'read',
+              email=sender, status='read', limit=2)
+        check("status=new, position=Manager",
+              lambda item: item['status'] == 'new' and item['position'] == 'Manager',
+              status='new', filters={'position': 'Manager'}, limit=10)
+        projected = check("projection", lambda item: item['status'] == 'archived',
+                          status='archived', attributes=['formID', 'timestamp', 'name'], limit=100)
+        assert all(set(item) == {'formID', 'timestamp', 'name'} for item in projected)
+
+    print("✓ Every query returned exactly its submissions, in order")
+
+if __name__ == '__main__':
+    main()
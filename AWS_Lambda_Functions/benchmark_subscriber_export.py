@@ -0,0 +1,120 @@
+# AWS_Lambda_Functions/benchmark_subscriber_export.py
+"""
+Subscriber export against an in-process DynamoDB (moto)
+
+Fills a subscriber table, then checks that:
+
+  scan        - the old get_all_subscribers (one table.scan()) stops at the first 1 MB page
+  export      - the segmented export writes every subscriber exactly once, as NDJSON and CSV
+
+and times the export per segment count (with --trace-memory, its peak
+traced memory too). moto serves requests in-process, so extra segments only help against real
+DynamoDB, where each segment's requests overlap on the network.
+
+Usage:
+    python AWS_Lambda_Functions/benchmark_subscriber_export.py --items 100000
+
+At 100,000 items each export takes about 4.5 minutes under moto (30 minutes
+for the whole run); --items 20000 is a quick check.
+
+Requires boto3 and moto locally. Nothing is sent to AWS.
+"""
+import os
+import io
+import sys
+import csv
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+LAMBDA_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, LAMBDA_ROOT)
+
+TABLE_NAME = 'benchmark-subscribers'
+
+def fill_table(dynamodb, count):
+    table = dynamodb.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{'AttributeName': 'email', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': 'email', 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    with table.batch_writer() as batch:
+        for i in range(count):
+            timestamp = str(1700000000000 + i)
+            batch.put_item(Item={
+                'email': f'subscriber{i}@example.com',
+                'formID': f'SUBSCR_{timestamp}',
+                'firstName': f'First{i}',
+                'lastName': f'Last{i}',
+                'metadata': {'ipAddress': '203.0.113.7', 'userAgent': 'Mozilla/5.0 (benchmark)'},
+                'formType': 'subscriber',
+                'status': 'active',
+                'createdAt': timestamp,
+                'updatedAt': timestamp,
+                'subscriptionCount': 1 + i % 3
+            })
+    return table
+
+def timed_export(output_format, segments, attributes, trace_memory=False):
+    """Export to a temporary file; returns the count, seconds, peak traced bytes (or None) and the file's text"""
+    from form_pipeline.table_export import export_table
+    with tempfile.TemporaryFile('w+', encoding='utf-8', newline='') as out:
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        count = export_table(TABLE_NAME, out, output_format, attributes, segments)
+        elapsed = time.perf_counter() - started
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        out.seek(0)
+        return count, elapsed, peak, out.read()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the segmented subscriber export')
+    parser.add_argument('--items', type=int, default=100000, help='Subscribers in the table (default: 100000)')
+    parser.add_argument('--segments', type=int, nargs='+', default=[1, 4, 8],
+                        help='Segment counts to check and time (default: 1 4 8)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Report peak traced memory (includes moto's own, and is roughly 10x slower)")
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+
+    from moto import mock_aws
+    with mock_aws():
+        from form_pipeline.aws_clients import get_dynamodb
+        from export_subscribers import DEFAULT_ATTRIBUTES
+
+        started = time.perf_counter()
+        table = fill_table(get_dynamodb(), args.items)
+        print(f"Filled {args.items} subscribers in {time.perf_counter() - started:.1f}s")
+
+        first_page = len(table.scan()['Items'])
+        print(f"Old single table.scan(): {first_page} of {args.items} subscribers")
+        # One page is 1 MB; a few thousand of these subscribers fill it
+        assert args.items < 10000 or first_page < args.items, "a single scan returned every subscriber"
+
+        expected = {f'subscriber{i}@example.com' for i in range(args.items)}
+        for output_format in ('ndjson', 'csv'):
+            for segments in args.segments:
+                count, elapsed, peak, text = timed_export(output_format, segments, DEFAULT_ATTRIBUTES, args.trace_memory)
+                if output_format == 'ndjson':
+                    emails = [json.loads(line)['email'] for line in text.splitlines()]
+                else:
+                    emails = [row['email'] for row in csv.DictReader(io.StringIO(text))]
+                assert count == len(emails) == len(set(emails)) and set(emails) == expected, \
+                    f"{output_format} with {segments} segments exported {count} rows, {len(set(emails))} unique"
+                memory = f", peak {peak / 1024 / 1024:.1f} MB" if peak is not None else ""
+                print(f"  {output_format:6} {segments:2} segment(s): {count} rows in {elapsed:.2f}s{memory}")
+
+    print("✓ Every subscriber exported exactly once")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# AWS_Lambda_Functions/broadcast_newsletter.py
+"""
+Send a newsletter to every active subscriber
+
+Sends an SES template (create it first with `aws ses create-template`)
+through form_pipeline/broadcast.py: 50 recipients per SendBulkTemplatedEmail
+call, paced to the account's SES send rate. The checkpoint and each
+recipient's outcome are kept in --state-dir, so running the same command
+again after an interruption carries on without sending anyone a second copy.
+
+Usage:
+    python AWS_Lambda_Functions/broadcast_newsletter.py --broadcast-id 2026-10-news --template monthly-newsletter
+    python AWS_Lambda_Functions/broadcast_newsletter.py --broadcast-id 2026-10-news --template monthly-newsletter \\
+        --default-data '{"firstName": "friend"}' --configuration-set newsletter
+
+Uses the usual AWS credentials and region (AWS_PROFILE, AWS_REGION, ...).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+
+from form_pipeline.broadcast import run_broadcast, FileBroadcastStore, SendRatePacer, BROADCAST_RATE_FRACTION, COMPLETE
+
+SUBSCRIBER_TABLE = os.environ.get('SUBSCRIBER_TABLE', 'nash-and-smashed-subscriber-form-table')
+SENDER_EMAIL = os.environ.get('SENDER_EMAIL', 'noreply@nashandsmashed.com')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send a newsletter to the subscriber table")
+    parser.add_argument('--broadcast-id', required=True,
+                        help="Name of this broadcast; reuse it to resume")
+    parser.add_argument('--template', required=True, help="SES template name")
+    parser.add_argument('--sender', default=SENDER_EMAIL, help="Verified sender (default: %(default)s)")
+    parser.add_argument('--table', default=SUBSCRIBER_TABLE,
+                        help=f"Subscriber table (default: {SUBSCRIBER_TABLE})")
+    parser.add_argument('--default-data', type=json.loads, default={},
+                        help="Template data (JSON) for fields a subscriber has no value for")
+    parser.add_argument('--configuration-set', help="SES configuration set")
+    parser.add_argument('--rate-fraction', type=float, default=BROADCAST_RATE_FRACTION,
+                        help="Share of the SES send rate to use (default: %(default)s)")
+    parser.add_argument('--state-dir', default='broadcasts',
+                        help="Directory for checkpoints and outcomes (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format='%(message)s')
+
+    store = FileBroadcastStore(args.state_dir, args.broadcast_id)
+    started = time.perf_counter()
+    result = run_broadcast(
+        args.broadcast_id,
+        args.template,
+        args.sender,
+        store,
+        args.table,
+        pacer=SendRatePacer.from_ses(args.rate_fraction),
+        default_data=args.default_data,
+        configuration_set=args.configuration_set
+    )
+    print(f"{'✓' if result['status'] == COMPLETE else '…'} Broadcast {result['status']}: "
+          f"{result['sent']} sent, {result['failed']} failed in {time.perf_counter() - started:.1f}s "
+          f"(outcomes in {store.outcomes_path})", file=sys.stderr)
+    return 0 if result['status'] == COMPLETE else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
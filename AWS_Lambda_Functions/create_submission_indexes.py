@@ -0,0 +1,80 @@
+# AWS_Lambda_Functions/create_submission_indexes.py
+"""
+Add the admin query indexes to the form submission tables
+
+Creates the global secondary indexes of form_pipeline/submission_query.py
+(formType, status and email, each sorted by timestamp) on every table, or
+the ones named. DynamoDB builds one index per UpdateTable call and
+backfills existing submissions, so the script waits for each index to be
+ACTIVE before asking for the next. Indexes that already exist are skipped.
+
+Usage:
+    python AWS_Lambda_Functions/create_submission_indexes.py --dry-run
+    python AWS_Lambda_Functions/create_submission_indexes.py --forms contact career
+
+Uses the usual AWS credentials and region (AWS_PROFILE, AWS_REGION, ...).
+"""
+import sys
+import time
+import argparse
+
+from form_pipeline.aws_clients import get_dynamodb
+from form_pipeline.submission_query import SUBMISSION_TABLES, SORT_KEY, index_definitions
+
+ATTRIBUTE_TYPES = {'formType': 'S', 'status': 'S', 'email': 'S', SORT_KEY: 'N'}
+
+def wait_until_active(client, table_name, index_name, poll_seconds):
+    while True:
+        table = client.describe_table(TableName=table_name)['Table']
+        indexes = {index['IndexName']: index for index in table.get('GlobalSecondaryIndexes', [])}
+        if table['TableStatus'] == 'ACTIVE' and indexes.get(index_name, {}).get('IndexStatus') == 'ACTIVE':
+            return
+        time.sleep(poll_seconds)
+
+def create_indexes(table_name, dry_run=False, poll_seconds=15):
+    client = get_dynamodb().meta.client
+    table = client.describe_table(TableName=table_name)['Table']
+    existing = {index['IndexName'] for index in table.get('GlobalSecondaryIndexes', [])}
+    provisioned = table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED') == 'PROVISIONED'
+
+    for update in index_definitions():
+        index = update['Create']
+        if index['IndexName'] in existing:
+            print(f"  {index['IndexName']}: exists")
+            continue
+        if provisioned:
+            # Start the index with the table's own capacity
+            throughput = table['ProvisionedThroughput']
+            index['ProvisionedThroughput'] = {
+                'ReadCapacityUnits': throughput['ReadCapacityUnits'],
+                'WriteCapacityUnits': throughput['WriteCapacityUnits'],
+            }
+        if dry_run:
+            print(f"  {index['IndexName']}: would create")
+            continue
+        client.update_table(
+            TableName=table_name,
+            AttributeDefinitions=[
+                {'AttributeName': key['AttributeName'], 'AttributeType': ATTRIBUTE_TYPES[key['AttributeName']]}
+                for key in index['KeySchema']
+            ],
+            GlobalSecondaryIndexUpdates=[update]
+        )
+        print(f"  {index['IndexName']}: creating...", flush=True)
+        wait_until_active(client, table_name, index['IndexName'], poll_seconds)
+        print(f"  {index['IndexName']}: active")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create the submission query indexes")
+    parser.add_argument('--forms', nargs='+', choices=sorted(SUBMISSION_TABLES), default=sorted(SUBMISSION_TABLES),
+                        help="Forms whose tables to update (default: all)")
+    parser.add_argument('--dry-run', action='store_true', help="Only report what would be created")
+    args = parser.parse_args(argv)
+
+    for form_type in args.forms:
+        print(f"{form_type} ({SUBMISSION_TABLES[form_type]})")
+        create_indexes(SUBMISSION_TABLES[form_type], args.dry_run)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
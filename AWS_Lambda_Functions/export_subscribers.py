@@ -0,0 +1,64 @@
+# AWS_Lambda_Functions/export_subscribers.py
+"""
+Export the newsletter subscriber table to NDJSON or CSV
+
+Runs a parallel segmented scan (form_pipeline/table_export.py) and writes
+rows as they arrive, so memory stays flat for any list size.
+
+Usage:
+    python AWS_Lambda_Functions/export_subscribers.py --output subscribers.csv
+    python AWS_Lambda_Functions/export_subscribers.py --format ndjson --output - --segments 16
+    python AWS_Lambda_Functions/export_subscribers.py --attributes email firstName status
+
+Uses the usual AWS credentials and region (AWS_PROFILE, AWS_REGION, ...).
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+
+from form_pipeline.table_export import export_table, EXPORT_FORMATS, EXPORT_SEGMENTS
+
+SUBSCRIBER_TABLE = os.environ.get('SUBSCRIBER_TABLE', 'nash-and-smashed-subscriber-form-table')
+
+# What marketing needs; metadata (IP, user agent) is left out unless asked for
+DEFAULT_ATTRIBUTES = [
+    'email', 'firstName', 'lastName', 'status', 'createdAt', 'updatedAt', 'subscriptionCount', 'formID'
+]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export newsletter subscribers from DynamoDB")
+    parser.add_argument('--table', default=SUBSCRIBER_TABLE,
+                        help=f"Subscriber table (default: {SUBSCRIBER_TABLE})")
+    parser.add_argument('--format', choices=EXPORT_FORMATS,
+                        help="Output format (default: from the output file extension, else csv)")
+    parser.add_argument('--output', '-o', default='-', help="Output file, or - for stdout (default)")
+    parser.add_argument('--attributes', nargs='+', default=DEFAULT_ATTRIBUTES,
+                        help="Attributes to export (default: %(default)s)")
+    parser.add_argument('--all-attributes', action='store_true',
+                        help="Export every attribute (NDJSON only)")
+    parser.add_argument('--segments', type=int, default=EXPORT_SEGMENTS,
+                        help="Parallel scan segments (default: %(default)s)")
+    parser.add_argument('--page-size', type=int, help="Items per Scan request")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format='%(message)s')
+
+    output_format = args.format or ('ndjson' if args.output.endswith(('.ndjson', '.jsonl')) else 'csv')
+    attributes = None if args.all_attributes else args.attributes
+    if output_format == 'csv' and attributes is None:
+        parser.error("--all-attributes needs --format ndjson")
+
+    started = time.perf_counter()
+    if args.output == '-':
+        count = export_table(args.table, sys.stdout, output_format, attributes, args.segments, args.page_size)
+    else:
+        # newline='' lets the csv module write its own line endings
+        with open(args.output, 'w', encoding='utf-8', newline='') as out:
+            count = export_table(args.table, out, output_format, attributes, args.segments, args.page_size)
+    print(f"✓ Exported {count} subscribers in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
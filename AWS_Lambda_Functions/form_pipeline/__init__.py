@@ -0,0 +1,35 @@
+# AWS_Lambda_Functions/form_pipeline/__init__.py
+"""
+Shared request pipeline for the Nash & Smashed form Lambdas
+
+Each form Lambda declares a FormSchema and hands its events to a FormPipeline.
+See README.form_pipeline.md for packaging and the stage contract.
+"""
+from .pipeline import (
+    FormSchema,
+    FormPipeline,
+    SubmissionContext,
+    DEFAULT_STAGES,
+    rate_limit,
+    parse_body,
+    validate,
+    detect_spam,
+    persist,
+    notify,
+)
+from .storage import from_field, first_field, full_name, save_submission
+from .ids import IdGenerator, new_submission_id, id_timestamp, id_bounds
+from .email_services import send_email, send_emails_concurrently
+from .utils import (
+    build_response,
+    get_body_from_event,
+    get_cors_headers,
+    get_ip_address,
+    get_request_metadata,
+    get_source_ip,
+)
+from .rate_limiting import check_rate_limit, flush_rate_limit_counters, get_rate_limit_status
+from .spam import SpamEngine, SpamIndicator, SpamReport
+from .table_export import scan_table, export_table
+from .broadcast import run_broadcast, send_bulk_batch, SendRatePacer, FileBroadcastStore, DynamoBroadcastStore
+from .submission_query import query_submissions, get_submission, InvalidQuery
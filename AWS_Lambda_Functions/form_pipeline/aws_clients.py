@@ -0,0 +1,118 @@
+# AWS_Lambda_Functions/form_pipeline/aws_clients.py
+"""
+Lazily created AWS clients shared by every module in a form Lambda
+
+boto3 is only imported, and each client/resource only built, the first time
+something asks for it, so a cold start does not pay for clients a request
+never uses. Storage, email and rate limiting all share the same instances.
+"""
+import os
+import logging
+import threading
+
+# Configure logging
+logger = logging.getLogger()
+
+# Set SES_IDENTITY_CHECK=false to skip the background sender verification check
+SES_IDENTITY_CHECK = os.environ.get('SES_IDENTITY_CHECK', 'true').lower() == 'true'
+
+# Provisioned concurrency and SnapStart init ahead of traffic, so building
+# clients during init is free there; on-demand cold starts stay lazy
+PRELOAD_CLIENTS = (
+    os.environ.get('AWS_CLIENT_PRELOAD', '').lower() == 'true'
+    or os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE', 'on-demand') != 'on-demand'
+)
+
+_clients = {}
+_clients_lock = threading.RLock()
+
+# sender email -> True/False once the background check has finished
+_identity_status = {}
+_identity_checks_started = set()
+
+def _get_or_create(key, factory):
+    """Return the shared instance for key, building it once under a lock"""
+    instance = _clients.get(key)
+    if instance is None:
+        with _clients_lock:
+            instance = _clients.get(key)
+            if instance is None:
+                instance = factory()
+                _clients[key] = instance
+    return instance
+
+def get_dynamodb():
+    """Shared boto3 DynamoDB resource"""
+    def factory():
+        import boto3
+        return boto3.resource('dynamodb')
+    return _get_or_create('dynamodb', factory)
+
+def get_table(table_name):
+    """Shared DynamoDB Table handle for table_name"""
+    return _get_or_create(('table', table_name), lambda: get_dynamodb().Table(table_name))
+
+def get_ses():
+    """Shared boto3 SES client"""
+    def factory():
+        import boto3
+        return boto3.client('ses')
+    return _get_or_create('ses', factory)
+
+def get_sqs():
+    """Shared boto3 SQS client"""
+    def factory():
+        import boto3
+        return boto3.client('sqs')
+    return _get_or_create('sqs', factory)
+
+def preload_clients(table_names=()):
+    """Build the shared clients now instead of on first use"""
+    get_ses()
+    for table_name in table_names:
+        if table_name:
+            get_table(table_name)
+
+def check_sender_identity(sender_email):
+    """Check whether an SES identity is verified, logging a warning if it may not be"""
+    identity_verified = False
+    try:
+        response = get_ses().get_identity_verification_attributes(
+            Identities=[sender_email]
+        )
+        attributes = response['VerificationAttributes'].get(sender_email, {})
+        identity_verified = attributes.get('VerificationStatus') == 'Success'
+    except Exception as e:
+        logger.warning(f"Could not check SES identity status: {str(e)}")
+
+    if not identity_verified:
+        logger.warning(f"SES identity '{sender_email}' may not be verified. Email sending might fail.")
+
+    _identity_status[sender_email] = identity_verified
+    return identity_verified
+
+def start_sender_identity_check(sender_email):
+    """
+    Check an SES sender identity once per container on a background thread
+
+    The result is only used for logging, so it never blocks a cold start or
+    a request. If the invocation finishes first, the thread simply resumes
+    with the next one.
+    """
+    if not SES_IDENTITY_CHECK or not sender_email:
+        return
+    with _clients_lock:
+        if sender_email in _identity_checks_started:
+            return
+        _identity_checks_started.add(sender_email)
+
+    threading.Thread(
+        target=check_sender_identity,
+        args=(sender_email,),
+        name='ses-identity-check',
+        daemon=True
+    ).start()
+
+def get_sender_identity_status(sender_email):
+    """True/False once the identity check for sender_email has run, otherwise None"""
+    return _identity_status.get(sender_email)
@@ -0,0 +1,430 @@
+# AWS_Lambda_Functions/form_pipeline/broadcast.py
+"""
+Newsletter broadcast to the subscriber table
+
+run_broadcast() scans the subscriber table a page at a time for active
+subscribers and sends an SES template to them with SendBulkTemplatedEmail,
+up to 50 destinations per call. A token bucket keeps the sends within the
+account's SES send rate (shared with the form Lambdas, so only a fraction
+of it is used), and the run stops cleanly at the 24-hour quota.
+
+Progress is checkpointed around every call: the start key of the current
+scan page, the recipients on that page already handled, and the batch in
+flight. A stopped run (time budget, quota, persistent throttling, a
+crash) started again with the same broadcast ID carries on where it left
+off, and nobody gets the newsletter twice; recipients of a call cut off
+by a crash are recorded as 'unknown' rather than sent again. Each
+recipient's outcome (SES message ID or error) is recorded in the store.
+
+Stores: FileBroadcastStore for local runs (broadcast_newsletter.py),
+DynamoBroadcastStore (BROADCAST_TABLE) for the nashsmash-send-newsletter Lambda.
+
+Environment:
+    BROADCAST_TABLE          DynamoDB table for checkpoints and outcomes
+    BROADCAST_PAGE_SIZE      Subscribers read per Scan request (default 500)
+    BROADCAST_RATE_FRACTION  Share of the SES send rate to use (default 0.8)
+"""
+import os
+import json
+import time
+import random
+import logging
+from datetime import datetime
+from botocore.exceptions import ClientError
+
+from .aws_clients import get_ses, get_table
+from .table_export import scan_pages
+from .outbox import RETRYABLE_SES_ERRORS, EMAIL_MAX_ATTEMPTS, EMAIL_RETRY_BASE_DELAY, EMAIL_RETRY_MAX_DELAY
+
+# Configure logging
+logger = logging.getLogger()
+
+BROADCAST_TABLE = os.environ.get('BROADCAST_TABLE', 'nash-and-smashed-newsletter-broadcasts')
+BROADCAST_PAGE_SIZE = int(os.environ.get('BROADCAST_PAGE_SIZE', '500'))
+BROADCAST_RATE_FRACTION = float(os.environ.get('BROADCAST_RATE_FRACTION', '0.8'))
+
+# SendBulkTemplatedEmail takes at most 50 destinations
+BULK_BATCH_SIZE = 50
+
+# Attributes read for each subscriber; the names become template data
+SUBSCRIBER_ATTRIBUTES = ('email', 'firstName', 'lastName', 'status')
+TEMPLATE_FIELDS = ('firstName', 'lastName', 'email')
+
+# Per-destination statuses worth sending again, and ones that stop the whole broadcast
+RETRYABLE_DESTINATION_STATUSES = {'AccountThrottled', 'TransientFailure'}
+FATAL_DESTINATION_STATUSES = {
+    'AccountDailyQuotaExceeded',
+    'AccountSuspended',
+    'AccountSendingPaused',
+    'ConfigurationSetSendingPaused',
+    'ConfigurationSetDoesNotExist',
+    'TemplateDoesNotExist',
+    'MailFromDomainNotVerified',
+}
+
+# run_broadcast() results
+COMPLETE = 'complete'
+PAUSED = 'paused'
+QUOTA_EXHAUSTED = 'quota_exhausted'
+
+class BulkSendError(Exception):
+    """
+    A bulk call that SES stopped part way
+
+    code is the SES error or destination status; outcomes holds the
+    recipients finished by earlier attempts, the rest were not sent.
+    """
+
+    def __init__(self, code, message, outcomes):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.outcomes = outcomes
+
+class QuotaExhausted(BulkSendError):
+    """The account's 24-hour sending quota is used up"""
+
+class SendRatePacer:
+    """
+    Token bucket for SES sends
+
+    Tokens refill at rate per second up to one second's worth. A bulk call
+    counts each destination against the send rate, so acquire() takes one
+    token per destination. A batch bigger than the bucket (accounts with a
+    send rate under 50) waits for a full bucket and runs it into debt,
+    which the next batch waits off. daily_remaining, if known, is the part
+    of the 24-hour quota left.
+    """
+
+    def __init__(self, rate, daily_remaining=None, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("Send rate must be positive")
+        self.rate = rate
+        self.capacity = max(rate, 1)
+        self.tokens = self.capacity
+        self.daily_remaining = daily_remaining
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+
+    @classmethod
+    def from_ses(cls, fraction=None, **kwargs):
+        """Pacer for the account's SES quota (GetSendQuota), using fraction of its send rate"""
+        fraction = BROADCAST_RATE_FRACTION if fraction is None else fraction
+        quota = get_ses().get_send_quota()
+        # Max24HourSend is -1 for an unlimited quota
+        daily_remaining = None
+        if quota['Max24HourSend'] >= 0:
+            daily_remaining = max(0, int(quota['Max24HourSend'] - quota['SentLast24Hours']))
+        rate = max(quota['MaxSendRate'] * fraction, 1)
+        logger.info(f"SES send rate {quota['MaxSendRate']}/s (using {rate:.1f}/s), "
+                    f"{'unlimited' if daily_remaining is None else daily_remaining} left today")
+        return cls(rate, daily_remaining, **kwargs)
+
+    def allowance(self, count):
+        """How many of count messages the daily quota still allows"""
+        if self.daily_remaining is None:
+            return count
+        return min(count, self.daily_remaining)
+
+    def acquire(self, count):
+        """Block until count messages may be sent, then take them"""
+        needed = min(count, self.capacity)
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens < needed:
+            wait = (needed - self.tokens) / self.rate
+            self._sleep(wait)
+            # Credit exactly the tokens waited for; any oversleep is refilled next time
+            self.tokens = needed
+            self._updated = now + wait
+        self.tokens -= count
+        if self.daily_remaining is not None:
+            self.daily_remaining -= count
+
+class FileBroadcastStore:
+    """Checkpoint (JSON, replaced atomically) and outcomes (NDJSON, appended) in a local directory"""
+
+    def __init__(self, directory, broadcast_id):
+        os.makedirs(directory, exist_ok=True)
+        self.checkpoint_path = os.path.join(directory, f"{broadcast_id}.checkpoint.json")
+        self.outcomes_path = os.path.join(directory, f"{broadcast_id}.outcomes.ndjson")
+
+    def load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save_checkpoint(self, checkpoint):
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+    def record_outcomes(self, outcomes):
+        with open(self.outcomes_path, 'a', encoding='utf-8') as f:
+            for outcome in outcomes:
+                f.write(json.dumps(outcome, separators=(',', ':')) + '\n')
+
+class DynamoBroadcastStore:
+    """
+    Checkpoint and outcomes in one DynamoDB table
+
+    Key schema: broadcastId (HASH), recipient (RANGE). The checkpoint is
+    the '#checkpoint' item; every other item is one recipient's outcome.
+    """
+
+    CHECKPOINT_KEY = '#checkpoint'
+
+    def __init__(self, broadcast_id, table_name=None):
+        self.broadcast_id = broadcast_id
+        self.table = get_table(table_name or BROADCAST_TABLE)
+
+    def load_checkpoint(self):
+        item = self.table.get_item(
+            Key={'broadcastId': self.broadcast_id, 'recipient': self.CHECKPOINT_KEY},
+            ConsistentRead=True
+        ).get('Item')
+        # Stored as JSON so the scan key and counts come back as plain values
+        return json.loads(item['checkpoint']) if item else None
+
+    def save_checkpoint(self, checkpoint):
+        self.table.put_item(Item={
+            'broadcastId': self.broadcast_id,
+            'recipient': self.CHECKPOINT_KEY,
+            'status': checkpoint['status'],
+            'updatedAt': checkpoint['updatedAt'],
+            'checkpoint': json.dumps(checkpoint, separators=(',', ':'))
+        })
+
+    def record_outcomes(self, outcomes):
+        with self.table.batch_writer() as batch:
+            for outcome in outcomes:
+                item = {'broadcastId': self.broadcast_id, 'recipient': outcome['email']}
+                item.update({key: value for key, value in outcome.items() if key != 'email'})
+                batch.put_item(Item=item)
+
+def _destination(subscriber):
+    data = {field: subscriber[field] for field in TEMPLATE_FIELDS if subscriber.get(field)}
+    return {
+        'Destination': {'ToAddresses': [subscriber['email']]},
+        'ReplacementTemplateData': json.dumps(data)
+    }
+
+def send_bulk_batch(subscribers, template, sender, default_data=None, configuration_set=None,
+                    max_attempts=None, base_delay=None):
+    """
+    Send a template to up to 50 subscribers with one SendBulkTemplatedEmail call
+
+    Throttling and transient errors, for the whole call or single
+    destinations, are retried with jittered exponential backoff.
+    Destinations still failing after the last attempt are outcomes with
+    status 'failed'.
+
+    Returns:
+        One outcome dict per subscriber, in order: email, status, at, and messageId or error
+
+    Raises:
+        QuotaExhausted: SES reports the daily quota used up
+        BulkSendError: SES rejected the call or the account, or kept throttling the whole call
+    """
+    max_attempts = max_attempts or EMAIL_MAX_ATTEMPTS
+    base_delay = EMAIL_RETRY_BASE_DELAY if base_delay is None else base_delay
+    request = {
+        'Source': sender,
+        'Template': template,
+        'DefaultTemplateData': json.dumps(default_data or {})
+    }
+    if configuration_set:
+        request['ConfigurationSetName'] = configuration_set
+
+    finished = {}
+
+    def results():
+        return [finished[subscriber['email']] for subscriber in subscribers if subscriber['email'] in finished]
+
+    pending = list(subscribers)
+    for attempt in range(1, max_attempts + 1):
+        try:
+            response = get_ses().send_bulk_templated_email(
+                Destinations=[_destination(subscriber) for subscriber in pending], **request
+            )
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            if error.get('Code', '') not in RETRYABLE_SES_ERRORS or attempt == max_attempts:
+                raise BulkSendError(error.get('Code', ''), error.get('Message', ''), results()) from e
+        else:
+            sent_at = datetime.now().isoformat()
+            retry = []
+            fatal = None
+            for subscriber, result in zip(pending, response['Status']):
+                # Status is always set by SES; an ID alone means it was accepted
+                status = result.get('Status') or ('Success' if result.get('MessageId') else 'Failed')
+                if status in FATAL_DESTINATION_STATUSES:
+                    # Left unfinished for the resume, but keep recording the
+                    # rest: SES may have accepted later destinations
+                    fatal = fatal or (status, result.get('Error', ''))
+                    continue
+                if status in RETRYABLE_DESTINATION_STATUSES and attempt < max_attempts:
+                    retry.append(subscriber)
+                    continue
+                outcome = {'email': subscriber['email'], 'at': sent_at}
+                if status == 'Success':
+                    outcome.update(status='sent', messageId=result.get('MessageId'))
+                else:
+                    outcome.update(status='failed', error=status, detail=result.get('Error', ''))
+                finished[subscriber['email']] = outcome
+            if fatal:
+                error_class = QuotaExhausted if fatal[0] == 'AccountDailyQuotaExceeded' else BulkSendError
+                raise error_class(fatal[0], fatal[1], results())
+            pending = retry
+            if not pending:
+                break
+
+        # Exponential backoff with full jitter
+        delay = random.uniform(0, min(EMAIL_RETRY_MAX_DELAY, base_delay * (2 ** (attempt - 1))))
+        logger.info("Bulk send throttled for %d recipient(s), retrying in %.2fs", len(pending), delay)
+        time.sleep(delay)
+
+    return results()
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def run_broadcast(broadcast_id, template, sender, store, table_name, pacer=None, default_data=None,
+                  configuration_set=None, time_budget=None, page_size=None):
+    """
+    Send template to every active subscriber, or carry on an earlier run of broadcast_id
+
+    Args:
+        broadcast_id: Names the broadcast; runs with the same ID share a checkpoint
+        template: SES template name
+        sender: Verified SES sender address
+        store: FileBroadcastStore or DynamoBroadcastStore
+        table_name: Subscriber table
+        pacer: SendRatePacer (defaults to SendRatePacer.from_ses())
+        default_data: Template data for fields a subscriber has no value for
+        configuration_set: SES configuration set, e.g. for bounce and complaint events
+        time_budget: Seconds to run before pausing (e.g. the Lambda's remaining time)
+        page_size: Subscribers per Scan request
+
+    Returns:
+        Dict with status (complete, paused or quota_exhausted) and sent/failed/unknown counts
+    """
+    deadline = time.monotonic() + time_budget if time_budget else None
+    checkpoint = store.load_checkpoint()
+    if checkpoint is None:
+        checkpoint = {
+            'broadcastId': broadcast_id,
+            'template': template,
+            'status': 'running',
+            'startKey': None,
+            'handled': [],
+            'inFlight': [],
+            'sent': 0,
+            'failed': 0,
+            'unknown': 0,
+            'startedAt': datetime.now().isoformat(),
+            'updatedAt': datetime.now().isoformat()
+        }
+    elif checkpoint['template'] != template:
+        raise ValueError(f"Broadcast {broadcast_id} was started with template {checkpoint['template']}")
+    if checkpoint['status'] == COMPLETE:
+        logger.info(f"Broadcast {broadcast_id} already complete")
+        return _summary(checkpoint)
+
+    if checkpoint['inFlight']:
+        # The last run stopped during a call; SES may or may not have sent it
+        logger.warning(f"Broadcast {broadcast_id}: {len(checkpoint['inFlight'])} recipient(s) "
+                       f"of an interrupted call recorded as unknown")
+        unknown_at = datetime.now().isoformat()
+        store.record_outcomes([{'email': email, 'status': 'unknown', 'at': unknown_at}
+                               for email in checkpoint['inFlight']])
+        checkpoint['handled'].extend(checkpoint['inFlight'])
+        checkpoint['unknown'] += len(checkpoint['inFlight'])
+        checkpoint['inFlight'] = []
+        store.save_checkpoint(checkpoint)
+
+    pacer = pacer or SendRatePacer.from_ses()
+
+    def save(status):
+        checkpoint['status'] = status
+        checkpoint['updatedAt'] = datetime.now().isoformat()
+        store.save_checkpoint(checkpoint)
+        return _summary(checkpoint)
+
+    def finish(outcomes):
+        store.record_outcomes(outcomes)
+        for outcome in outcomes:
+            checkpoint['handled'].append(outcome['email'])
+            checkpoint['sent' if outcome['status'] == 'sent' else 'failed'] += 1
+        checkpoint['inFlight'] = []
+
+    pages = scan_pages(
+        table_name,
+        attributes=SUBSCRIBER_ATTRIBUTES,
+        page_size=page_size or BROADCAST_PAGE_SIZE,
+        start_key=checkpoint['startKey'],
+        filter_expression=f"#a{SUBSCRIBER_ATTRIBUTES.index('status')} = :active",
+        values={':active': 'active'}
+    )
+    for subscribers, next_key in pages:
+        # After a resume, the first page may be partly sent already
+        handled = set(checkpoint['handled'])
+        pending = [subscriber for subscriber in subscribers
+                   if subscriber.get('email') and subscriber['email'] not in handled]
+
+        for batch in _batches(pending, BULK_BATCH_SIZE):
+            if deadline and time.monotonic() >= deadline:
+                logger.info(f"Broadcast {broadcast_id} paused at its time budget")
+                return save(PAUSED)
+            allowed = pacer.allowance(len(batch))
+            if not allowed:
+                logger.warning(f"Broadcast {broadcast_id} stopped: SES daily quota used up")
+                return save(QUOTA_EXHAUSTED)
+            # Send what the quota allows, then stop; the rest stay pending on this page
+            quota_reached = allowed < len(batch)
+            batch = batch[:allowed]
+
+            pacer.acquire(len(batch))
+            checkpoint['inFlight'] = [subscriber['email'] for subscriber in batch]
+            save('running')
+            try:
+                finish(send_bulk_batch(batch, template, sender, default_data, configuration_set))
+            except BulkSendError as e:
+                # Recipients SES finished before it stopped are kept; the rest go out on resume
+                finish(e.outcomes)
+                if isinstance(e, QuotaExhausted):
+                    logger.warning(f"Broadcast {broadcast_id} stopped: SES daily quota used up")
+                    return save(QUOTA_EXHAUSTED)
+                if e.code in RETRYABLE_SES_ERRORS:
+                    logger.warning(f"Broadcast {broadcast_id} paused, SES still throttling: {e.code}")
+                    return save(PAUSED)
+                save(PAUSED)
+                raise
+            if quota_reached:
+                logger.warning(f"Broadcast {broadcast_id} stopped: SES daily quota used up")
+                return save(QUOTA_EXHAUSTED)
+            save('running')
+
+        checkpoint['startKey'] = next_key
+        checkpoint['handled'] = []
+        if next_key:
+            save('running')
+
+    logger.info(f"Broadcast {broadcast_id} complete: {checkpoint['sent']} sent, {checkpoint['failed']} failed")
+    return save(COMPLETE)
+
+def _summary(checkpoint):
+    return {
+        'broadcastId': checkpoint['broadcastId'],
+        'status': checkpoint['status'],
+        'sent': checkpoint['sent'],
+        'failed': checkpoint['failed'],
+        'unknown': checkpoint['unknown']
+    }
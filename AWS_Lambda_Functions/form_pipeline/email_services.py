@@ -0,0 +1,126 @@
+# AWS_Lambda_Functions/form_pipeline/email_services.py
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+
+from .aws_clients import get_ses
+
+# Configure logging
+logger = logging.getLogger()
+
+# Emails in one request are sent concurrently; the pool lives for the container
+EMAIL_MAX_WORKERS = int(os.environ.get('EMAIL_MAX_WORKERS', '4'))
+
+_email_executor = None
+_email_executor_lock = threading.Lock()
+
+def get_email_executor():
+    """Shared thread pool for SES sends, created on first use"""
+    global _email_executor
+    if _email_executor is None:
+        with _email_executor_lock:
+            if _email_executor is None:
+                _email_executor = ThreadPoolExecutor(max_workers=EMAIL_MAX_WORKERS, thread_name_prefix='ses-send')
+    return _email_executor
+
+def send_emails_concurrently(sends):
+    """
+    Run several email sends at once and wait for all of them
+
+    Args:
+        sends: Dict of name -> zero-argument callable returning True/False
+
+    Returns:
+        Dict of name -> result, in the same order as sends
+    """
+    if len(sends) <= 1:
+        return {name: send() for name, send in sends.items()}
+
+    # Build the client before fanning out so the threads don't race to create it
+    get_ses()
+    executor = get_email_executor()
+    futures = {name: executor.submit(send) for name, send in sends.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+def build_ses_request(sender, to_addresses, subject, body_html, body_text, cc_addresses=None, reply_to=None):
+    """Build the keyword arguments for one SES send_email call"""
+    destination = {
+        'ToAddresses': to_addresses
+    }
+
+    # Add CC addresses if any exist
+    if cc_addresses:
+        destination['CcAddresses'] = cc_addresses
+
+    request = {
+        'Source': sender,
+        'Destination': destination,
+        'Message': {
+            'Subject': {'Data': subject},
+            'Body': {
+                'Text': {'Data': body_text},
+                'Html': {'Data': body_html}
+            }
+        }
+    }
+    if reply_to:
+        request['ReplyToAddresses'] = [reply_to]
+    return request
+
+def send_email(sender, to_addresses, subject, body_html, body_text, cc_addresses=None, reply_to=None):
+    """Send one HTML + text email through SES, returning False instead of raising on SES errors"""
+    try:
+        response = get_ses().send_email(
+            **build_ses_request(sender, to_addresses, subject, body_html, body_text, cc_addresses, reply_to)
+        )
+
+        logger.debug("Email '%s' sent to %s (CC: %s): %s", subject, to_addresses, cc_addresses, response['MessageId'])
+        return True
+    except ClientError as e:
+        logger.error(f"SES error sending '{subject}': {e}")
+        return False
+
+def build_notification_email(schema, form_data, form_id, to_addresses, cc_addresses=None):
+    """Render the schema's notification email as send_email keyword arguments"""
+    subject, body_html, body_text = schema.notification_template(
+        form_data=form_data,
+        form_id=form_id,
+        website_name=schema.website_name,
+        website_url=schema.website_url
+    )
+    return {
+        'sender': schema.sender_email,
+        'to_addresses': to_addresses,
+        'subject': subject,
+        'body_html': body_html,
+        'body_text': body_text,
+        'cc_addresses': cc_addresses,
+        'reply_to': form_data.get('email', schema.sender_email)
+    }
+
+def build_confirmation_email(schema, form_data):
+    """Render the schema's confirmation email as send_email keyword arguments"""
+    subject, body_html, body_text = schema.confirmation_template(
+        form_data=form_data,
+        website_name=schema.website_name,
+        website_url=schema.website_url
+    )
+    return {
+        'sender': schema.sender_email,
+        'to_addresses': [form_data.get('email')],
+        'subject': subject,
+        'body_html': body_html,
+        'body_text': body_text
+    }
+
+def send_notification_email(schema, form_data, form_id, to_addresses, cc_addresses=None):
+    """Send the schema's notification email to the form administrators"""
+    # Don't fail the function if email fails - we already saved to DB
+    return send_email(**build_notification_email(schema, form_data, form_id, to_addresses, cc_addresses))
+
+def send_confirmation_email(schema, form_data):
+    """Send the schema's confirmation email to the person who submitted the form"""
+    # Don't fail the function if confirmation email fails
+    return send_email(**build_confirmation_email(schema, form_data))
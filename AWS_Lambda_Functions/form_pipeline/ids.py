@@ -0,0 +1,99 @@
+# AWS_Lambda_Functions/form_pipeline/ids.py
+"""
+Submission IDs: the form's prefix and a ULID, e.g. CAREER_01JA8Z5X4J2R9V6T3N7QW1KD0F
+
+A ULID is 48 bits of millisecond time followed by 80 random bits, written
+as 26 Crockford base32 characters, so:
+
+- Two Lambdas submitting in the same millisecond draw independent random
+  parts; the old PREFIX_<milliseconds> IDs were equal and one put_item
+  overwrote the other.
+- Within a container, IDs made in the same millisecond (or after the
+  clock steps back) take the last ID's random part plus one, so they
+  never repeat and always sort in the order they were made.
+- IDs with the same prefix sort by creation time as plain strings, and
+  id_bounds() gives the ID range of a time range.
+- Every ID is different, so DynamoDB hashes concurrent submissions to
+  different partitions.
+
+id_timestamp() reads the time back out of new and old style IDs.
+"""
+import os
+import time
+import threading
+
+# Crockford's base32: no I, L, O or U
+ENCODING = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+DECODING = {char: value for value, char in enumerate(ENCODING)}
+ULID_LENGTH = 26
+TIME_LENGTH = 10
+RANDOM_BITS = 80
+RANDOM_MAX = (1 << RANDOM_BITS) - 1
+
+# Every two-character string, indexed by its 10-bit value
+_PAIRS = [first + second for first in ENCODING for second in ENCODING]
+
+def _encode(value, length):
+    """value as length (even) base32 characters, most significant first"""
+    return ''.join([_PAIRS[(value >> shift) & 1023] for shift in range(5 * length - 10, -1, -10)])
+
+def _decode(text):
+    value = 0
+    for char in text:
+        value = (value << 5) | DECODING[char]
+    return value
+
+class IdGenerator:
+    """Monotonic ULID source; one per container is shared by every request thread"""
+
+    def __init__(self, clock=time.time, randbytes=os.urandom):
+        self._clock = clock
+        self._randbytes = randbytes
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def next(self):
+        """(ULID, its millisecond timestamp)"""
+        with self._lock:
+            now_ms = int(self._clock() * 1000)
+            if now_ms > self._last_ms:
+                random_part = int.from_bytes(self._randbytes(RANDOM_BITS // 8), 'big')
+            elif self._last_random < RANDOM_MAX:
+                # Same millisecond, or the clock went back: carry on from the last ID
+                now_ms, random_part = self._last_ms, self._last_random + 1
+            else:
+                now_ms = self._last_ms + 1
+                random_part = int.from_bytes(self._randbytes(RANDOM_BITS // 8), 'big')
+            self._last_ms, self._last_random = now_ms, random_part
+        return _encode((now_ms << RANDOM_BITS) | random_part, ULID_LENGTH), now_ms
+
+    def new_id(self, prefix):
+        """(prefix_ULID, its millisecond timestamp)"""
+        ulid, timestamp = self.next()
+        return f"{prefix}_{ulid}", timestamp
+
+_generator = IdGenerator()
+
+def new_submission_id(prefix):
+    """A new PREFIX_<ULID> submission ID and the millisecond timestamp it encodes"""
+    return _generator.new_id(prefix)
+
+def id_timestamp(form_id):
+    """Millisecond timestamp of a PREFIX_<ULID> or an old PREFIX_<milliseconds> ID"""
+    suffix = form_id.rsplit('_', 1)[-1]
+    if suffix.isdigit():
+        return int(suffix)
+    if len(suffix) != ULID_LENGTH:
+        raise ValueError(f"Not a submission ID: {form_id}")
+    try:
+        return _decode(suffix[:TIME_LENGTH])
+    except KeyError:
+        raise ValueError(f"Not a submission ID: {form_id}")
+
+def id_bounds(prefix, since_ms, until_ms):
+    """Lowest and highest possible IDs made between since_ms and until_ms, inclusive"""
+    return (
+        f"{prefix}_{_encode(since_ms << RANDOM_BITS, ULID_LENGTH)}",
+        f"{prefix}_{_encode((until_ms << RANDOM_BITS) | RANDOM_MAX, ULID_LENGTH)}",
+    )
@@ -0,0 +1,281 @@
+# AWS_Lambda_Functions/form_pipeline/outbox.py
+"""
+Email outbox for the form Lambdas
+
+With EMAIL_DELIVERY=outbox the handler renders its emails, puts them on a
+queue as email jobs and returns; the nashsmash-send-form-emails worker
+drains the queue and sends through SES with retry and backoff. A slow SES
+or a throttling spike then delays email, not the browser's response.
+
+Backends: 'sqs' (EMAIL_QUEUE_URL) for production, 'memory' for local runs.
+The memory queue lives in one process, where no worker can drain it, so it
+is refused inside Lambda and the handler sends inline instead.
+"""
+import os
+import json
+import time
+import uuid
+import random
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from botocore.exceptions import ClientError
+
+from .aws_clients import get_ses, get_sqs
+from .email_services import build_ses_request, get_email_executor
+
+# Configure logging
+logger = logging.getLogger()
+
+# 'inline' sends from the handler, 'outbox' queues for the sender worker
+EMAIL_DELIVERY = os.environ.get('EMAIL_DELIVERY', 'inline').lower()
+OUTBOX_BACKEND = os.environ.get('OUTBOX_BACKEND', 'sqs').lower()
+EMAIL_QUEUE_URL = os.environ.get('EMAIL_QUEUE_URL', '')
+
+# Worker retry policy for throttled / unavailable SES
+EMAIL_MAX_ATTEMPTS = int(os.environ.get('EMAIL_MAX_ATTEMPTS', '4'))
+EMAIL_RETRY_BASE_DELAY = float(os.environ.get('EMAIL_RETRY_BASE_DELAY', '0.25'))
+EMAIL_RETRY_MAX_DELAY = float(os.environ.get('EMAIL_RETRY_MAX_DELAY', '5'))
+
+RETRYABLE_SES_ERRORS = {
+    'Throttling',
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailable',
+    'InternalFailure',
+    'RequestTimeout',
+}
+
+# SQS batch APIs take at most 10 entries
+SQS_BATCH_SIZE = 10
+
+class MemoryEmailQueue:
+    """In-process stand-in for SQS, for local runs and scripts"""
+
+    def __init__(self):
+        self._jobs = deque()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def send_jobs(self, jobs):
+        with self._lock:
+            self._jobs.extend(jobs)
+
+    def receive_jobs(self, max_jobs=SQS_BATCH_SIZE, wait_seconds=0):
+        """Return up to max_jobs (receipt, job) pairs, hiding them until deleted or released"""
+        received = []
+        with self._lock:
+            while self._jobs and len(received) < max_jobs:
+                job = self._jobs.popleft()
+                receipt = uuid.uuid4().hex
+                self._in_flight[receipt] = job
+                received.append((receipt, job))
+        return received
+
+    def delete_jobs(self, receipts):
+        with self._lock:
+            for receipt in receipts:
+                self._in_flight.pop(receipt, None)
+
+    def release_jobs(self, receipts):
+        """Make failed jobs visible again for the next drain"""
+        with self._lock:
+            for receipt in receipts:
+                job = self._in_flight.pop(receipt, None)
+                if job is not None:
+                    self._jobs.append(job)
+
+    def __len__(self):
+        return len(self._jobs)
+
+class SQSEmailQueue:
+    """Email jobs as JSON messages on an SQS queue"""
+
+    def __init__(self, queue_url):
+        if not queue_url:
+            raise ValueError("EMAIL_QUEUE_URL must be set for the SQS outbox backend")
+        self.queue_url = queue_url
+
+    def send_jobs(self, jobs):
+        for start in range(0, len(jobs), SQS_BATCH_SIZE):
+            batch = jobs[start:start + SQS_BATCH_SIZE]
+            response = get_sqs().send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {'Id': str(index), 'MessageBody': json.dumps(job)}
+                    for index, job in enumerate(batch)
+                ]
+            )
+            if response.get('Failed'):
+                raise Exception(f"Failed to queue {len(response['Failed'])} email job(s): {response['Failed']}")
+
+    def receive_jobs(self, max_jobs=SQS_BATCH_SIZE, wait_seconds=0):
+        response = get_sqs().receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=min(max_jobs, SQS_BATCH_SIZE),
+            WaitTimeSeconds=wait_seconds
+        )
+        return [
+            (message['ReceiptHandle'], json.loads(message['Body']))
+            for message in response.get('Messages', [])
+        ]
+
+    def delete_jobs(self, receipts):
+        receipts = list(receipts)
+        for start in range(0, len(receipts), SQS_BATCH_SIZE):
+            get_sqs().delete_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {'Id': str(index), 'ReceiptHandle': receipt}
+                    for index, receipt in enumerate(receipts[start:start + SQS_BATCH_SIZE])
+                ]
+            )
+
+    def release_jobs(self, receipts):
+        # Left alone, the messages reappear after the visibility timeout and
+        # go to the dead-letter queue once maxReceiveCount is reached
+        pass
+
+_email_queue = None
+
+def get_email_queue():
+    """Container-wide email queue for the configured OUTBOX_BACKEND"""
+    global _email_queue
+    if _email_queue is None:
+        if OUTBOX_BACKEND == 'memory':
+            if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+                raise RuntimeError("OUTBOX_BACKEND=memory cannot be drained from Lambda; set OUTBOX_BACKEND=sqs")
+            _email_queue = MemoryEmailQueue()
+        else:
+            _email_queue = SQSEmailQueue(EMAIL_QUEUE_URL)
+    return _email_queue
+
+def enqueue_emails(messages, form_id, form_type, queue=None):
+    """
+    Queue rendered emails for the sender worker
+
+    Args:
+        messages: Dict of kind ('notification', 'confirmation') -> send_email keyword arguments
+        form_id: Submission the emails belong to
+        form_type: Form type, for logging in the worker
+        queue: Queue to use (defaults to get_email_queue())
+
+    Returns:
+        List of queued job IDs
+    """
+    queued_at = datetime.now().isoformat()
+    jobs = [
+        {
+            'jobId': f"{form_id}_{kind}",
+            'kind': kind,
+            'formId': form_id,
+            'formType': form_type,
+            'queuedAt': queued_at,
+            'message': message
+        }
+        for kind, message in messages.items()
+    ]
+    (queue or get_email_queue()).send_jobs(jobs)
+    logger.debug("Queued %d email job(s) for %s", len(jobs), form_id)
+    return [job['jobId'] for job in jobs]
+
+def deliver_email_job(job, max_attempts=None, base_delay=None):
+    """
+    Send one email job through SES, retrying throttling and transient errors
+
+    Returns:
+        True when the job is finished (sent, or rejected permanently and dropped),
+        False when it should be retried later
+    """
+    max_attempts = max_attempts or EMAIL_MAX_ATTEMPTS
+    base_delay = EMAIL_RETRY_BASE_DELAY if base_delay is None else base_delay
+    message = job['message']
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            response = get_ses().send_email(**build_ses_request(**message))
+            logger.debug("Email job %s sent: %s", job['jobId'], response['MessageId'])
+            return True
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code not in RETRYABLE_SES_ERRORS:
+                logger.error(f"Email job {job['jobId']} rejected by SES, dropping it: {e}")
+                return True
+            if attempt == max_attempts:
+                logger.warning(f"Email job {job['jobId']} still failing after {attempt} attempts: {error_code}")
+                return False
+
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, min(EMAIL_RETRY_MAX_DELAY, base_delay * (2 ** (attempt - 1))))
+            logger.info("Email job %s hit %s, retrying in %.2fs", job['jobId'], error_code, delay)
+            time.sleep(delay)
+
+    return False
+
+def _deliver_all(jobs):
+    """Deliver several jobs concurrently on the shared email pool, keyed like jobs"""
+    if not jobs:
+        return {}
+    get_ses()
+    executor = get_email_executor()
+    futures = {key: executor.submit(deliver_email_job, job) for key, job in jobs.items()}
+    results = {}
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            logger.error(f"Email job {jobs[key].get('jobId')} failed: {str(e)}")
+            results[key] = False
+    return results
+
+def handle_sqs_event(event):
+    """
+    Worker entry point for an SQS event source mapping
+
+    Failed messages are reported through batchItemFailures (enable
+    ReportBatchItemFailures on the mapping) so only they are retried.
+    """
+    jobs = {
+        record['messageId']: json.loads(record['body'])
+        for record in event.get('Records', [])
+    }
+    results = _deliver_all(jobs)
+    failures = [message_id for message_id, finished in results.items() if not finished]
+
+    logger.info(f"Processed {len(jobs)} email job(s), {len(failures)} to retry")
+    return {'batchItemFailures': [{'itemIdentifier': message_id} for message_id in failures]}
+
+def drain_email_queue(queue=None, max_batches=None, wait_seconds=0):
+    """
+    Worker entry point that polls the queue directly (scheduled runs, memory backend)
+
+    Returns:
+        Dict with counts of sent/finished and retried jobs
+    """
+    queue = queue or get_email_queue()
+    finished_count = 0
+    retry_count = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        received = queue.receive_jobs(SQS_BATCH_SIZE, wait_seconds)
+        if not received:
+            break
+        batches += 1
+
+        results = _deliver_all(dict(received))
+        finished = [receipt for receipt, done in results.items() if done]
+        failed = [receipt for receipt, done in results.items() if not done]
+
+        queue.delete_jobs(finished)
+        if failed:
+            # Stop after releasing so a persistent outage isn't spun on
+            queue.release_jobs(failed)
+            retry_count += len(failed)
+            finished_count += len(finished)
+            break
+        finished_count += len(finished)
+
+    logger.info(f"Drained email queue: {finished_count} finished, {retry_count} to retry")
+    return {'finished': finished_count, 'retry': retry_count}
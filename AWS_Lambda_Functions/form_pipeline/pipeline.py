@@ -0,0 +1,283 @@
+# AWS_Lambda_Functions/form_pipeline/pipeline.py
+import logging
+from datetime import datetime
+from decimal import Decimal
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .utils import build_response, build_preflight_response, get_body_from_event, get_source_ip
+from .storage import DEFAULT_METADATA_ATTRIBUTES, save_submission
+from .email_services import (
+    build_confirmation_email,
+    build_notification_email,
+    send_email,
+    send_emails_concurrently,
+)
+from .outbox import EMAIL_DELIVERY, enqueue_emails
+from .rate_limiting import RATE_LIMIT_TABLE_NAME, check_rate_limit, flush_rate_limit_counters
+from .spam import SpamReport
+from .aws_clients import PRELOAD_CLIENTS, preload_clients, start_sender_identity_check
+from .structured_logging import RequestLog, configure_logging
+
+logger = logging.getLogger()
+
+# Matches the Retry-After the frontend form actions read on a 429
+RATE_LIMIT_RETRY_AFTER = 3600  # 1 hour
+
+@dataclass
+class FormSchema:
+    """Everything that differs between one form Lambda and another"""
+    form_type: str
+    id_prefix: str
+    table_name: str
+    fields: Dict[str, Any]
+    validator: Callable[[dict], List[str]]
+    notification_template: Optional[Callable] = None
+    confirmation_template: Optional[Callable] = None
+    label: str = 'form submission'
+    sender_email: str = ''
+    # A list of addresses, or a callable taking the request body and returning one
+    notification_recipients: Union[List[str], Callable[[dict], List[str]]] = field(default_factory=list)
+    cc_recipients: List[str] = field(default_factory=list)
+    website_name: str = 'Nash & Smashed'
+    website_url: str = 'https://nashandsmashed.com'
+    # Returns a SpamReport, or a plain list of indicator messages
+    spam_detector: Optional[Callable[[dict], Union[SpamReport, List[str]]]] = None
+    rate_limited: bool = False
+    rate_limit_table: Optional[str] = None
+    ip_resolver: Callable[[dict], str] = get_source_ip
+    item_attributes: Dict[str, Any] = field(default_factory=dict)
+    metadata_attributes: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_METADATA_ATTRIBUTES))
+    extra_metadata: Optional[Callable[[dict], dict]] = None
+    success_message: str = 'Your form has been successfully submitted.'
+    error_message: str = 'An error occurred while processing your form. Please try again later or contact us directly.'
+    # A fixed message, or a callable taking the validation errors and returning one
+    validation_message: Union[str, Callable[[List[str]], str], None] = None
+    response_fields: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class SubmissionContext:
+    """State handed from one pipeline stage to the next for a single request"""
+    event: dict
+    schema: FormSchema
+    ip_address: str = 'unknown'
+    body: dict = field(default_factory=dict)
+    form_data: dict = field(default_factory=dict)
+    spam_indicators: List[str] = field(default_factory=list)
+    spam_score: float = 0.0
+    form_id: Optional[str] = None
+    message: Optional[str] = None
+    response_fields: Dict[str, Any] = field(default_factory=dict)
+    email_results: Dict[str, bool] = field(default_factory=dict)
+    # Fields and timings for the one record written per request
+    request_log: Optional[RequestLog] = None
+
+# Each stage takes the SubmissionContext and returns None to continue,
+# or an API Gateway response to stop the pipeline and return it as-is.
+
+def rate_limit(ctx):
+    """Reject the request with a 429 when the caller IP is over its limit"""
+    if not ctx.schema.rate_limited:
+        return None
+
+    allowed, rate_limit_message = check_rate_limit(ctx.ip_address, ctx.schema.rate_limit_table)
+    if allowed:
+        return None
+
+    logger.warning("Rate limit exceeded for IP %s: %s", ctx.ip_address, rate_limit_message)
+    return build_response(
+        429,
+        {
+            'success': False,
+            'message': rate_limit_message or 'Rate limit exceeded. Please try again later.',
+            'retryAfter': RATE_LIMIT_RETRY_AFTER
+        },
+        {'Retry-After': str(RATE_LIMIT_RETRY_AFTER)}
+    )
+
+def parse_body(ctx):
+    """Parse the request body"""
+    ctx.body = get_body_from_event(ctx.event)
+    if ctx.request_log:
+        ctx.request_log.dump('Request body', ctx.body)
+    return None
+
+def validate(ctx):
+    """Run the schema validator (which also sanitizes) and return a 400 on errors"""
+    validation_errors = ctx.schema.validator(ctx.body)
+    if not validation_errors:
+        return None
+
+    logger.warning("Validation failed for IP %s: %s", ctx.ip_address, validation_errors)
+    body = {
+        'success': False,
+        'errors': validation_errors
+    }
+
+    message = ctx.schema.validation_message
+    if callable(message):
+        message = message(validation_errors)
+    if message:
+        body['message'] = message
+
+    return build_response(400, body)
+
+def detect_spam(ctx):
+    """Flag spam indicators - logged and stored for review, never blocked"""
+    if ctx.schema.spam_detector:
+        result = ctx.schema.spam_detector(ctx.body)
+        if isinstance(result, SpamReport):
+            ctx.spam_indicators = result.messages
+            ctx.spam_score = result.score
+        else:
+            ctx.spam_indicators = list(result or [])
+            ctx.spam_score = float(len(ctx.spam_indicators))
+        if ctx.spam_indicators:
+            logger.warning("Spam detected from IP %s (score %s): %s", ctx.ip_address, ctx.spam_score, ctx.spam_indicators)
+    return None
+
+def build_metadata(ctx):
+    """Build the request metadata stored alongside the submission"""
+    headers = ctx.event.get('headers') or {}
+    metadata = {
+        'submittedAt': datetime.now().isoformat(),
+        'userAgent': headers.get('User-Agent', ''),
+        'ipAddress': ctx.ip_address if ctx.ip_address != 'unknown' else ''
+    }
+    if ctx.schema.spam_detector:
+        metadata['spamIndicators'] = ctx.spam_indicators if ctx.spam_indicators else None
+        # DynamoDB takes numbers as Decimal, not float
+        metadata['spamScore'] = Decimal(str(ctx.spam_score))
+    if ctx.schema.extra_metadata:
+        metadata.update(ctx.schema.extra_metadata(ctx.event))
+    return metadata
+
+def persist(ctx):
+    """Save the submission to the schema's DynamoDB table"""
+    ctx.form_data = ctx.body.copy()
+    ctx.form_data['metadata'] = build_metadata(ctx)
+    ctx.form_id = save_submission(ctx.form_data, ctx.schema)
+    return None
+
+def get_notification_recipients(schema, body):
+    """Resolve the notification To addresses for a request"""
+    recipients = schema.notification_recipients
+    if callable(recipients):
+        recipients = recipients(body)
+    return [address for address in recipients if address]
+
+def notify(ctx):
+    """Send (or queue, in outbox mode) the admin notification and submitter confirmation"""
+    schema = ctx.schema
+    messages = {}
+
+    if schema.notification_template:
+        messages['notification'] = build_notification_email(
+            schema,
+            ctx.form_data,
+            ctx.form_id,
+            to_addresses=get_notification_recipients(schema, ctx.body),
+            cc_addresses=[address for address in schema.cc_recipients if address]
+        )
+
+    if schema.confirmation_template:
+        messages['confirmation'] = build_confirmation_email(schema, ctx.form_data)
+
+    if messages and EMAIL_DELIVERY == 'outbox':
+        try:
+            enqueue_emails(messages, ctx.form_id, schema.form_type)
+            ctx.email_results.update({kind: True for kind in messages})
+            if ctx.request_log:
+                ctx.request_log.set(emailDelivery='outbox')
+            return None
+        except Exception as e:
+            # The submission is already saved - fall back to sending inline
+            logger.error("Failed to queue emails for %s, sending inline: %s", ctx.form_id, e)
+
+    ctx.email_results.update(send_emails_concurrently({
+        kind: (lambda message=message: send_email(**message))
+        for kind, message in messages.items()
+    }))
+    return None
+
+DEFAULT_STAGES = (rate_limit, parse_body, validate, detect_spam, persist, notify)
+
+class FormPipeline:
+    """Runs a form submission through rate limit -> parse -> validate -> spam -> persist -> notify"""
+
+    def __init__(self, schema: FormSchema, stages=None):
+        self.schema = schema
+        self.stages = tuple(stages) if stages is not None else DEFAULT_STAGES
+
+        configure_logging()
+        if PRELOAD_CLIENTS:
+            preload_clients((schema.table_name, schema.rate_limit_table or RATE_LIMIT_TABLE_NAME))
+
+    def handle(self, event, context):
+        """Lambda entry point: run every stage and build the API Gateway response"""
+        # Check for OPTIONS request (CORS preflight)
+        if event.get('httpMethod') == 'OPTIONS':
+            return build_preflight_response()
+
+        request_log = RequestLog(self.schema.form_type, context)
+        request_log.dump(f"Received {self.schema.label}", event)
+
+        ctx = None
+        response = None
+        try:
+            response, ctx = self._run(event, request_log)
+            return response
+        finally:
+            if self.schema.rate_limited:
+                self._flush_rate_limits(request_log)
+            if ctx is not None:
+                request_log.set(formId=ctx.form_id)
+                if self.schema.spam_detector:
+                    request_log.set(spamScore=ctx.spam_score)
+                if ctx.email_results:
+                    request_log.set(emails=ctx.email_results)
+            request_log.emit(response['statusCode'] if response else 500)
+
+    def _flush_rate_limits(self, request_log):
+        """Write queued write-behind increments if a batch is due"""
+        try:
+            with request_log.timed('flush_rate_limit'):
+                flush_rate_limit_counters(self.schema.rate_limit_table)
+        except Exception as e:
+            logger.error("Error flushing rate limit counters: %s", e)
+
+    def _run(self, event, request_log):
+        """Run the stages, timing each one, and return (response, ctx)"""
+        schema = self.schema
+        ctx = None
+        try:
+            # Verify the SES sender once per container, off the request path
+            start_sender_identity_check(schema.sender_email)
+
+            ctx = SubmissionContext(
+                event=event,
+                schema=schema,
+                ip_address=schema.ip_resolver(event),
+                request_log=request_log
+            )
+
+            for stage in self.stages:
+                with request_log.timed(stage.__name__):
+                    response = stage(ctx)
+                if response is not None:
+                    return response, ctx
+
+            return build_response(200, {
+                'success': True,
+                'message': ctx.message or schema.success_message,
+                'formID': ctx.form_id,
+                **schema.response_fields,
+                **ctx.response_fields
+            }), ctx
+
+        except Exception as e:
+            logger.error("Error processing %s: %s", schema.label, e, exc_info=True)
+            return build_response(500, {
+                'success': False,
+                'message': schema.error_message
+            }), ctx
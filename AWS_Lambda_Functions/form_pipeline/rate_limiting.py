@@ -0,0 +1,850 @@
+"""
+Rate Limiting Module for AWS Lambda Functions
+Provides IP-based rate limiting using DynamoDB
+"""
+# AWS_Lambda_Functions/form_pipeline/rate_limiting.py
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Tuple, Optional
+from botocore.exceptions import ClientError
+
+from .aws_clients import get_dynamodb, get_table
+
+logger = logging.getLogger(__name__)
+
+# Configuration from environment variables
+RATE_LIMIT_TABLE_NAME = os.environ.get('RATE_LIMIT_TABLE', 'career-form-rate-limits')
+MAX_SUBMISSIONS_PER_IP_PER_HOUR = int(os.environ.get('MAX_SUBMISSIONS_PER_HOUR', '5'))
+MAX_SUBMISSIONS_PER_IP_PER_DAY = int(os.environ.get('MAX_SUBMISSIONS_PER_DAY', '10'))
+
+# 'atomic' checks and increments both windows in a single conditional
+# TransactWriteItems call; 'read_write' is the original get/get/put/put flow
+RATE_LIMIT_MODE = os.environ.get('RATE_LIMIT_MODE', 'atomic')
+RATE_LIMIT_MODES = ('atomic', 'read_write')
+MAX_TRANSACTION_ATTEMPTS = 3
+
+# 'fixed_window' keeps one hourly and one daily item per IP keyed by calendar
+# bucket; 'token_bucket' keeps a single item per IP whose hourly and daily
+# buckets refill continuously, so no burst is allowed across a window boundary
+RATE_LIMIT_ALGORITHM = os.environ.get('RATE_LIMIT_ALGORITHM', 'fixed_window')
+RATE_LIMIT_ALGORITHMS = ('fixed_window', 'token_bucket')
+HOUR_SECONDS = 3600
+DAY_SECONDS = 86400
+
+# Warm-container cache: IPs already over their limit are rejected locally.
+# With write-behind enabled, known IPs are also decided locally and their
+# increments are queued in the container. FormPipeline writes the queue at the
+# end of the request that fills a batch (RATE_LIMIT_FLUSH_BATCH_SIZE
+# increments) or finds the last flush RATE_LIMIT_FLUSH_INTERVAL seconds old;
+# every other request makes no DynamoDB call. Limits are enforced per
+# container between flushes, and increments still queued when Lambda reaps
+# the container are lost.
+RATE_LIMIT_CACHE_SIZE = int(os.environ.get('RATE_LIMIT_CACHE_SIZE', '1024'))
+RATE_LIMIT_WRITE_BEHIND = os.environ.get('RATE_LIMIT_WRITE_BEHIND', 'false').lower() == 'true'
+RATE_LIMIT_FLUSH_BATCH_SIZE = int(os.environ.get('RATE_LIMIT_FLUSH_BATCH_SIZE', '10'))
+RATE_LIMIT_FLUSH_INTERVAL = float(os.environ.get('RATE_LIMIT_FLUSH_INTERVAL', '5'))
+
+class LocalRateLimitCache:
+    """Bounded LRU of per-IP hourly and daily counters for a warm Lambda container"""
+    
+    def __init__(self, max_entries: int = None):
+        """
+        Initialize the cache
+        
+        Args:
+            max_entries: Maximum number of IP addresses to keep
+        """
+        self.max_entries = max_entries or RATE_LIMIT_CACHE_SIZE
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_counts(self, ip_address: str, hour_key: str, day_key: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get cached counters for the current windows
+        
+        A counter recorded under an older hour or day key has expired with its
+        window and is reported as unknown.
+        
+        Args:
+            ip_address: Client IP address
+            hour_key: Current hourly rate limit key
+            day_key: Current daily rate limit key
+            
+        Returns:
+            Tuple of (hourly_count, daily_count), None where unknown
+        """
+        with self._lock:
+            entry = self._entries.get(ip_address)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(ip_address)
+            hourly_count = entry.get('hourly_count') if entry.get('hour_key') == hour_key else None
+            daily_count = entry.get('daily_count') if entry.get('day_key') == day_key else None
+            return hourly_count, daily_count
+    
+    def set_counts(self, ip_address: str, hour_key: str, hourly_count: Optional[int], day_key: str, daily_count: Optional[int]):
+        """
+        Record counters for an IP address, evicting the least recently used entry when full
+        
+        Args:
+            ip_address: Client IP address
+            hour_key: Current hourly rate limit key
+            hourly_count: Known hourly count, or None to keep the cached value
+            day_key: Current daily rate limit key
+            daily_count: Known daily count, or None to keep the cached value
+        """
+        with self._lock:
+            entry = self._entries.get(ip_address, {})
+            if hourly_count is None and entry.get('hour_key') == hour_key:
+                hourly_count = entry.get('hourly_count')
+            if daily_count is None and entry.get('day_key') == day_key:
+                daily_count = entry.get('daily_count')
+            
+            self._entries[ip_address] = {
+                'hour_key': hour_key,
+                'hourly_count': hourly_count,
+                'day_key': day_key,
+                'daily_count': daily_count
+            }
+            self._entries.move_to_end(ip_address)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def block(self, ip_address: str, blocked_until: float, message: str):
+        """
+        Reject an IP address locally until a point in time
+        
+        Args:
+            ip_address: Client IP address
+            blocked_until: Epoch seconds at which the block lapses
+            message: Rate limit message to return while blocked
+        """
+        with self._lock:
+            self._entries[ip_address] = {'blocked_until': blocked_until, 'message': message}
+            self._entries.move_to_end(ip_address)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_block(self, ip_address: str) -> Optional[str]:
+        """
+        Get the rate limit message for a locally blocked IP address
+        
+        Args:
+            ip_address: Client IP address
+            
+        Returns:
+            Rate limit message, or None if the IP is not blocked
+        """
+        with self._lock:
+            entry = self._entries.get(ip_address)
+            if not entry or entry.get('blocked_until', 0) <= time.time():
+                return None
+            self._entries.move_to_end(ip_address)
+            return entry['message']
+    
+    def increment(self, ip_address: str, hour_key: str, day_key: str):
+        """
+        Add one submission to the known counters of an IP address
+        
+        Args:
+            ip_address: Client IP address
+            hour_key: Current hourly rate limit key
+            day_key: Current daily rate limit key
+        """
+        hourly_count, daily_count = self.get_counts(ip_address, hour_key, day_key)
+        self.set_counts(
+            ip_address,
+            hour_key, hourly_count + 1 if hourly_count is not None else None,
+            day_key, daily_count + 1 if daily_count is not None else None
+        )
+
+class RateLimiter:
+    """Rate limiting class for managing submission limits per IP address"""
+    
+    def __init__(self, table_name: str = None, hourly_limit: int = None, daily_limit: int = None, mode: str = None,
+                 cache_size: int = None, write_behind: bool = None, algorithm: str = None):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            table_name: DynamoDB table name for storing rate limit data
+            hourly_limit: Maximum submissions per IP per hour
+            daily_limit: Maximum submissions per IP per day
+            mode: 'atomic' (single conditional write) or 'read_write' (legacy)
+            cache_size: Warm-container cache size (0 disables the cache)
+            write_behind: Decide known IPs locally and flush increments in batches
+            algorithm: 'fixed_window' (hourly/daily items) or 'token_bucket' (one item per IP)
+        """
+        self.table_name = table_name or RATE_LIMIT_TABLE_NAME
+        self.hourly_limit = hourly_limit or MAX_SUBMISSIONS_PER_IP_PER_HOUR
+        self.daily_limit = daily_limit or MAX_SUBMISSIONS_PER_IP_PER_DAY
+        self.mode = (mode or RATE_LIMIT_MODE).lower()
+        
+        if self.mode not in RATE_LIMIT_MODES:
+            logger.warning(f"Unknown rate limit mode '{self.mode}', falling back to 'atomic'")
+            self.mode = 'atomic'
+        
+        self.algorithm = (algorithm or RATE_LIMIT_ALGORITHM).lower()
+        if self.algorithm not in RATE_LIMIT_ALGORITHMS:
+            logger.warning(f"Unknown rate limit algorithm '{self.algorithm}', falling back to 'fixed_window'")
+            self.algorithm = 'fixed_window'
+        
+        cache_size = RATE_LIMIT_CACHE_SIZE if cache_size is None else cache_size
+        self.cache = LocalRateLimitCache(cache_size) if cache_size > 0 else None
+        self.write_behind = (RATE_LIMIT_WRITE_BEHIND if write_behind is None else write_behind) and self.cache is not None
+        if self.write_behind and self.algorithm == 'token_bucket':
+            logger.warning("Write-behind is not supported by the token bucket algorithm, disabling it")
+            self.write_behind = False
+        self._pending = {}
+        self._pending_count = 0
+        self._pending_lock = threading.Lock()
+        self._last_flush = time.time()
+        
+        self._table = None
+    
+    @property
+    def table(self):
+        """DynamoDB table handle, created on first use so cached rejections skip boto3 entirely"""
+        if self._table is None:
+            try:
+                self._table = get_table(self.table_name)
+            except Exception as e:
+                logger.error(f"Failed to initialize DynamoDB table {self.table_name}: {str(e)}")
+        return self._table
+    
+    def _get_rate_limit_keys(self, ip_address: str) -> Tuple[str, str]:
+        """
+        Generate rate limiting keys for hourly and daily tracking
+        
+        Args:
+            ip_address: Client IP address
+            
+        Returns:
+            Tuple of (hourly_key, daily_key)
+        """
+        current_time = datetime.now()
+        hour_key = f"{ip_address}_{current_time.strftime('%Y%m%d%H')}"
+        day_key = f"{ip_address}_{current_time.strftime('%Y%m%d')}"
+        return hour_key, day_key
+    
+    def _get_submission_count(self, rate_limit_key: str) -> int:
+        """
+        Get current submission count for a rate limit key
+        
+        Args:
+            rate_limit_key: The rate limiting key to check
+            
+        Returns:
+            Current submission count
+        """
+        try:
+            response = self.table.get_item(Key={'rate_limit_key': rate_limit_key})
+            return response.get('Item', {}).get('submission_count', 0)
+        except Exception as e:
+            logger.error(f"Error getting submission count for key {rate_limit_key}: {str(e)}")
+            return 0
+    
+    def _update_submission_count(self, rate_limit_key: str, new_count: int, expires_at: int, ip_address: str) -> bool:
+        """
+        Update submission count for a rate limit key
+        
+        Args:
+            rate_limit_key: The rate limiting key to update
+            new_count: New submission count
+            expires_at: TTL timestamp for automatic cleanup
+            ip_address: Client IP address
+            
+        Returns:
+            True if update successful, False otherwise
+        """
+        try:
+            self.table.put_item(
+                Item={
+                    'rate_limit_key': rate_limit_key,
+                    'submission_count': new_count,
+                    'ip_address': ip_address,
+                    'expires_at': expires_at,
+                    'last_updated': datetime.now().isoformat()
+                }
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error updating submission count for key {rate_limit_key}: {str(e)}")
+            return False
+    
+    def _hourly_limit_message(self, ip_address: str, hourly_count: int) -> str:
+        """Log and build the hourly limit violation message"""
+        logger.warning(f"Hourly rate limit exceeded for IP {ip_address}: {hourly_count}/{self.hourly_limit}")
+        return f"Too many submissions this hour ({hourly_count}/{self.hourly_limit}). Please wait before submitting again."
+    
+    def _daily_limit_message(self, ip_address: str, daily_count: int) -> str:
+        """Log and build the daily limit violation message"""
+        logger.warning(f"Daily rate limit exceeded for IP {ip_address}: {daily_count}/{self.daily_limit}")
+        return f"Daily submission limit reached ({daily_count}/{self.daily_limit}). Please try again tomorrow."
+    
+    def _get_window_expiry(self) -> Tuple[int, int]:
+        """
+        Get TTL timestamps for hourly and daily counters written now
+        
+        Returns:
+            Tuple of (hourly_expires, daily_expires)
+        """
+        current_time = datetime.now()
+        hourly_expires = int((current_time + timedelta(hours=2)).timestamp())
+        daily_expires = int((current_time + timedelta(days=2)).timestamp())
+        return hourly_expires, daily_expires
+    
+    def _build_increment(self, rate_limit_key: str, limit: int, expires_at: int, ip_address: str, updated_at: str) -> dict:
+        """
+        Build a conditional increment for one window of a TransactWriteItems call
+        
+        Args:
+            rate_limit_key: The rate limiting key to increment
+            limit: Maximum count allowed before the increment
+            expires_at: TTL timestamp for automatic cleanup
+            ip_address: Client IP address
+            updated_at: ISO timestamp of this submission
+            
+        Returns:
+            Update entry for transact_write_items on the table resource's client,
+            which serializes plain Python values itself
+        """
+        return {
+            'Update': {
+                'TableName': self.table_name,
+                'Key': {'rate_limit_key': rate_limit_key},
+                'UpdateExpression': 'SET ip_address = :ip, expires_at = :expires, last_updated = :now ADD submission_count :one',
+                'ConditionExpression': 'attribute_not_exists(submission_count) OR submission_count < :limit',
+                'ExpressionAttributeValues': {
+                    ':ip': ip_address,
+                    ':expires': expires_at,
+                    ':now': updated_at,
+                    ':one': 1,
+                    ':limit': limit
+                },
+                'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+            }
+        }
+    
+    def _count_from_cancellation(self, reason: dict, limit: int) -> int:
+        """
+        Extract the stored submission count from a transaction cancellation reason
+        
+        Args:
+            reason: CancellationReasons entry for the failed window
+            limit: Limit of that window, used when the item is not returned
+            
+        Returns:
+            Submission count stored for the window
+        """
+        try:
+            return int(reason['Item']['submission_count']['N'])
+        except (KeyError, TypeError, ValueError):
+            return limit
+    
+    def _check_rate_limit_atomic(self, ip_address: str, hour_key: str, day_key: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check and increment hourly and daily counters in one round trip
+        
+        Both windows are updated in a single TransactWriteItems call guarded by
+        `submission_count < limit` conditions, so concurrent submissions from the
+        same IP can neither lose increments nor slip past the limit.
+        
+        Args:
+            ip_address: Client IP address to check
+            hour_key: Current hourly rate limit key
+            day_key: Current daily rate limit key
+            
+        Returns:
+            Tuple of (is_allowed, error_message)
+        """
+        hourly_expires, daily_expires = self._get_window_expiry()
+        updated_at = datetime.now().isoformat()
+        
+        transact_items = [
+            self._build_increment(hour_key, self.hourly_limit, hourly_expires, ip_address, updated_at),
+            self._build_increment(day_key, self.daily_limit, daily_expires, ip_address, updated_at)
+        ]
+        
+        for attempt in range(1, MAX_TRANSACTION_ATTEMPTS + 1):
+            try:
+                self.table.meta.client.transact_write_items(TransactItems=transact_items)
+                if self.cache:
+                    self.cache.increment(ip_address, hour_key, day_key)
+                logger.debug("Rate limit check passed for IP %s (atomic)", ip_address)
+                return True, None
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'TransactionCanceledException':
+                    raise
+                
+                reasons = e.response.get('CancellationReasons') or []
+                hourly_reason = reasons[0] if len(reasons) > 0 else {}
+                daily_reason = reasons[1] if len(reasons) > 1 else {}
+                
+                if hourly_reason.get('Code') == 'ConditionalCheckFailed':
+                    hourly_count = self._count_from_cancellation(hourly_reason, self.hourly_limit)
+                    if self.cache:
+                        self.cache.set_counts(ip_address, hour_key, hourly_count, day_key, None)
+                    return False, self._hourly_limit_message(ip_address, hourly_count)
+                
+                if daily_reason.get('Code') == 'ConditionalCheckFailed':
+                    daily_count = self._count_from_cancellation(daily_reason, self.daily_limit)
+                    if self.cache:
+                        self.cache.set_counts(ip_address, hour_key, None, day_key, daily_count)
+                    return False, self._daily_limit_message(ip_address, daily_count)
+                
+                # Another submission from the same IP touched the same items; retry
+                logger.warning(f"Rate limit transaction conflict for IP {ip_address} (attempt {attempt}/{MAX_TRANSACTION_ATTEMPTS})")
+        
+        raise Exception(f"Rate limit transaction kept conflicting for IP {ip_address}")
+    
+    def _get_bucket_key(self, ip_address: str) -> str:
+        """
+        Generate the single token bucket key for an IP address
+        
+        Args:
+            ip_address: Client IP address
+            
+        Returns:
+            Token bucket rate limit key
+        """
+        return f"{ip_address}_bucket"
+    
+    def _refill_tokens(self, item: Optional[dict], now: float) -> Tuple[float, float]:
+        """
+        Compute the hourly and daily tokens available at a point in time
+        
+        Args:
+            item: Stored token bucket item (None if the IP has no bucket yet)
+            now: Current epoch seconds
+            
+        Returns:
+            Tuple of (hourly_tokens, daily_tokens)
+        """
+        if not item:
+            return float(self.hourly_limit), float(self.daily_limit)
+        
+        elapsed = max(0.0, now - int(item.get('refilled_at', 0)) / 1000)
+        hourly_tokens = min(float(self.hourly_limit), float(item.get('hourly_tokens', 0)) + elapsed * self.hourly_limit / HOUR_SECONDS)
+        daily_tokens = min(float(self.daily_limit), float(item.get('daily_tokens', 0)) + elapsed * self.daily_limit / DAY_SECONDS)
+        return hourly_tokens, daily_tokens
+    
+    def _check_token_bucket(self, ip_address: str) -> Tuple[bool, Optional[str]]:
+        """
+        Take one token from the IP's hourly and daily buckets
+        
+        The bucket lives in a single item holding both token counts, the
+        refill timestamp and a version number. Refill is computed on read and
+        the new state is written with the next version, on condition that the
+        stored version is still the one that was read, so concurrent
+        submissions retry instead of overwriting each other (two reads in the
+        same millisecond share a timestamp, never a version).
+        
+        Args:
+            ip_address: Client IP address to check
+            
+        Returns:
+            Tuple of (is_allowed, error_message)
+        """
+        bucket_key = self._get_bucket_key(ip_address)
+        
+        for attempt in range(1, MAX_TRANSACTION_ATTEMPTS + 1):
+            now = time.time()
+            item = self.table.get_item(Key={'rate_limit_key': bucket_key}, ConsistentRead=True).get('Item')
+            hourly_tokens, daily_tokens = self._refill_tokens(item, now)
+            
+            if hourly_tokens < 1:
+                message = self._hourly_limit_message(ip_address, self.hourly_limit - int(hourly_tokens))
+                if self.cache:
+                    self.cache.block(ip_address, now + (1 - hourly_tokens) * HOUR_SECONDS / self.hourly_limit, message)
+                return False, message
+            
+            if daily_tokens < 1:
+                message = self._daily_limit_message(ip_address, self.daily_limit - int(daily_tokens))
+                if self.cache:
+                    self.cache.block(ip_address, now + (1 - daily_tokens) * DAY_SECONDS / self.daily_limit, message)
+                return False, message
+            
+            version = int(item.get('version', 0)) if item else 0
+            new_item = {
+                'rate_limit_key': bucket_key,
+                'hourly_tokens': Decimal(str(round(hourly_tokens - 1, 6))),
+                'daily_tokens': Decimal(str(round(daily_tokens - 1, 6))),
+                'refilled_at': int(now * 1000),
+                'version': version + 1,
+                'ip_address': ip_address,
+                'expires_at': int(now + 2 * DAY_SECONDS),
+                'last_updated': datetime.now().isoformat()
+            }
+            
+            try:
+                if item and 'version' in item:
+                    self.table.put_item(
+                        Item=new_item,
+                        ConditionExpression='#version = :version',
+                        ExpressionAttributeNames={'#version': 'version'},
+                        ExpressionAttributeValues={':version': version}
+                    )
+                elif item:
+                    # Bucket written before versions were added; the first write gives it one
+                    self.table.put_item(
+                        Item=new_item,
+                        ConditionExpression='attribute_not_exists(#version) AND refilled_at = :previous',
+                        ExpressionAttributeNames={'#version': 'version'},
+                        ExpressionAttributeValues={':previous': item.get('refilled_at')}
+                    )
+                else:
+                    self.table.put_item(Item=new_item, ConditionExpression='attribute_not_exists(rate_limit_key)')
+                
+                logger.debug("Rate limit check passed for IP %s (token bucket): %.2f hourly and %.2f daily tokens left", ip_address, hourly_tokens - 1, daily_tokens - 1)
+                return True, None
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                    raise
+                logger.warning(f"Token bucket conflict for IP {ip_address} (attempt {attempt}/{MAX_TRANSACTION_ATTEMPTS})")
+        
+        raise Exception(f"Token bucket update kept conflicting for IP {ip_address}")
+    
+    def _get_submission_counts(self, hour_key: str, day_key: str) -> Tuple[int, int]:
+        """
+        Get hourly and daily submission counts in a single BatchGetItem call
+        
+        Args:
+            hour_key: Hourly rate limit key
+            day_key: Daily rate limit key
+            
+        Returns:
+            Tuple of (hourly_count, daily_count)
+        """
+        response = get_dynamodb().batch_get_item(
+            RequestItems={
+                self.table_name: {
+                    'Keys': [{'rate_limit_key': hour_key}, {'rate_limit_key': day_key}],
+                    'ProjectionExpression': 'rate_limit_key, submission_count'
+                }
+            }
+        )
+        counts = {
+            item['rate_limit_key']: int(item.get('submission_count', 0))
+            for item in response.get('Responses', {}).get(self.table_name, [])
+        }
+        return counts.get(hour_key, 0), counts.get(day_key, 0)
+    
+    def _check_rate_limit_write_behind(self, ip_address: str, hour_key: str, day_key: str,
+                                       hourly_count: Optional[int], daily_count: Optional[int]) -> Tuple[bool, Optional[str]]:
+        """
+        Decide locally and queue the increments for a batched flush
+        
+        Counters are loaded from DynamoDB once per window for an IP this container
+        has not seen; after that the container's own view is used. Submissions
+        landing on other containers are only picked up when the window rolls over,
+        so limits are enforced per container between flushes.
+        
+        Args:
+            ip_address: Client IP address to check
+            hour_key: Current hourly rate limit key
+            day_key: Current daily rate limit key
+            hourly_count: Cached hourly count (None if unknown)
+            daily_count: Cached daily count (None if unknown)
+            
+        Returns:
+            Tuple of (is_allowed, error_message)
+        """
+        if hourly_count is None or daily_count is None:
+            stored_hourly, stored_daily = self._get_submission_counts(hour_key, day_key)
+            with self._pending_lock:
+                pending_hourly = self._pending.get(hour_key, {}).get('delta', 0)
+                pending_daily = self._pending.get(day_key, {}).get('delta', 0)
+            if hourly_count is None:
+                hourly_count = stored_hourly + pending_hourly
+            if daily_count is None:
+                daily_count = stored_daily + pending_daily
+            self.cache.set_counts(ip_address, hour_key, hourly_count, day_key, daily_count)
+        
+        if hourly_count >= self.hourly_limit:
+            return False, self._hourly_limit_message(ip_address, hourly_count)
+        if daily_count >= self.daily_limit:
+            return False, self._daily_limit_message(ip_address, daily_count)
+        
+        self.cache.set_counts(ip_address, hour_key, hourly_count + 1, day_key, daily_count + 1)
+        hourly_expires, daily_expires = self._get_window_expiry()
+        self._queue_increment(hour_key, hourly_expires, ip_address)
+        self._queue_increment(day_key, daily_expires, ip_address)
+        
+        logger.debug("Rate limit check passed for IP %s (write-behind): hourly %d/%d, daily %d/%d", ip_address, hourly_count + 1, self.hourly_limit, daily_count + 1, self.daily_limit)
+        return True, None
+    
+    def _queue_increment(self, rate_limit_key: str, expires_at: int, ip_address: str):
+        """
+        Queue one increment for a rate limit key; flush_if_due() writes it later
+        
+        Args:
+            rate_limit_key: The rate limiting key to increment
+            expires_at: TTL timestamp for automatic cleanup
+            ip_address: Client IP address
+        """
+        with self._pending_lock:
+            pending = self._pending.setdefault(rate_limit_key, {'delta': 0})
+            pending['delta'] += 1
+            pending['expires_at'] = expires_at
+            pending['ip_address'] = ip_address
+            self._pending_count += 1
+    
+    def flush(self) -> int:
+        """
+        Write queued increments to DynamoDB, one ADD update per rate limit key
+        
+        Increments that fail to write are put back on the queue.
+        
+        Returns:
+            Number of rate limit keys written
+        """
+        with self._pending_lock:
+            batch = self._pending
+            self._pending = {}
+            self._pending_count = 0
+            self._last_flush = time.time()
+        
+        written = 0
+        updated_at = datetime.now().isoformat()
+        for rate_limit_key, pending in batch.items():
+            try:
+                self.table.update_item(
+                    Key={'rate_limit_key': rate_limit_key},
+                    UpdateExpression='SET ip_address = :ip, expires_at = :expires, last_updated = :now ADD submission_count :delta',
+                    ExpressionAttributeValues={
+                        ':ip': pending['ip_address'],
+                        ':expires': pending['expires_at'],
+                        ':now': updated_at,
+                        ':delta': pending['delta']
+                    }
+                )
+                written += 1
+            except Exception as e:
+                logger.error(f"Error flushing rate limit counter {rate_limit_key}: {str(e)}")
+                with self._pending_lock:
+                    requeued = self._pending.setdefault(rate_limit_key, {'delta': 0})
+                    requeued['delta'] += pending['delta']
+                    requeued['expires_at'] = pending['expires_at']
+                    requeued['ip_address'] = pending['ip_address']
+                    self._pending_count += pending['delta']
+        
+        if written:
+            logger.info(f"Flushed {written} rate limit counters to DynamoDB")
+        return written
+    
+    def flush_if_due(self) -> int:
+        """
+        Write the queued increments once a batch is full or the interval has passed
+        
+        Called at the end of every request. Lambda freezes the container when
+        the handler returns, so the write happens in the request rather than
+        on a background thread; it is paid once per batch, not per request.
+        Does nothing without write-behind.
+        
+        Returns:
+            Number of rate limit keys written by this call
+        """
+        if not self.write_behind:
+            return 0
+        
+        with self._pending_lock:
+            due = self._pending_count and (
+                self._pending_count >= RATE_LIMIT_FLUSH_BATCH_SIZE or
+                time.time() - self._last_flush >= RATE_LIMIT_FLUSH_INTERVAL
+            )
+        return self.flush() if due else 0
+    
+    def check_rate_limit(self, ip_address: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check if IP address has exceeded rate limits
+        
+        Args:
+            ip_address: Client IP address to check
+            
+        Returns:
+            Tuple of (is_allowed, error_message)
+            - is_allowed: True if request is allowed, False if rate limited
+            - error_message: Description of rate limit violation (None if allowed)
+        """
+        if not ip_address or ip_address == 'unknown':
+            logger.warning("Unknown IP address, allowing request")
+            return True, None
+        
+        try:
+            # IPs this container already knows to be over a limit cost no
+            # network call, and are answered before the table is opened
+            if self.algorithm == 'token_bucket':
+                if self.cache:
+                    cached_message = self.cache.get_block(ip_address)
+                    if cached_message:
+                        logger.warning(f"Rate limit exceeded for IP {ip_address} (cached)")
+                        return False, cached_message
+            else:
+                hour_key, day_key = self._get_rate_limit_keys(ip_address)
+                if self.cache:
+                    cached_hourly, cached_daily = self.cache.get_counts(ip_address, hour_key, day_key)
+                    if cached_hourly is not None and cached_hourly >= self.hourly_limit:
+                        return False, self._hourly_limit_message(ip_address, cached_hourly)
+                    if cached_daily is not None and cached_daily >= self.daily_limit:
+                        return False, self._daily_limit_message(ip_address, cached_daily)
+            
+            if not self.table:
+                logger.warning("Rate limiting table not available, allowing request")
+                return True, None
+            
+            if self.algorithm == 'token_bucket':
+                return self._check_token_bucket(ip_address)
+            
+            if self.cache and self.write_behind:
+                return self._check_rate_limit_write_behind(ip_address, hour_key, day_key, cached_hourly, cached_daily)
+            
+            if self.mode == 'atomic':
+                return self._check_rate_limit_atomic(ip_address, hour_key, day_key)
+            
+            # Check hourly limit
+            hourly_count = self._get_submission_count(hour_key)
+            if hourly_count >= self.hourly_limit:
+                if self.cache:
+                    self.cache.set_counts(ip_address, hour_key, hourly_count, day_key, None)
+                return False, self._hourly_limit_message(ip_address, hourly_count)
+            
+            # Check daily limit
+            daily_count = self._get_submission_count(day_key)
+            if daily_count >= self.daily_limit:
+                if self.cache:
+                    self.cache.set_counts(ip_address, hour_key, hourly_count, day_key, daily_count)
+                return False, self._daily_limit_message(ip_address, daily_count)
+            
+            # Update counters
+            hourly_expires, daily_expires = self._get_window_expiry()
+            
+            hourly_updated = self._update_submission_count(hour_key, hourly_count + 1, hourly_expires, ip_address)
+            daily_updated = self._update_submission_count(day_key, daily_count + 1, daily_expires, ip_address)
+            
+            if not (hourly_updated and daily_updated):
+                logger.error(f"Failed to update rate limit counters for IP {ip_address}")
+                # Still allow the request if we can't update counters
+            
+            if self.cache:
+                self.cache.set_counts(ip_address, hour_key, hourly_count + 1, day_key, daily_count + 1)
+            
+            logger.debug("Rate limit check passed for IP %s: hourly %d/%d, daily %d/%d", ip_address, hourly_count + 1, self.hourly_limit, daily_count + 1, self.daily_limit)
+            return True, None
+            
+        except Exception as e:
+            logger.error(f"Rate limiting error for IP {ip_address}: {str(e)}")
+            # Fail open - allow request if rate limiting fails
+            return True, None
+    
+    def get_rate_limit_status(self, ip_address: str) -> dict:
+        """
+        Get current rate limit status for an IP address
+        
+        Args:
+            ip_address: Client IP address
+            
+        Returns:
+            Dictionary with current usage and limits
+        """
+        if not self.table or not ip_address or ip_address == 'unknown':
+            return {
+                'hourly_usage': 0,
+                'daily_usage': 0,
+                'hourly_limit': self.hourly_limit,
+                'daily_limit': self.daily_limit
+            }
+        
+        try:
+            if self.algorithm == 'token_bucket':
+                item = self.table.get_item(Key={'rate_limit_key': self._get_bucket_key(ip_address)}).get('Item')
+                hourly_tokens, daily_tokens = self._refill_tokens(item, time.time())
+                hourly_count = self.hourly_limit - int(hourly_tokens)
+                daily_count = self.daily_limit - int(daily_tokens)
+            else:
+                hour_key, day_key = self._get_rate_limit_keys(ip_address)
+                hourly_count = self._get_submission_count(hour_key)
+                daily_count = self._get_submission_count(day_key)
+            
+            return {
+                'hourly_usage': hourly_count,
+                'daily_usage': daily_count,
+                'hourly_limit': self.hourly_limit,
+                'daily_limit': self.daily_limit,
+                'hourly_remaining': max(0, self.hourly_limit - hourly_count),
+                'daily_remaining': max(0, self.daily_limit - daily_count)
+            }
+        except Exception as e:
+            logger.error(f"Error getting rate limit status for IP {ip_address}: {str(e)}")
+            return {
+                'hourly_usage': 0,
+                'daily_usage': 0,
+                'hourly_limit': self.hourly_limit,
+                'daily_limit': self.daily_limit
+            }
+
+# Shared limiters so table handles and local caches survive across warm invocations
+_rate_limiters = {}
+
+def get_rate_limiter(table_name: str = None) -> RateLimiter:
+    """
+    Get the container-wide rate limiter for a table, creating it on first use
+    
+    Args:
+        table_name: DynamoDB rate limit table (defaults to RATE_LIMIT_TABLE)
+        
+    Returns:
+        Shared RateLimiter instance
+    """
+    table_name = table_name or RATE_LIMIT_TABLE_NAME
+    if table_name not in _rate_limiters:
+        _rate_limiters[table_name] = RateLimiter(table_name)
+    return _rate_limiters[table_name]
+
+# Convenience functions for easy import
+def check_rate_limit(ip_address: str, table_name: str = None) -> Tuple[bool, Optional[str]]:
+    """
+    Simple function to check rate limit for an IP address
+    
+    Args:
+        ip_address: Client IP address
+        table_name: DynamoDB rate limit table (defaults to RATE_LIMIT_TABLE)
+        
+    Returns:
+        Tuple of (is_allowed, error_message)
+    """
+    return get_rate_limiter(table_name).check_rate_limit(ip_address)
+
+def flush_rate_limit_counters(table_name: str = None, force: bool = False) -> int:
+    """
+    Write increments queued by write-behind mode when a flush is due
+    
+    Args:
+        table_name: DynamoDB rate limit table (defaults to RATE_LIMIT_TABLE)
+        force: Write whatever is queued, due or not
+        
+    Returns:
+        Number of rate limit keys written
+    """
+    limiter = get_rate_limiter(table_name)
+    return limiter.flush() if force else limiter.flush_if_due()
+
+def get_rate_limit_status(ip_address: str, table_name: str = None) -> dict:
+    """
+    Simple function to get rate limit status for an IP address
+    
+    Args:
+        ip_address: Client IP address
+        table_name: DynamoDB rate limit table (defaults to RATE_LIMIT_TABLE)
+        
+    Returns:
+        Dictionary with current usage and limits
+    """
+    return get_rate_limiter(table_name).get_rate_limit_status(ip_address)
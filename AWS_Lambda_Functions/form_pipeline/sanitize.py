@@ -0,0 +1,98 @@
+# AWS_Lambda_Functions/form_pipeline/sanitize.py
+"""
+Precompiled input sanitisers for the form Lambdas
+
+Each form used to run its own chain of uncompiled re.sub calls on every
+field: tag stripping, dangerous-attribute removal, control characters,
+whitespace. A Sanitizer compiles that chain once per container and gives
+every step a cheap guard: a character that each match must contain, or
+for control characters str.isprintable(). Ordinary text fails the guards,
+so most fields only pay for a few `in` checks and the whitespace pass.
+Output is the same, byte for byte, as the chain it replaces
+(benchmark_sanitizer.py checks this on a golden corpus).
+"""
+import re
+from typing import Iterable, Optional, Tuple, Union
+
+# Removal patterns the forms share, each paired with a character every match
+# contains; a value without that character cannot match and is not scanned
+JAVASCRIPT_URL = (r'javascript:', ':')
+EVENT_HANDLER = (r'on\w+\s*=', '=')
+STYLE_ATTRIBUTE = (r'style\s*=', '=')
+
+# Removed by the forms that strip control characters (keeps \t, \n and \r)
+CONTROL_CHARACTERS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+# 'lines' whitespace: the same result as [ \t]+ -> ' ' and \n+ -> '\n', but single
+# spaces are never matched, so ordinary prose costs no replacements at all
+_BLANK_RUN_PATTERN = re.compile(r' [ \t]+|\t[ \t]*')
+_NEWLINE_RUN_PATTERN = re.compile(r'\n{2,}')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class Sanitizer:
+    """
+    One form's sanitising chain, compiled once
+
+    Applied in order: tag stripping, each removal pattern, control
+    characters, whitespace normalisation. Calling the sanitizer also
+    strips leading and trailing whitespace.
+    """
+
+    def __init__(self, tag_pattern: Optional[str] = r'<[^>]*>',
+                 remove_patterns: Iterable[Union[str, Tuple[str, str]]] = (),
+                 strip_control_characters: bool = False, whitespace: Optional[str] = None):
+        """
+        Args:
+            tag_pattern: HTML tag pattern starting with '<', or None to keep tags
+            remove_patterns: Patterns removed case-insensitively, one after another.
+                A (pattern, character) pair only runs on values containing the character.
+            strip_control_characters: Remove CONTROL_CHARACTERS
+            whitespace: None to leave whitespace alone, 'lines' to collapse runs of
+                spaces/tabs and of newlines separately (keeps line breaks), or
+                'collapse' to turn every whitespace run into one space
+        """
+        if whitespace not in (None, 'lines', 'collapse'):
+            raise ValueError(f"Unknown whitespace mode: {whitespace}")
+        if tag_pattern and not tag_pattern.startswith('<'):
+            raise ValueError("tag_pattern must start with '<'")
+
+        self.whitespace = whitespace
+        self.strip_control_characters = strip_control_characters
+        self._removals = []
+
+        if tag_pattern:
+            self._removals.append((re.compile(tag_pattern), '<'))
+        for pattern in remove_patterns:
+            pattern, required = (pattern, None) if isinstance(pattern, str) else pattern
+            self._removals.append((re.compile(pattern, re.IGNORECASE), required))
+
+    def _remove(self, value: str) -> str:
+        # Each guard is checked against the value as the earlier steps left it
+        for pattern, required in self._removals:
+            if required is None or required in value:
+                value = pattern.sub('', value)
+
+        # Control characters are never printable, so printable text skips the scan
+        if self.strip_control_characters and not value.isprintable():
+            value = CONTROL_CHARACTERS.sub('', value)
+        return value
+
+    def clean(self, value: str) -> str:
+        """Run the chain without the final strip()"""
+        value = self._remove(value)
+
+        if self.whitespace == 'lines':
+            if '  ' in value or '\t' in value:
+                value = _BLANK_RUN_PATTERN.sub(' ', value)
+            if '\n\n' in value:
+                value = _NEWLINE_RUN_PATTERN.sub('\n', value)
+        elif self.whitespace == 'collapse':
+            value = _WHITESPACE_PATTERN.sub(' ', value)
+        return value
+
+    def __call__(self, value: str) -> str:
+        if self.whitespace == 'collapse':
+            # split()/join() collapses and strips in one pass; it splits on the
+            # same characters as \s
+            return ' '.join(self._remove(value).split())
+        return self.clean(value).strip()
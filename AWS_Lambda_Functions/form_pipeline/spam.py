@@ -0,0 +1,202 @@
+# AWS_Lambda_Functions/form_pipeline/spam.py
+"""
+Precompiled spam detection shared by the form Lambdas
+
+Keyword lists and blocked domains are compiled once per container and each
+field is lowercased once, instead of once per keyword. Large keyword lists
+are matched with a single trie-shaped regex pass. Findings come back
+as scored SpamIndicator objects; str() of an indicator is the same message
+the per-form detectors have always logged.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+# Default weight per indicator kind; a form can override any of them
+DEFAULT_SPAM_WEIGHTS = {
+    'keyword': 1.0,
+    'domain': 3.0,
+    'urls': 2.0,
+    'repetition': 1.0,
+    'phone': 1.0,
+    'capitalization': 0.5,
+    'low_variety': 1.0,
+    'honeypot': 5.0,
+}
+
+@dataclass(frozen=True)
+class SpamIndicator:
+    """One spam finding"""
+    kind: str
+    message: str
+    score: float
+    field: Optional[str] = None
+    match: Optional[str] = None
+
+    def __str__(self):
+        return self.message
+
+@dataclass
+class SpamReport:
+    """All spam findings for one submission"""
+    indicators: List[SpamIndicator] = field(default_factory=list)
+
+    @property
+    def score(self) -> float:
+        return sum(indicator.score for indicator in self.indicators)
+
+    @property
+    def messages(self) -> List[str]:
+        return [indicator.message for indicator in self.indicators]
+
+    def __bool__(self):
+        return bool(self.indicators)
+
+    def __len__(self):
+        return len(self.indicators)
+
+    def __iter__(self):
+        return iter(self.indicators)
+
+# Above this many keywords one trie-shaped regex pass beats a substring scan per
+# keyword; below it CPython's `in` is faster (benchmark_spam_engine.py)
+REGEX_KEYWORD_THRESHOLD = 150
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex alternation that shares common prefixes and prefers the longest keyword"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """Finds every keyword present in a text, lowercasing it only once"""
+
+    def __init__(self, keywords: Iterable[str], regex_threshold: int = REGEX_KEYWORD_THRESHOLD):
+        # Keep the caller's order (and drop duplicates) so results read like the old loops
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+        self._order = {keyword: index for index, keyword in enumerate(self.keywords)}
+        self._pattern = None
+
+        if len(self.keywords) > regex_threshold:
+            # A zero-width lookahead tries every start position, so overlapping keywords
+            # are all seen. At one position only the longest keyword matches; shorter ones
+            # starting there are prefixes of it and are recovered from `_contained`.
+            self._pattern = re.compile('(?=(' + _trie_pattern(self.keywords) + '))')
+            self._contained = {
+                keyword: [other for other in self.keywords if other != keyword and keyword.startswith(other)]
+                for keyword in self.keywords
+            }
+
+    def find(self, text: str, lowered: bool = False) -> List[str]:
+        """Return the keywords found in text, in keyword-list order"""
+        if not text or not self.keywords:
+            return []
+        if not lowered:
+            text = text.lower()
+
+        if self._pattern is None:
+            return [keyword for keyword in self.keywords if keyword in text]
+
+        found = set()
+        for matched in set(self._pattern.findall(text)):
+            found.add(matched)
+            found.update(self._contained[matched])
+        return sorted(found, key=self._order.__getitem__)
+
+class DomainMatcher:
+    """Matches an email address against blocked domains"""
+
+    def __init__(self, domains: Iterable[str], match: str = 'exact'):
+        """
+        Args:
+            domains: Blocked domains
+            match: 'exact' compares the domain after '@'; 'contains' looks for
+                each blocked domain anywhere in the address
+        """
+        self.domains = list(dict.fromkeys(domain.lower() for domain in domains if domain))
+        self.match = match
+        self._domain_set = frozenset(self.domains)
+
+    def find(self, email: str) -> List[str]:
+        """Return the blocked domains matched by email"""
+        if not email or not self.domains:
+            return []
+        email = email.lower()
+
+        if self.match == 'contains':
+            return [domain for domain in self.domains if domain in email]
+
+        domain = email.split('@')[-1] if '@' in email else ''
+        return [domain] if domain in self._domain_set else []
+
+class SpamEngine:
+    """
+    Compiled keyword and domain rules plus scoring for one form
+
+    Form-specific heuristics (URL counts, repetition, ...) add their own
+    findings through indicator() so everything is scored the same way.
+    """
+
+    def __init__(self, keywords: Iterable[str] = (), blocked_domains: Iterable[str] = (),
+                 keyword_fields: Iterable[str] = (), domain_match: str = 'exact',
+                 weights: Optional[Dict[str, float]] = None, messages: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            keywords: Spam keywords (matched case-insensitively)
+            blocked_domains: Disposable / suspicious email domains
+            keyword_fields: Form fields scanned for keywords
+            domain_match: 'exact' or 'contains' (see DomainMatcher)
+            weights: Score overrides per indicator kind
+            messages: Message templates for 'keyword' ({keyword}, {field}) and 'domain' ({domain})
+        """
+        self.keyword_matcher = KeywordMatcher(keywords)
+        self.domain_matcher = DomainMatcher(blocked_domains, domain_match)
+        self.keyword_fields = list(keyword_fields)
+        self.weights = {**DEFAULT_SPAM_WEIGHTS, **(weights or {})}
+        self.messages = {
+            'keyword': "Spam keyword '{keyword}' found in {field}",
+            'domain': "Suspicious email domain: {domain}",
+            **(messages or {})
+        }
+
+    def indicator(self, kind: str, message: str, field: str = None, match: str = None) -> SpamIndicator:
+        """Build a scored indicator of the given kind"""
+        return SpamIndicator(kind=kind, message=message, score=self.weights.get(kind, 1.0), field=field, match=match)
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Keywords present in one piece of text"""
+        return self.keyword_matcher.find(text)
+
+    def scan(self, form_data: dict) -> SpamReport:
+        """Check the email domain and every keyword field"""
+        report = SpamReport()
+
+        for domain in self.domain_matcher.find(str(form_data.get('email') or '')):
+            report.indicators.append(self.indicator(
+                'domain', self.messages['domain'].format(domain=domain), field='email', match=domain
+            ))
+
+        for field_name in self.keyword_fields:
+            if field_name not in form_data:
+                continue
+            for keyword in self.keyword_matcher.find(str(form_data[field_name])):
+                report.indicators.append(self.indicator(
+                    'keyword',
+                    self.messages['keyword'].format(keyword=keyword, field=field_name),
+                    field=field_name,
+                    match=keyword
+                ))
+
+        return report
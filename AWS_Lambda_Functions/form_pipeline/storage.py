@@ -0,0 +1,81 @@
+# AWS_Lambda_Functions/form_pipeline/storage.py
+import logging
+from botocore.exceptions import ClientError
+
+from .aws_clients import get_table
+from .ids import new_submission_id
+
+# Configure logging
+logger = logging.getLogger()
+
+# Metadata attributes copied onto every stored item when present
+DEFAULT_METADATA_ATTRIBUTES = {
+    'submittedAt': 'submittedAt',
+    'userAgent': 'userAgent',
+    'ipAddress': 'ipAddress',
+    # Only set by forms with a spam detector, and only when something was found
+    'spamIndicators': 'spamIndicators',
+    'spamScore': 'spamScore'
+}
+
+def from_field(name, default=''):
+    """Storage mapping source that reads one form field"""
+    return lambda form_data: form_data.get(name, default)
+
+def first_field(*names, default=''):
+    """Storage mapping source that reads the first non-empty of several form fields"""
+    def source(form_data):
+        for name in names:
+            if form_data.get(name):
+                return form_data[name]
+        return default
+    return source
+
+def full_name(form_data):
+    """Storage mapping source that joins firstName and lastName"""
+    return f"{form_data.get('firstName', '')} {form_data.get('lastName', '')}".strip()
+
+def build_item(form_data, schema, form_id, timestamp):
+    """Build the DynamoDB item for a submission from the schema's storage mapping"""
+    item = {
+        'formID': form_id,          # This is the partition key
+        'timestamp': timestamp,      # This is the sort key
+    }
+
+    # A plain string maps a form field of that name; callables compute the value
+    for attribute, source in schema.fields.items():
+        if callable(source):
+            item[attribute] = source(form_data)
+        else:
+            item[attribute] = form_data.get(source, '')
+
+    item['formType'] = schema.form_type
+    item['status'] = 'new'
+    item.update(schema.item_attributes)
+
+    # Add metadata if available
+    metadata = form_data.get('metadata') or {}
+    for metadata_key, attribute in schema.metadata_attributes.items():
+        if metadata.get(metadata_key):
+            item[attribute] = metadata[metadata_key]
+
+    return item
+
+def save_submission(form_data, schema):
+    """Save a form submission to the schema's DynamoDB table"""
+    table = get_table(schema.table_name)
+
+    # Unique, time-sortable submission ID and the millisecond timestamp it encodes
+    form_id, timestamp = new_submission_id(schema.id_prefix)
+
+    try:
+        item = build_item(form_data, schema, form_id, timestamp)
+
+        # Save to DynamoDB, never over an existing submission
+        table.put_item(Item=item, ConditionExpression='attribute_not_exists(formID)')
+        logger.debug("Saved %s to DynamoDB: %s", schema.label, form_id)
+        return form_id
+
+    except ClientError as e:
+        logger.error(f"DynamoDB error while saving {schema.label}: {e}")
+        raise Exception(f"Failed to save {schema.label}")
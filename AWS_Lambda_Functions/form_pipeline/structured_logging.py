@@ -0,0 +1,158 @@
+# AWS_Lambda_Functions/form_pipeline/structured_logging.py
+"""
+Structured, sampled logging for the form Lambdas
+
+Every request ends in one compact JSON record (form, status, duration,
+per-stage timings, form ID, spam score, email results) instead of a trail
+of INFO lines. Per-request detail is logged at DEBUG with %-style
+arguments, so nothing is formatted unless the record is emitted.
+
+Environment:
+    LOG_LEVEL           Root log level (default INFO)
+    LOG_FORMAT          'json' (default) or 'text' to keep the runtime's format
+    LOG_SAMPLE_RATES    Fraction of records kept per level, e.g. "DEBUG=0.05,INFO=0.5"
+                        (unlisted levels, and the request record, are always kept)
+    DEBUG_SAMPLE_RATE   Fraction of requests that log their full event and body
+"""
+import os
+import json
+import time
+import random
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger()
+
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'json').lower()
+DEBUG_SAMPLE_RATE = float(os.environ.get('DEBUG_SAMPLE_RATE', '0'))
+
+def parse_sample_rates(value):
+    """Parse "DEBUG=0.05,INFO=0.5" into {logging.DEBUG: 0.05, logging.INFO: 0.5}"""
+    rates = {}
+    for entry in filter(None, (part.strip() for part in value.split(','))):
+        level_name, _, rate = entry.partition('=')
+        level = logging.getLevelName(level_name.strip().upper())
+        if isinstance(level, int) and rate:
+            rates[level] = float(rate)
+    return rates
+
+LOG_SAMPLE_RATES = parse_sample_rates(os.environ.get('LOG_SAMPLE_RATES', ''))
+
+class LazyJson:
+    """Serialises its value only if the log record is actually formatted"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return json.dumps(self.value, default=str, separators=(',', ':'))
+
+class JsonFormatter(logging.Formatter):
+    """One compact JSON object per record; a record's `fields` extra is merged in"""
+
+    def format(self, record):
+        fields = getattr(record, 'fields', None)
+        if fields is not None:
+            # Structured records carry their data in fields, the message is just a name
+            entry = {'level': record.levelname, 'message': getattr(record, 'event_name', record.msg), **fields}
+        else:
+            entry = {'level': record.levelname, 'message': record.getMessage()}
+
+        request_id = getattr(record, 'aws_request_id', None)
+        if request_id:
+            entry['requestId'] = request_id
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, separators=(',', ':'))
+
+class LevelSampler(logging.Filter):
+    """Keeps a fraction of the records at each sampled level"""
+
+    def __init__(self, rates):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record):
+        rate = self.rates.get(record.levelno)
+        if rate is None or rate >= 1 or getattr(record, 'unsampled', False):
+            return True
+        return random.random() < rate
+
+_configured = False
+
+def configure_logging():
+    """Apply LOG_LEVEL, LOG_FORMAT and LOG_SAMPLE_RATES to the root logger, once per container"""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    if not root.handlers:
+        # Outside Lambda (scripts, local runs) there is no runtime handler
+        root.addHandler(logging.StreamHandler())
+
+    # The runtime formats JSON itself when the function's log format is JSON
+    use_json = LOG_FORMAT == 'json' and os.environ.get('AWS_LAMBDA_LOG_FORMAT', '').upper() != 'JSON'
+    sampler = LevelSampler(LOG_SAMPLE_RATES) if LOG_SAMPLE_RATES else None
+    for handler in root.handlers:
+        if use_json:
+            handler.setFormatter(JsonFormatter())
+        if sampler:
+            handler.addFilter(sampler)
+
+_cold_start = True
+
+class RequestLog:
+    """Timings and outcome of one request, emitted as a single record at the end"""
+
+    def __init__(self, form_type, context=None):
+        self.started = time.perf_counter()
+        self.timings = {}
+        self.fields = {'form': form_type}
+        request_id = getattr(context, 'aws_request_id', None)
+        if request_id:
+            self.fields['requestId'] = request_id
+        # Payload dumps are for a sample of requests only (or every request at DEBUG)
+        self.debug = logger.isEnabledFor(logging.DEBUG) or (
+            DEBUG_SAMPLE_RATE > 0 and random.random() < DEBUG_SAMPLE_RATE
+        )
+
+    @contextmanager
+    def timed(self, name):
+        """Record how long the block takes, in milliseconds, under name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    def set(self, **fields):
+        """Add fields to the request record"""
+        self.fields.update(fields)
+
+    def dump(self, label, payload):
+        """Log a full payload, only for requests picked for debug sampling"""
+        if self.debug:
+            logger.info('%s: %s', label, LazyJson(payload), extra={'unsampled': True})
+
+    def emit(self, status_code):
+        """Write the request record"""
+        global _cold_start
+        record = {
+            **self.fields,
+            'status': status_code,
+            'durationMs': round((time.perf_counter() - self.started) * 1000, 2),
+            'stagesMs': self.timings,
+            'coldStart': _cold_start,
+        }
+        _cold_start = False
+
+        level = logging.ERROR if status_code >= 500 else logging.INFO
+        # In text format the message is the record as JSON, built only when emitted
+        logger.log(level, '%s', LazyJson(record),
+                   extra={'fields': record, 'event_name': 'form_request', 'unsampled': True})
+        return record
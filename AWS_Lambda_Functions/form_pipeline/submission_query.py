@@ -0,0 +1,225 @@
+# AWS_Lambda_Functions/form_pipeline/submission_query.py
+"""
+Read side for form submissions: paginated queries on global secondary indexes
+
+Submissions are keyed by formID/timestamp, which only serves lookups of
+one submission. Listing them by type, status, date or sender needs these
+indexes on every submission table (create_submission_indexes.py adds them):
+
+    formType-timestamp-index  formType (S) / timestamp (N)   everything, newest first, by date
+    status-timestamp-index    status (S) / timestamp (N)     the inbox: 'new' submissions
+    email-timestamp-index     email (S) / timestamp (N)      one sender's submissions
+
+All three project ALL attributes, so a query never has to go back to the
+table. query_submissions() picks the index from the arguments, narrows by
+date in the key condition, applies the remaining filters server-side and
+returns a page of items with an opaque cursor for the next page.
+
+Environment: the same *_TABLE variables as the form Lambdas.
+"""
+import os
+import json
+import base64
+import hashlib
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from .aws_clients import get_table
+
+# Configure logging
+logger = logging.getLogger()
+
+SUBMISSION_TABLES = {
+    'contact': os.environ.get('CONTACT_TABLE', 'nash-and-smashed-contact-form-table'),
+    'uk_contact': os.environ.get('UK_CONTACT_TABLE', 'nash-and-smashed-uk-contact-form-table'),
+    'franchise': os.environ.get('FRANCHISE_TABLE', 'nash-and-smashed-franchise-form-table'),
+    'fundraising': os.environ.get('FUNDRAISING_TABLE', 'nash-and-smashed-fundraising-form-table'),
+    'career': os.environ.get('JOB_APPLICATION_TABLE', 'nash-and-smashed-job-application-form-table'),
+}
+
+# Index name -> partition key; every index sorts on timestamp
+SUBMISSION_INDEXES = {
+    'formType-timestamp-index': 'formType',
+    'status-timestamp-index': 'status',
+    'email-timestamp-index': 'email',
+}
+SORT_KEY = 'timestamp'
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+# Query calls per page when filters discard most of what is read
+MAX_QUERY_CALLS = 10
+
+class InvalidQuery(ValueError):
+    """A query the API cannot run: unknown form type, bad cursor or date"""
+
+def to_millis(value):
+    """Epoch milliseconds from an int, a numeric string or an ISO 8601 date/time (UTC if naive)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float, Decimal)) or str(value).isdigit():
+        return int(value)
+    try:
+        moment = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        raise InvalidQuery(f"Not a date: {value}")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+def _plain(value):
+    """DynamoDB values as JSON-ready Python values"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, set, frozenset)):
+        return [_plain(item) for item in value]
+    return value
+
+def _fingerprint(query):
+    return hashlib.sha256(json.dumps(query, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+def encode_cursor(last_key, query):
+    """Opaque cursor: the LastEvaluatedKey, tied to the query it came from"""
+    payload = json.dumps({'k': _plain(last_key), 'q': _fingerprint(query)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, query):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        last_key, fingerprint = payload['k'], payload['q']
+    except (ValueError, TypeError, KeyError):
+        raise InvalidQuery("Malformed cursor")
+    if fingerprint != _fingerprint(query):
+        raise InvalidQuery("Cursor belongs to a different query")
+    return last_key
+
+def choose_index(status=None, email=None):
+    """(index name, partition key attribute); the most selective index the arguments allow"""
+    if email:
+        return 'email-timestamp-index', 'email'
+    if status:
+        return 'status-timestamp-index', 'status'
+    return 'formType-timestamp-index', 'formType'
+
+def query_submissions(form_type, status=None, email=None, since=None, until=None, filters=None,
+                      attributes=None, limit=None, cursor=None, oldest_first=False):
+    """
+    One page of a form's submissions, newest first unless oldest_first
+
+    Args:
+        form_type: Key of SUBMISSION_TABLES ('contact', 'career', ...)
+        status: Only submissions with this status (e.g. 'new')
+        email: Only submissions from this address
+        since, until: Time range, inclusive (epoch ms or ISO 8601)
+        filters: Attribute -> value equality filters applied server-side, e.g. {'position': 'Manager'}
+        attributes: Attributes to return (default: all)
+        limit: Items per page (default 25, at most 100)
+        cursor: The cursor of the previous page
+
+    Returns:
+        Dict with items, count and cursor (None on the last page)
+    """
+    table_name = SUBMISSION_TABLES.get(form_type)
+    if not table_name:
+        raise InvalidQuery(f"Unknown form type: {form_type}")
+    limit = min(max(1, int(limit or DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    since, until = to_millis(since), to_millis(until)
+
+    index_name, partition_key = choose_index(status, email)
+    partition_value = {'email': email, 'status': status, 'formType': form_type}[partition_key]
+    # With email as the key, status is one more filter
+    filters = dict(filters or {})
+    if status and partition_key != 'status':
+        filters['status'] = status
+
+    names = {'#pk': partition_key}
+    values = {':pk': partition_value}
+    key_condition = '#pk = :pk'
+    if since is not None or until is not None:
+        names['#ts'] = SORT_KEY
+    if since is not None and until is not None:
+        key_condition += ' AND #ts BETWEEN :since AND :until'
+        values.update({':since': since, ':until': until})
+    elif since is not None:
+        key_condition += ' AND #ts >= :since'
+        values[':since'] = since
+    elif until is not None:
+        key_condition += ' AND #ts <= :until'
+        values[':until'] = until
+
+    kwargs = {
+        'IndexName': index_name,
+        'KeyConditionExpression': key_condition,
+        'ScanIndexForward': bool(oldest_first),
+    }
+    conditions = []
+    for i, (attribute, value) in enumerate(sorted(filters.items())):
+        names[f'#f{i}'] = attribute
+        values[f':f{i}'] = value
+        conditions.append(f'#f{i} = :f{i}')
+    if conditions:
+        kwargs['FilterExpression'] = ' AND '.join(conditions)
+    if attributes:
+        for i, attribute in enumerate(attributes):
+            names[f'#p{i}'] = attribute
+        kwargs['ProjectionExpression'] = ', '.join(f'#p{i}' for i in range(len(attributes)))
+    kwargs['ExpressionAttributeNames'] = names
+    kwargs['ExpressionAttributeValues'] = values
+
+    query = {'table': table_name, 'index': index_name, 'key': key_condition, 'values': _plain(values),
+             'filter': kwargs.get('FilterExpression'), 'forward': bool(oldest_first)}
+    if cursor:
+        kwargs['ExclusiveStartKey'] = decode_cursor(cursor, query)
+
+    # Limit counts items read, before the filter; read exactly what is still
+    # missing so the last key read is where the next page starts
+    table = get_table(table_name)
+    items = []
+    last_key = None
+    for _ in range(MAX_QUERY_CALLS):
+        response = table.query(Limit=limit - len(items), **kwargs)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key or len(items) >= limit:
+            break
+        kwargs['ExclusiveStartKey'] = last_key
+
+    logger.debug("Queried %s on %s: %d item(s)", table_name, index_name, len(items))
+    return {
+        'items': [_plain(item) for item in items],
+        'count': len(items),
+        'cursor': encode_cursor(last_key, query) if last_key else None
+    }
+
+def get_submission(form_type, form_id):
+    """One submission by its formID (the table's partition key), or None"""
+    table_name = SUBMISSION_TABLES.get(form_type)
+    if not table_name:
+        raise InvalidQuery(f"Unknown form type: {form_type}")
+    response = get_table(table_name).query(
+        KeyConditionExpression='#pk = :pk',
+        ExpressionAttributeNames={'#pk': 'formID'},
+        ExpressionAttributeValues={':pk': form_id},
+        Limit=1
+    )
+    items = response.get('Items', [])
+    return _plain(items[0]) if items else None
+
+def index_definitions():
+    """GlobalSecondaryIndexUpdates entries creating SUBMISSION_INDEXES (on-demand tables)"""
+    return [
+        {
+            'Create': {
+                'IndexName': index_name,
+                'KeySchema': [
+                    {'AttributeName': partition_key, 'KeyType': 'HASH'},
+                    {'AttributeName': SORT_KEY, 'KeyType': 'RANGE'},
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+            }
+        }
+        for index_name, partition_key in SUBMISSION_INDEXES.items()
+    ]
@@ -0,0 +1,187 @@
+# AWS_Lambda_Functions/form_pipeline/table_export.py
+"""
+Parallel segmented export of a DynamoDB table
+
+scan_table() splits a Scan into TotalSegments segments, scans them on a
+thread pool and follows each segment's LastEvaluatedKey to the end. Pages
+are handed to the caller through a bounded queue, so memory holds at most
+a few pages however large the table is, and rows can be written out as
+NDJSON or CSV while the scan is still running.
+
+Environment:
+    EXPORT_SEGMENTS     Parallel scan segments (default 8)
+    EXPORT_PAGE_SIZE    Items per Scan request (default: as many as fit in 1 MB)
+"""
+import os
+import csv
+import json
+import queue
+import logging
+import threading
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+
+from .aws_clients import get_dynamodb
+
+logger = logging.getLogger(__name__)
+
+EXPORT_SEGMENTS = int(os.environ.get('EXPORT_SEGMENTS', '8'))
+EXPORT_PAGE_SIZE = int(os.environ.get('EXPORT_PAGE_SIZE', '0')) or None
+# Pages waiting for the writer, per segment
+QUEUED_PAGES_PER_SEGMENT = 2
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+def _scan_kwargs(table_name, attributes, page_size):
+    kwargs = {'TableName': table_name}
+    if attributes:
+        # Placeholders, since names like status are reserved words
+        names = {f'#a{i}': name for i, name in enumerate(attributes)}
+        kwargs['ProjectionExpression'] = ', '.join(names)
+        kwargs['ExpressionAttributeNames'] = names
+    if page_size:
+        kwargs['Limit'] = page_size
+    return kwargs
+
+def scan_pages(table_name, attributes=None, page_size=None, start_key=None, filter_expression=None, values=None):
+    """
+    Yield (items, last_key) for each page of a plain paginated Scan
+
+    last_key is the page's LastEvaluatedKey (None on the last page); pass
+    it back as start_key to carry on from the next page later.
+    filter_expression may use the #a{i} placeholders of attributes.
+    """
+    client = get_dynamodb().meta.client
+    kwargs = _scan_kwargs(table_name, attributes, page_size or EXPORT_PAGE_SIZE)
+    if filter_expression:
+        kwargs['FilterExpression'] = filter_expression
+        kwargs['ExpressionAttributeValues'] = values
+    while True:
+        if start_key:
+            kwargs['ExclusiveStartKey'] = start_key
+        response = client.scan(**kwargs)
+        start_key = response.get('LastEvaluatedKey')
+        yield response.get('Items', []), start_key
+        if not start_key:
+            return
+
+def scan_table(table_name, segments=None, attributes=None, page_size=None, limit=None):
+    """
+    Yield every item of a table (only the given attributes, if any)
+
+    Items come in page order within a segment, segments interleaved. With
+    segments=1 this is a plain paginated Scan. Stops after limit items.
+    """
+    segments = max(1, segments or EXPORT_SEGMENTS)
+    # The resource's client is thread-safe and returns plain Python values, like Table.scan
+    client = get_dynamodb().meta.client
+    base_kwargs = _scan_kwargs(table_name, attributes, page_size or EXPORT_PAGE_SIZE)
+    pages = queue.Queue(maxsize=segments * QUEUED_PAGES_PER_SEGMENT)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry):
+        # Give up waiting if the consumer has gone away
+        while not stop.is_set():
+            try:
+                pages.put(entry, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan_segment(segment):
+        kwargs = dict(base_kwargs)
+        if segments > 1:
+            kwargs.update(Segment=segment, TotalSegments=segments)
+        try:
+            while not stop.is_set():
+                response = client.scan(**kwargs)
+                if not put(response.get('Items', [])):
+                    return
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key:
+                    break
+                kwargs['ExclusiveStartKey'] = last_key
+        except Exception as e:
+            put(e)
+        finally:
+            put(done)
+
+    executor = ThreadPoolExecutor(max_workers=segments, thread_name_prefix='scan-segment')
+    try:
+        for segment in range(segments):
+            executor.submit(scan_segment, segment)
+
+        remaining = segments
+        count = 0
+        while remaining:
+            page = pages.get()
+            if page is done:
+                remaining -= 1
+                continue
+            if isinstance(page, Exception):
+                raise page
+            for item in page:
+                yield item
+                count += 1
+                if limit and count >= limit:
+                    return
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', 'replace')
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+def _csv_value(value):
+    """Scalars as text; maps, lists and sets as JSON"""
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list, set, frozenset)):
+        return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(',', ':'))
+    return _json_default(value) if isinstance(value, (Decimal, bytes, bytearray)) else value
+
+def write_ndjson(items, out):
+    """Write one JSON object per line; returns the number of items"""
+    count = 0
+    for item in items:
+        out.write(json.dumps(item, default=_json_default, ensure_ascii=False, separators=(',', ':')))
+        out.write('\n')
+        count += 1
+    return count
+
+def write_csv(items, out, columns):
+    """Write a header and one row per item with the given columns; returns the number of items"""
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    count = 0
+    for item in items:
+        writer.writerow([_csv_value(item.get(column)) for column in columns])
+        count += 1
+    return count
+
+def export_table(table_name, out, output_format='ndjson', attributes=None, segments=None, page_size=None):
+    """
+    Stream a table to an open text file as NDJSON or CSV
+
+    CSV needs a fixed set of columns, so attributes is required for it.
+    Returns the number of items written.
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {output_format}")
+    if output_format == 'csv' and not attributes:
+        raise ValueError("CSV export needs the attributes to export")
+
+    items = scan_table(table_name, segments=segments, attributes=attributes, page_size=page_size)
+    if output_format == 'csv':
+        count = write_csv(items, out, attributes)
+    else:
+        count = write_ndjson(items, out)
+    logger.info(f"Exported {count} items from {table_name} as {output_format}")
+    return count
@@ -0,0 +1,78 @@
+# AWS_Lambda_Functions/form_pipeline/utils.py
+import json
+import logging
+
+logger = logging.getLogger()
+
+def get_cors_headers():
+    """Get CORS headers for all responses - CRITICAL FOR MOBILE BROWSERS"""
+    return {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'POST,OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
+    }
+
+def build_response(status_code, body, headers=None):
+    """Build an API Gateway response with CORS headers and a JSON body"""
+    response_headers = get_cors_headers()
+    if headers:
+        response_headers.update(headers)
+    return {
+        'statusCode': status_code,
+        'headers': response_headers,
+        'body': json.dumps(body) if body is not None else ''
+    }
+
+def build_preflight_response():
+    """Build the response to a CORS preflight (OPTIONS) request"""
+    return build_response(200, None, {'Access-Control-Max-Age': '86400'})
+
+def get_body_from_event(event):
+    """Extract and parse request body from Lambda event"""
+    try:
+        # If body is a string (which is common with API Gateway)
+        if isinstance(event.get('body'), str):
+            return json.loads(event['body'])
+        # If body is already parsed (direct invocation or test)
+        elif event.get('body'):
+            return event['body']
+        # If the event itself is the body (direct invocation)
+        elif not event.get('headers'):
+            return event
+        # Default empty object
+        else:
+            return {}
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse request body: {str(e)}")
+        return {}
+
+def get_source_ip(event):
+    """Get the caller IP address as seen by API Gateway"""
+    return event.get('requestContext', {}).get('identity', {}).get('sourceIp', 'unknown')
+
+def get_ip_address(event):
+    """Extract IP address from event headers, falling back to the API Gateway source IP"""
+    headers = event.get("headers") or {}
+    x_forwarded_for = headers.get("X-Forwarded-For", "")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+
+    # Try other common IP headers
+    real_ip = headers.get("X-Real-IP", "")
+    if real_ip:
+        return real_ip.strip()
+
+    return get_source_ip(event)
+
+def get_request_metadata(event):
+    """Extract request metadata (API Gateway request time and ID) from event"""
+    request_context = event.get("requestContext", {})
+    headers = event.get("headers") or {}
+
+    return {
+        "submittedAt": request_context.get("requestTime", ""),
+        "userAgent": headers.get("User-Agent", ""),
+        "ipAddress": get_ip_address(event),
+        "requestId": request_context.get("requestId", "")
+    }
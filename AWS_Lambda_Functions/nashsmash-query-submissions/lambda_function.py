@@ -0,0 +1,72 @@
+import os
+import logging
+
+from form_pipeline.utils import build_response
+from form_pipeline.submission_query import query_submissions, get_submission
+from form_pipeline.structured_logging import configure_logging
+
+# Configure logging
+logger = logging.getLogger()
+configure_logging()
+
+# This API only reads, and only the admin site may call it from a browser
+ADMIN_ORIGIN = os.environ.get('ADMIN_ORIGIN', 'https://nashandsmashed.com')
+CORS_HEADERS = {'Access-Control-Allow-Origin': ADMIN_ORIGIN, 'Access-Control-Allow-Methods': 'GET,OPTIONS'}
+FILTER_PREFIX = 'filter.'
+
+def parse_query(params):
+    """query_submissions keyword arguments from the query string"""
+    fields = params.get('fields')
+    return {
+        'status': params.get('status'),
+        'email': params.get('email'),
+        'since': params.get('since'),
+        'until': params.get('until'),
+        'limit': params.get('limit'),
+        'cursor': params.get('cursor'),
+        'attributes': [field.strip() for field in fields.split(',') if field.strip()] if fields else None,
+        'filters': {
+            key[len(FILTER_PREFIX):]: value
+            for key, value in params.items() if key.startswith(FILTER_PREFIX)
+        },
+        'oldest_first': params.get('order') == 'oldest'
+    }
+
+def lambda_handler(event, context):
+    """
+    Admin API for form submissions (behind an API Gateway authorizer)
+
+    GET /submissions/{formType}?status=new&since=2026-10-01&limit=25&fields=name,email&filter.position=Manager
+    GET /submissions/{formType}?cursor=...     the next page, with the same other parameters
+    GET /submissions/{formType}/{formId}       one submission
+
+    Requests that did not pass the authorizer get a 401, so a route deployed
+    without one never serves submissions.
+    """
+    if event.get('httpMethod') == 'OPTIONS':
+        return build_response(200, None, dict(CORS_HEADERS, **{'Access-Control-Max-Age': '86400'}))
+
+    if not (event.get('requestContext') or {}).get('authorizer'):
+        logger.error("Rejected submissions query without an authorizer context")
+        return build_response(401, {'success': False, 'message': 'Unauthorized'}, CORS_HEADERS)
+
+    path = event.get('pathParameters') or {}
+    params = event.get('queryStringParameters') or {}
+    form_type = path.get('formType') or params.get('formType')
+
+    try:
+        if path.get('formId'):
+            item = get_submission(form_type, path['formId'])
+            if item is None:
+                return build_response(404, {'success': False, 'message': 'Submission not found'}, CORS_HEADERS)
+            return build_response(200, {'success': True, 'item': item}, CORS_HEADERS)
+
+        page = query_submissions(form_type, **parse_query(params))
+        return build_response(200, dict(page, success=True), CORS_HEADERS)
+
+    except ValueError as e:
+        # InvalidQuery, or a limit that is not a number
+        return build_response(400, {'success': False, 'message': str(e)}, CORS_HEADERS)
+    except Exception as e:
+        logger.error(f"Error querying {form_type} submissions: {str(e)}")
+        return build_response(500, {'success': False, 'message': 'Could not load submissions'}, CORS_HEADERS)
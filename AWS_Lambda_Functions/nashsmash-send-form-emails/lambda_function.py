@@ -0,0 +1,19 @@
+import os
+import logging
+
+from form_pipeline.outbox import handle_sqs_event, drain_email_queue
+from form_pipeline.structured_logging import configure_logging
+
+# Configure logging
+logger = logging.getLogger()
+configure_logging()
+
+# Batches per scheduled run when polling instead of using an SQS trigger
+MAX_DRAIN_BATCHES = int(os.environ.get('MAX_DRAIN_BATCHES', '50'))
+
+def lambda_handler(event, context):
+    """Send queued form emails - from an SQS trigger, or by polling the queue on a schedule"""
+    if event.get('Records'):
+        return handle_sqs_event(event)
+
+    return drain_email_queue(max_batches=MAX_DRAIN_BATCHES)
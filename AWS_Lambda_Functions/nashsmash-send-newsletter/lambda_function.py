@@ -0,0 +1,39 @@
+import os
+import logging
+
+from form_pipeline.broadcast import run_broadcast, DynamoBroadcastStore, COMPLETE
+from form_pipeline.structured_logging import configure_logging
+
+# Configure logging
+logger = logging.getLogger()
+configure_logging()
+
+SUBSCRIBER_TABLE = os.environ.get('SUBSCRIBER_TABLE', 'nash-and-smashed-subscriber-form-table')
+SENDER_EMAIL = os.environ.get('SENDER_EMAIL', 'noreply@nashandsmashed.com')
+CONFIGURATION_SET = os.environ.get('SES_CONFIGURATION_SET') or None
+
+# Time kept back to save the checkpoint and return before the Lambda timeout
+SAFETY_MARGIN_MS = int(os.environ.get('BROADCAST_SAFETY_MARGIN_MS', '30000'))
+
+def lambda_handler(event, context):
+    """
+    Send (or carry on sending) a newsletter broadcast until done or out of time
+
+    Event: {"broadcastId": "...", "template": "...", "defaultData": {...}}
+    The checkpoint lives in BROADCAST_TABLE, so invoke again with the same
+    event (e.g. from a Step Functions loop or a schedule) until the result's
+    status is 'complete'.
+    """
+    time_budget = max(1, (context.get_remaining_time_in_millis() - SAFETY_MARGIN_MS) / 1000)
+    result = run_broadcast(
+        event['broadcastId'],
+        event['template'],
+        event.get('sender', SENDER_EMAIL),
+        DynamoBroadcastStore(event['broadcastId']),
+        SUBSCRIBER_TABLE,
+        default_data=event.get('defaultData'),
+        configuration_set=CONFIGURATION_SET,
+        time_budget=time_budget
+    )
+    result['done'] = result['status'] == COMPLETE
+    return result
@@ -4,6 +4,9 @@
 import re
 import logging
 
+from form_pipeline.sanitize import Sanitizer, JAVASCRIPT_URL, EVENT_HANDLER, STYLE_ATTRIBUTE
+from form_pipeline.spam import SpamEngine, SpamReport
+
 logger = logging.getLogger()
 
 def validate_email(email):
@@ -26,7 +29,7 @@ def validate_phone(phone):
     if not phone:
         return True  # Phone is optional
     
-    logger.info(f"Validating phone: '{phone}'")
+    logger.debug("Validating phone: '%s'", phone)
     
     # Security check: Remove dangerous characters and check for injection attempts
     dangerous_chars = ['<', '>', 'script', 'javascript:', 'onclick', 'onerror']
@@ -63,7 +66,7 @@ def validate_phone(phone):
         logger.warning(f"Phone validation FAILED - not enough digits: '{phone}' (found {digit_count})")
         return False
     
-    logger.info(f"Phone validation PASSED: '{phone}' (digits: {digit_count})")
+    logger.debug("Phone validation PASSED: '%s' (digits: %d)", phone, digit_count)
     return True
 
 def validate_uk_contact_request(event_body):
@@ -126,9 +129,17 @@ def validate_uk_contact_request(event_body):
         logger.warning(f"Validation errors: {errors}")
         return list(errors.values())
     
-    logger.info("UK contact form validation passed")
+    logger.debug("UK contact form validation passed")
     return []
 
+# Tags, script/handler/style attributes and control characters removed, line breaks kept
+SANITIZER = Sanitizer(
+    tag_pattern=r'<[^>]*>',
+    remove_patterns=[JAVASCRIPT_URL, EVENT_HANDLER, STYLE_ATTRIBUTE],
+    strip_control_characters=True,
+    whitespace='lines'
+)
+
 def sanitize_input(value):
     """
     Remove dangerous content while preserving user-friendly input
@@ -136,23 +147,7 @@ def sanitize_input(value):
     """
     if not isinstance(value, str):
         return value
-    
-    # Remove HTML tags
-    clean_value = re.sub(r'<[^>]*>', '', value)
-    
-    # Remove script content and dangerous attributes
-    clean_value = re.sub(r'javascript:', '', clean_value, flags=re.IGNORECASE)
-    clean_value = re.sub(r'on\w+\s*=', '', clean_value, flags=re.IGNORECASE)
-    clean_value = re.sub(r'style\s*=', '', clean_value, flags=re.IGNORECASE)
-    
-    # Remove null bytes and other control characters (except newlines and tabs)
-    clean_value = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', clean_value)
-    
-    # Normalize whitespace but preserve line breaks
-    clean_value = re.sub(r'[ \t]+', ' ', clean_value)
-    clean_value = re.sub(r'\n+', '\n', clean_value)
-    
-    return clean_value.strip()
+    return SANITIZER(value)
 
 def sanitize_uk_form_data(form_data):
     """Sanitize all UK form data fields"""
@@ -166,31 +161,42 @@ def sanitize_uk_form_data(form_data):
             sanitized[key] = value
     return sanitized
 
-def detect_spam_patterns(form_data):
+# Common spam keywords (very basic) - compiled once per container
+SPAM_ENGINE = SpamEngine(
+    keywords=['crypto', 'bitcoin', 'viagra', 'casino', 'lottery', 'inheritance'],
+    keyword_fields=['message'],
+    messages={'keyword': "Spam keyword: {keyword}"}
+)
+URL_PATTERN = re.compile(r'https?://[^\s]+')
+
+def scan_spam_patterns(form_data):
     """
-    Basic spam detection - logs suspicious patterns but doesn't block
+    Basic spam detection with scores - logs suspicious patterns but doesn't block
     Focuses on obvious spam while avoiding false positives
     """
-    spam_indicators = []
-    
+    report = SpamReport()
+
     # Check for excessive URLs
     message = str(form_data.get('message', ''))
-    url_pattern = r'https?://[^\s]+'
-    urls = re.findall(url_pattern, message)
+    urls = URL_PATTERN.findall(message)
     if len(urls) > 3:
-        spam_indicators.append(f"Excessive URLs: {len(urls)}")
-    
+        report.indicators.append(SPAM_ENGINE.indicator('urls', f"Excessive URLs: {len(urls)}", field='message'))
+
     # Check for repetitive content
     if len(message) > 50 and len(set(message.replace(' ', '').lower())) < 10:
-        spam_indicators.append("Repetitive content detected")
-    
-    # Check for common spam keywords (very basic)
-    spam_keywords = ['crypto', 'bitcoin', 'viagra', 'casino', 'lottery', 'inheritance']
-    for keyword in spam_keywords:
-        if keyword.lower() in message.lower():
-            spam_indicators.append(f"Spam keyword: {keyword}")
-    
-    if spam_indicators:
-        logger.warning(f"Potential spam indicators: {spam_indicators}")
-    
-    return spam_indicators
\ No newline at end of file
+        report.indicators.append(SPAM_ENGINE.indicator('low_variety', "Repetitive content detected", field='message'))
+
+    # Check for common spam keywords
+    report.indicators.extend(SPAM_ENGINE.scan({'message': message}).indicators)
+
+    if report:
+        logger.warning(f"Potential spam indicators: {report.messages}")
+
+    return report
+
+def detect_spam_patterns(form_data):
+    """
+    Basic spam detection - logs suspicious patterns but doesn't block
+    Focuses on obvious spam while avoiding false positives
+    """
+    return scan_spam_patterns(form_data).messages
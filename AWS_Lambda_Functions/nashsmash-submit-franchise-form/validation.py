@@ -2,90 +2,94 @@ import re
 import logging
 from typing import List, Dict, Any
 
+from form_pipeline.sanitize import Sanitizer, JAVASCRIPT_URL
+from form_pipeline.spam import SpamEngine, SpamReport
+
 logger = logging.getLogger()
 
+# Tags and javascript: removed, whitespace collapsed. The old chain also removed
+# <script>...</script> blocks after stripping tags, but by then no '<...>' is
+# left for that pattern to match, so it never changed a value and is not run.
+SANITIZER = Sanitizer(tag_pattern=r'<[^>]+>', remove_patterns=[JAVASCRIPT_URL], whitespace='collapse')
+
 def sanitize_input(input_string: str) -> str:
     """Sanitize input by removing potentially harmful content"""
     if not input_string:
         return ""
-    
-    # Remove HTML tags
-    input_string = re.sub(r'<[^>]+>', '', input_string)
-    
-    # Remove script tags and their content
-    input_string = re.sub(r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>', '', input_string, flags=re.IGNORECASE)
-    
-    # Remove potential JavaScript
-    input_string = re.sub(r'javascript:', '', input_string, flags=re.IGNORECASE)
-    
-    # Remove excessive whitespace
-    input_string = re.sub(r'\s+', ' ', input_string).strip()
-    
-    return input_string
+    return SANITIZER(input_string)
+
+# Spam keywords (common in spam emails)
+SPAM_KEYWORDS = [
+    'bitcoin', 'cryptocurrency', 'crypto', 'forex', 'investment opportunity',
+    'make money fast', 'click here', 'urgent', 'congratulations you have won',
+    'nigerian prince', 'lottery', 'millions of dollars', 'bank transfer',
+    'western union', 'money gram', 'advance fee', 'inheritance',
+    'casino', 'gambling', 'viagra', 'cialis', 'rolex', 'replica',
+    'weight loss', 'miracle cure', 'work from home', 'make $', 'earn $',
+    'free money', 'no experience required', 'guaranteed income'
+]
+
+# Suspicious domains (common temporary email providers)
+SUSPICIOUS_DOMAINS = [
+    '10minutemail.com', 'tempmail.org', 'guerrillamail.com', 'mailinator.com',
+    'trashmail.com', 'throwaway.email', 'temp-mail.org', 'getnada.com',
+    'maildrop.cc', 'sharklasers.com'
+]
+
+SPAM_TEXT_FIELDS = ['businessExperience', 'firstName', 'lastName', 'homeAddress']
+
+# Compiled once per container
+SPAM_ENGINE = SpamEngine(
+    keywords=SPAM_KEYWORDS,
+    blocked_domains=SUSPICIOUS_DOMAINS,
+    keyword_fields=SPAM_TEXT_FIELDS
+)
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+REPEATED_CHARACTER_PATTERN = re.compile(r'(.)\1{10,}')  # Same character repeated 10+ times
+# Only presence is checked, so the optional country code / '(' prefix of the full
+# phone pattern is left off: it never changes whether there is a match, and
+# trying it at every position was most of the detector's cost
+PHONE_PATTERN = re.compile(r'\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+def scan_spam_content(form_data: Dict[str, Any]) -> SpamReport:
+    """Detect potential spam indicators in form submission, with scores"""
+    # Check email domain and all text fields for spam keywords
+    report = SPAM_ENGINE.scan(form_data)
 
-def detect_spam_content(form_data: Dict[str, Any]) -> List[str]:
-    """Detect potential spam indicators in form submission"""
-    spam_indicators = []
-    
-    # Spam keywords (common in spam emails)
-    spam_keywords = [
-        'bitcoin', 'cryptocurrency', 'crypto', 'forex', 'investment opportunity',
-        'make money fast', 'click here', 'urgent', 'congratulations you have won',
-        'nigerian prince', 'lottery', 'millions of dollars', 'bank transfer',
-        'western union', 'money gram', 'advance fee', 'inheritance',
-        'casino', 'gambling', 'viagra', 'cialis', 'rolex', 'replica',
-        'weight loss', 'miracle cure', 'work from home', 'make $', 'earn $',
-        'free money', 'no experience required', 'guaranteed income'
-    ]
-    
-    # Suspicious domains (common temporary email providers)
-    suspicious_domains = [
-        '10minutemail.com', 'tempmail.org', 'guerrillamail.com', 'mailinator.com',
-        'trashmail.com', 'throwaway.email', 'temp-mail.org', 'getnada.com',
-        'maildrop.cc', 'sharklasers.com'
-    ]
-    
-    # Check email domain
-    email = form_data.get('email', '').lower()
-    if email:
-        domain = email.split('@')[-1] if '@' in email else ''
-        if domain in suspicious_domains:
-            spam_indicators.append(f"Suspicious email domain: {domain}")
-    
-    # Check all text fields for spam keywords
-    text_fields = ['businessExperience', 'firstName', 'lastName', 'homeAddress']
-    for field in text_fields:
-        content = str(form_data.get(field, '')).lower()
-        for keyword in spam_keywords:
-            if keyword in content:
-                spam_indicators.append(f"Spam keyword '{keyword}' found in {field}")
-    
     # Check for excessive URLs
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
     business_exp = str(form_data.get('businessExperience', ''))
-    urls_found = re.findall(url_pattern, business_exp)
+    urls_found = URL_PATTERN.findall(business_exp)
     if len(urls_found) > 2:
-        spam_indicators.append(f"Excessive URLs found: {len(urls_found)} URLs")
-    
+        report.indicators.append(SPAM_ENGINE.indicator(
+            'urls', f"Excessive URLs found: {len(urls_found)} URLs", field='businessExperience'
+        ))
+
     # Check for repetitive characters (common spam tactic)
-    for field in text_fields:
-        content = str(form_data.get(field, ''))
-        if re.search(r'(.)\1{10,}', content):  # Same character repeated 10+ times
-            spam_indicators.append(f"Repetitive characters found in {field}")
-    
+    for field in SPAM_TEXT_FIELDS:
+        if REPEATED_CHARACTER_PATTERN.search(str(form_data.get(field, ''))):
+            report.indicators.append(SPAM_ENGINE.indicator(
+                'repetition', f"Repetitive characters found in {field}", field=field
+            ))
+
     # Check for phone number in business experience (suspicious)
-    business_exp = str(form_data.get('businessExperience', ''))
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    if re.search(phone_pattern, business_exp):
-        spam_indicators.append("Phone number found in business experience")
-    
+    if PHONE_PATTERN.search(business_exp):
+        report.indicators.append(SPAM_ENGINE.indicator(
+            'phone', "Phone number found in business experience", field='businessExperience'
+        ))
+
     # Check for excessive capitalization
-    for field in text_fields:
+    for field in SPAM_TEXT_FIELDS:
         content = str(form_data.get(field, ''))
-        if len(content) > 20 and sum(1 for c in content if c.isupper()) / len(content) > 0.5:
-            spam_indicators.append(f"Excessive capitalization in {field}")
-    
-    return spam_indicators
+        if len(content) > 20 and sum(map(str.isupper, content)) / len(content) > 0.5:
+            report.indicators.append(SPAM_ENGINE.indicator(
+                'capitalization', f"Excessive capitalization in {field}", field=field
+            ))
+
+    return report
+
+def detect_spam_content(form_data: Dict[str, Any]) -> List[str]:
+    """Detect potential spam indicators in form submission"""
+    return scan_spam_content(form_data).messages
 
 def sanitize_form_data(form_data: Dict[str, Any]) -> Dict[str, Any]:
     """Sanitize all form data fields"""
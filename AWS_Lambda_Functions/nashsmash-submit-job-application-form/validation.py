@@ -1,6 +1,9 @@
 import re
 import logging
 
+from form_pipeline.sanitize import Sanitizer, JAVASCRIPT_URL, EVENT_HANDLER
+from form_pipeline.spam import SpamEngine
+
 logger = logging.getLogger()
 
 # Spam protection patterns
@@ -15,6 +18,18 @@ BLOCKED_DOMAINS = [
     'mailinator.com', 'throwaway.email'
 ]
 
+SPAM_TEXT_FIELDS = ['firstName', 'lastName', 'email', 'phone', 'address', 'position', 'workExperience', 'references']
+
+# Compiled once per container
+SPAM_ENGINE = SpamEngine(
+    keywords=SPAM_KEYWORDS,
+    blocked_domains=BLOCKED_DOMAINS,
+    keyword_fields=SPAM_TEXT_FIELDS,
+    domain_match='contains'
+)
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+REPEATED_CHARACTER_PATTERN = re.compile(r'(.)\1{4,}')  # 5+ consecutive same characters
+
 def validate_email(email):
     """Validate email format"""
     if not email:
@@ -47,23 +62,20 @@ def validate_name_length(name):
         return False
     return len(name.strip()) <= 100
 
+# Tags and script/handler attributes removed; whitespace left as typed
+SANITIZER = Sanitizer(tag_pattern=r'<[^>]*>', remove_patterns=[JAVASCRIPT_URL, EVENT_HANDLER])
+
 def sanitize_input(value):
     """Remove HTML/script tags and sanitize content"""
     if not isinstance(value, str):
         return value
     
-    # Remove HTML tags
-    clean_value = re.sub(r'<[^>]*>', '', value)
-    
-    # Remove script content
-    clean_value = re.sub(r'javascript:', '', clean_value, flags=re.IGNORECASE)
-    clean_value = re.sub(r'on\w+\s*=', '', clean_value, flags=re.IGNORECASE)
+    clean_value = SANITIZER.clean(value)
     
     # Check for spam keywords
-    for keyword in SPAM_KEYWORDS:
-        if keyword.lower() in clean_value.lower():
-            logger.warning(f"Spam keyword detected: {keyword}")
-            # Don't block immediately, just log
+    for keyword in SPAM_ENGINE.find_keywords(clean_value):
+        logger.warning(f"Spam keyword detected: {keyword}")
+        # Don't block immediately, just log
     
     # Limit length and return
     if len(clean_value) > 1000:
@@ -71,46 +83,39 @@ def sanitize_input(value):
     
     return clean_value.strip()
 
-def detect_spam_content(form_data):
-    """Detect spam in form content"""
-    spam_indicators = []
-    
-    # Check for spam keywords in text fields
-    text_fields = ['firstName', 'lastName', 'email', 'phone', 'address', 'position', 'workExperience', 'references']
-    for field in text_fields:
-        if field in form_data:
-            content = str(form_data[field]).lower()
-            for keyword in SPAM_KEYWORDS:
-                if keyword in content:
-                    spam_indicators.append(f"Spam keyword '{keyword}' found in {field}")
-    
-    # Check for suspicious email domains
-    email = form_data.get('email', '').lower()
-    for domain in BLOCKED_DOMAINS:
-        if domain in email:
-            spam_indicators.append(f"Suspicious email domain: {domain}")
-    
+def scan_spam_content(form_data):
+    """Detect spam in form content, with scores"""
+    # Check for suspicious email domains and spam keywords in text fields
+    report = SPAM_ENGINE.scan(form_data)
+
     # Check for excessive URLs
-    url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
     for field in ['firstName', 'lastName', 'workExperience', 'references']:
         if field in form_data:
-            urls = url_pattern.findall(str(form_data[field]))
+            urls = URL_PATTERN.findall(str(form_data[field]))
             if len(urls) > 2:  # Allow max 2 URLs in any field
-                spam_indicators.append(f"Too many URLs in {field}: {len(urls)}")
-    
+                report.indicators.append(SPAM_ENGINE.indicator(
+                    'urls', f"Too many URLs in {field}: {len(urls)}", field=field
+                ))
+
     # Check for repetitive characters
     for field in ['firstName', 'lastName', 'workExperience']:
         if field in form_data:
-            content = str(form_data[field])
-            # Check for 5+ consecutive same characters
-            if re.search(r'(.)\1{4,}', content):
-                spam_indicators.append(f"Repetitive characters in {field}")
-    
+            if REPEATED_CHARACTER_PATTERN.search(str(form_data[field])):
+                report.indicators.append(SPAM_ENGINE.indicator(
+                    'repetition', f"Repetitive characters in {field}", field=field
+                ))
+
     # Check honeypot field
     if form_data.get('website'):  # Honeypot field should be empty
-        spam_indicators.append("Honeypot field filled (likely bot)")
-    
-    return spam_indicators
+        report.indicators.append(SPAM_ENGINE.indicator(
+            'honeypot', "Honeypot field filled (likely bot)", field='website'
+        ))
+
+    return report
+
+def detect_spam_content(form_data):
+    """Detect spam in form content"""
+    return scan_spam_content(form_data).messages
 
 def sanitize_form_data(form_data):
     """Sanitize all form data"""
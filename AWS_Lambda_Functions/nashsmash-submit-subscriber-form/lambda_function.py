@@ -1,144 +1,89 @@
 import os
-import json
 import logging
 
 from validation import validate_subscriber_request
 from storage import save_subscriber_to_dynamodb
 from email_services import send_confirmation_email
-from utils import get_body_from_event, get_metadata, get_ip_address
-from rate_limiting import check_rate_limit
+from form_pipeline import (
+    FormSchema,
+    FormPipeline,
+    build_response,
+    get_ip_address,
+    get_request_metadata,
+    rate_limit,
+    parse_body,
+    validate,
+)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 SUBSCRIBER_TABLE = os.environ.get('SUBSCRIBER_TABLE', 'nash-and-smashed-subscriber-form-table')
-WEBSITE_NAME = os.environ.get('WEBSITE_NAME', 'Nash & Smashed')
-WEBSITE_URL = os.environ.get('WEBSITE_URL', 'https://nashandsmashed.com')
+RATE_LIMIT_TABLE = os.environ.get('RATE_LIMIT_TABLE', 'nash-and-smashed-form-rate-limits')
 
-def lambda_handler(event, context):
-    """Main handler function for the subscriber form Lambda"""
-    try:
-        logger.info("Received subscriber form submission")
-        
-        # Handle CORS preflight
-        if event.get("httpMethod", "") == "OPTIONS":
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key',
-                    'Access-Control-Allow-Methods': 'POST,OPTIONS',
-                    'Access-Control-Max-Age': '86400'
-                },
-                'body': ''
-            }
+def persist_subscriber(ctx):
+    """Save the subscriber (this handles duplicates automatically)"""
+    body = ctx.body
+    ctx.form_data = {
+        "email": body.get("email"),
+        "firstName": body.get("firstName"),
+        "lastName": body.get("lastName"),
+        "metadata": get_request_metadata(ctx.event)
+    }
 
-        body = get_body_from_event(event)
-        metadata = get_metadata(event)
-        ip_address = get_ip_address(event)
+    result = save_subscriber_to_dynamodb(ctx.form_data, SUBSCRIBER_TABLE)
+    if result is None or result[0] is None:
+        return build_response(500, {
+            "success": False,
+            "message": "Failed to save subscriber. Please try again."
+        })
 
-        # Rate limiting
-        allowed, rate_limit_msg = check_rate_limit(ip_address)
-        if allowed is False:
-            logger.warning(f"Rate limit exceeded for IP: {ip_address}")
-            return {
-                "statusCode": 429,
-                "headers": {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                "body": json.dumps({
-                    "success": False,
-                    "message": rate_limit_msg or "Rate limit exceeded. Please try again later."
-                })
-            }
+    ctx.form_id, is_update = result
 
-        # Validation
-        errors = validate_subscriber_request(body)
-        if errors:
-            return {
-                "statusCode": 400,
-                "headers": {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                "body": json.dumps({
-                    "success": False,
-                    "errors": errors,
-                    "message": "Validation failed."
-                })
-            }
+    # Return appropriate message based on whether it was a duplicate
+    if is_update:
+        ctx.message = "Your subscription has been updated successfully!"
+    else:
+        ctx.message = "Subscription successful!"
 
-        # Prepare form data
-        form_data = {
-            "email": body.get("email"),
-            "firstName": body.get("firstName"),
-            "lastName": body.get("lastName"),
-            "metadata": metadata
-        }
+    ctx.response_fields["isUpdate"] = is_update
+    return None
 
-        # Save to DynamoDB (this handles duplicates automatically)
-        result = save_subscriber_to_dynamodb(form_data, SUBSCRIBER_TABLE)
-        if result is None or result[0] is None:
-            return {
-                "statusCode": 500,
-                "headers": {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                "body": json.dumps({
-                    "success": False,
-                    "message": "Failed to save subscriber. Please try again."
-                })
-            }
+def send_subscriber_confirmation(ctx):
+    """Send the confirmation email without failing the subscription"""
+    try:
+        send_confirmation_email(ctx.form_data, ctx.schema.website_name, ctx.schema.website_url)
+        email_sent = True
+    except Exception as e:
+        logger.error("Email sending failed: %s", e)
+        email_sent = False
 
-        form_id, is_update = result
+    ctx.response_fields["emailSent"] = email_sent
+    if ctx.request_log:
+        ctx.request_log.set(isUpdate=ctx.response_fields.get("isUpdate"), emails={"confirmation": email_sent})
+    return None
 
-        # Send confirmation email
-        try:
-            send_confirmation_email(form_data, WEBSITE_NAME, WEBSITE_URL)
-            email_sent = True
-            logger.info(f"Confirmation email sent to {body.get('email')}")
-        except Exception as e:
-            logger.error(f"Email sending failed: {str(e)}")
-            email_sent = False
+SUBSCRIBER_SCHEMA = FormSchema(
+    form_type='subscriber',
+    id_prefix='SUBSCR',
+    table_name=SUBSCRIBER_TABLE,
+    label='subscriber form submission',
+    fields={},
+    validator=validate_subscriber_request,
+    website_name=os.environ.get('WEBSITE_NAME', 'Nash & Smashed'),
+    website_url=os.environ.get('WEBSITE_URL', 'https://nashandsmashed.com'),
+    rate_limited=True,
+    rate_limit_table=RATE_LIMIT_TABLE,
+    ip_resolver=get_ip_address,
+    validation_message="Validation failed.",
+    error_message='An error occurred while processing your subscription. Please try again later or contact us directly.',
+)
 
-        # Return appropriate message based on whether it was a duplicate
-        if is_update:
-            message = "Your subscription has been updated successfully!"
-            logger.info(f"Updated existing subscription for: {body.get('email')}")
-        else:
-            message = "Subscription successful!"
-            logger.info(f"Created new subscription for: {body.get('email')}")
+pipeline = FormPipeline(
+    SUBSCRIBER_SCHEMA,
+    stages=(rate_limit, parse_body, validate, persist_subscriber, send_subscriber_confirmation)
+)
 
-        return {
-            "statusCode": 200,
-            "headers": {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            "body": json.dumps({
-                "success": True,
-                "message": message,
-                "formID": form_id,
-                "isUpdate": is_update,
-                "emailSent": email_sent
-            })
-        }
-        
-    except Exception as e:
-        # Log the error
-        logger.error(f"Error processing subscriber form submission: {str(e)}")
-        
-        # Return error response
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'success': False,
-                'message': 'An error occurred while processing your subscription. Please try again later or contact us directly.'
-            })
-        }
\ No newline at end of file
+def lambda_handler(event, context):
+    """Main handler function for the subscriber form Lambda"""
+    return pipeline.handle(event, context)
@@ -1,42 +1,60 @@
-import boto3
-import time
 import logging
 from botocore.exceptions import ClientError
 
+from form_pipeline.aws_clients import get_table
+from form_pipeline.ids import new_submission_id
+from form_pipeline.table_export import scan_table
+
 logger = logging.getLogger()
-dynamodb = boto3.resource('dynamodb')
 
 def save_subscriber_to_dynamodb(form_data, table_name):
-    """Save subscriber form submission to DynamoDB with automatic duplicate prevention"""
-    table = dynamodb.Table(table_name)
+    """Save subscriber form submission to DynamoDB with automatic duplicate prevention
+
+    One UpdateItem creates the subscriber or updates it in place: createdAt
+    is only set on the first subscription and subscriptionCount is
+    incremented by DynamoDB, so concurrent resubscribes cannot lose a count.
+    The old values it returns tell a new subscriber from a returning one.
+    """
+    table = get_table(table_name)
     email = form_data.get("email")
-    timestamp = str(int(time.time() * 1000))
-    form_id = f"SUBSCR_{timestamp}"
-    
-    # Check if subscriber already exists
-    existing_subscriber = get_subscriber_by_email(email, table_name)
-    is_update = existing_subscriber is not None
-    
-    # Use email as the only key - this automatically prevents duplicates
-    item = {
-        "email": email,                         # Primary key (String)
-        "formID": form_id,
-        "firstName": form_data.get("firstName", ""),
-        "lastName": form_data.get("lastName", ""),
-        "metadata": form_data.get("metadata", {}),
-        "formType": "subscriber",
-        "status": "active",
-        "createdAt": existing_subscriber.get("createdAt", timestamp) if existing_subscriber else timestamp,
-        "updatedAt": timestamp,
-        "subscriptionCount": (existing_subscriber.get("subscriptionCount", 0) + 1) if existing_subscriber else 1
-    }
-    
-    logger.info(f"{'Updating' if is_update else 'Creating'} subscriber item for: {email}")
+    form_id, timestamp = new_submission_id("SUBSCR")
+    timestamp = str(timestamp)
     
     try:
-        # This will either create a new item or completely replace existing one
-        table.put_item(Item=item)
-        logger.info(f"Successfully {'updated' if is_update else 'created'} subscriber: {form_id} for email: {email}")
+        # Use email as the only key - this automatically prevents duplicates
+        response = table.update_item(
+            Key={"email": email},
+            UpdateExpression=(
+                "SET #formID = :formID, #firstName = :firstName, #lastName = :lastName, #metadata = :metadata, "
+                "#formType = :formType, #status = :status, #createdAt = if_not_exists(#createdAt, :now), "
+                "#updatedAt = :now ADD #subscriptionCount :one"
+            ),
+            ExpressionAttributeNames={
+                "#formID": "formID",
+                "#firstName": "firstName",
+                "#lastName": "lastName",
+                "#metadata": "metadata",
+                "#formType": "formType",
+                "#status": "status",
+                "#createdAt": "createdAt",
+                "#updatedAt": "updatedAt",
+                "#subscriptionCount": "subscriptionCount"
+            },
+            ExpressionAttributeValues={
+                ":formID": form_id,
+                ":firstName": form_data.get("firstName", ""),
+                ":lastName": form_data.get("lastName", ""),
+                ":metadata": form_data.get("metadata", {}),
+                ":formType": "subscriber",
+                ":status": "active",
+                ":now": timestamp,
+                ":one": 1
+            },
+            # A new item has no old values
+            ReturnValues="UPDATED_OLD"
+        )
+        is_update = bool(response.get("Attributes"))
+        logger.debug("Successfully %s subscriber: %s", 'updated' if is_update else 'created', form_id)
         return form_id, is_update
     except Exception as e:
         logger.error(f"Error saving subscriber: {str(e)}")
@@ -44,17 +62,17 @@ def save_subscriber_to_dynamodb(form_data, table_name):
 
 def get_subscriber_by_email(email, table_name):
     """Get subscriber by email address"""
-    table = dynamodb.Table(table_name)
+    table = get_table(table_name)
     
     try:
         response = table.get_item(Key={'email': email})
         item = response.get('Item')
         
         if item:
-            logger.info(f"Found existing subscriber: {email}")
+            logger.debug("Found existing subscriber: %s", email)
             return item
         else:
-            logger.info(f"No existing subscriber found for: {email}")
+            logger.debug("No existing subscriber found for: %s", email)
             return None
             
     except Exception as e:
@@ -62,16 +80,9 @@ def get_subscriber_by_email(email, table_name):
         return None
 
 def get_all_subscribers(table_name, limit=None):
-    """Get all subscribers from the table"""
-    table = dynamodb.Table(table_name)
-    
+    """Get all subscribers from the table (every page of the scan, up to limit)"""
     try:
-        if limit:
-            response = table.scan(Limit=limit)
-        else:
-            response = table.scan()
-        
-        items = response.get('Items', [])
+        items = list(scan_table(table_name, segments=1, limit=limit))
         logger.info(f"Retrieved {len(items)} subscribers from table")
         return items
         
@@ -81,7 +92,7 @@ def get_all_subscribers(table_name, limit=None):
 
 def delete_subscriber(email, table_name):
     """Delete a subscriber by email"""
-    table = dynamodb.Table(table_name)
+    table = get_table(table_name)
     
     try:
         table.delete_item(Key={'email': email})
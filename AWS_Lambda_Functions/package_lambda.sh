@@ -0,0 +1,35 @@
+#!/bin/bash
+
+# Package a form Lambda together with the shared form_pipeline package
+# Usage: ./package_lambda.sh nashsmash-submit-contact-form
+set -e
+
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+RED='\033[0;31m'
+NC='\033[0m'
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+FORM_NAME="${1%/}"
+
+if [ -z "$FORM_NAME" ] || [ ! -f "$SCRIPT_DIR/$FORM_NAME/lambda_function.py" ]; then
+  echo -e "${RED}Usage: $0 <form-lambda-directory>${NC}"
+  exit 1
+fi
+
+BUILD_DIR=$(mktemp -d)
+trap 'rm -rf "$BUILD_DIR"' EXIT
+mkdir -p "$SCRIPT_DIR/deployments"
+ZIP_PATH="$SCRIPT_DIR/deployments/$FORM_NAME.zip"
+
+echo -e "${YELLOW}📦 Packaging $FORM_NAME...${NC}"
+
+cp "$SCRIPT_DIR/$FORM_NAME"/*.py "$BUILD_DIR/"
+mkdir "$BUILD_DIR/form_pipeline"
+cp "$SCRIPT_DIR/form_pipeline"/*.py "$BUILD_DIR/form_pipeline/"
+
+rm -f "$ZIP_PATH"
+(cd "$BUILD_DIR" && zip -qr "$ZIP_PATH" . -x "*__pycache__*")
+
+echo -e "${GREEN}✓ Created $ZIP_PATH${NC}"
+echo "Deploy with: aws lambda update-function-code --function-name $FORM_NAME --zip-file fileb://$ZIP_PATH"
@@ -6,4 +6,6 @@ from .content_generator_utils import (
     content_exists,
     load_seo_keywords
 )
-from .content_generator_tasks import generate_multiple_blogs
\ No newline at end of file
+from .content_generator_tasks import generate_multiple_blogs
+from .content_generator_pipeline import SectionPipeline
+from .content_generator_runs import GenerationRun, RunTask
@@ -4,7 +4,8 @@ import logging
 import sys
 
 from .content_generator_core import SimplifiedContentGenerator
-from .content_generator_tasks import generate_multiple_blogs
+from .content_generator_tasks import DEFAULT_WORKERS, generate_multiple_blogs
+from utils.llm_cache import DEFAULT_CACHE_SIZE_MB
 
 def cli_entry_point():
     """Main CLI entry point for the content generator."""
@@ -16,6 +17,10 @@ Examples:
   %(prog)s --business nash-and-smashed
   %(prog)s --single "nashville hot chicken" "manassas va"
   %(prog)s --generate 5 --business nash-and-smashed
+  %(prog)s --generate 200 --workers 4
+  %(prog)s --generate 5 --no-cache
+  %(prog)s --generate 500 --workers 4 --run-id spring-batch
+  %(prog)s --resume --run-id spring-batch
   %(prog)s --verify --business nash-and-smashed
         """
     )
@@ -29,6 +34,12 @@ Examples:
         default='llama3.2',
         help='Ollama model (default: llama3.2)'
     )
+    parser.add_argument(
+        '--ollama-backend',
+        choices=['auto', 'http', 'cli'],
+        default='auto',
+        help='Ollama HTTP API, ollama CLI, or API with CLI fallback (default: auto)'
+    )
     parser.add_argument(
         '--single', '-s',
         nargs=2,
@@ -41,6 +52,49 @@ Examples:
         metavar='COUNT',
         help='Generate specified number of blogs from business-data.json'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help='Blogs generated in parallel with --generate (default: OLLAMA_NUM_PARALLEL or 1)'
+    )
+    parser.add_argument(
+        '--ollama-hosts',
+        nargs='+',
+        metavar='HOST',
+        help='Spread --generate workers over several Ollama servers, e.g. http://gpu1:11434 http://gpu2:11434'
+    )
+    parser.add_argument(
+        '--delay',
+        type=float,
+        default=0,
+        help='Seconds each worker waits between blogs (default: 0)'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Interleave intro/middle/conclusion prompts across blogs; --workers sets the LLM slots'
+    )
+    parser.add_argument(
+        '--run-id',
+        help='Name of the --generate run (default: a timestamp); with --resume, the run to continue'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted run (--run-id, or the latest unfinished one) without replanning it'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the model instead of replaying responses from llm_cache.db'
+    )
+    parser.add_argument(
+        '--cache-size-mb',
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB,
+        help=f'Response cache size before least recently used entries are evicted (default: {DEFAULT_CACHE_SIZE_MB})'
+    )
     parser.add_argument(
         '--verify', '-v', 
         action='store_true',
@@ -61,7 +115,10 @@ Examples:
     try:
         if args.verify:
             # Verification mode
-            generator = SimplifiedContentGenerator(args.business, args.model)
+            generator = SimplifiedContentGenerator(
+                args.business, args.model, args.ollama_backend,
+                use_cache=not args.no_cache, cache_size_mb=args.cache_size_mb
+            )
             logging.info("Verifying setup...")
             logging.info(f"✓ Business config: {generator.business_config.business_name}")
             logging.info(f"  - Operational: {generator.business_config.operational_locations} locations")
@@ -72,7 +129,10 @@ Examples:
             logging.info("All checks passed!")
             return
 
-        generator = SimplifiedContentGenerator(args.business, args.model)
+        generator = SimplifiedContentGenerator(
+            args.business, args.model, args.ollama_backend,
+            use_cache=not args.no_cache, cache_size_mb=args.cache_size_mb
+        )
 
         try:
             if args.single:
@@ -90,10 +150,16 @@ Examples:
                         logging.error(f"  Error: {result['error']}")
                     sys.exit(1)
 
-            elif args.generate:
-                count = args.generate
-                logging.info(f"Generating {count} blogs from business configuration")
-                result = generate_multiple_blogs(generator, count)
+            elif args.generate or args.resume:
+                count = args.generate or 0
+                if args.resume:
+                    logging.info(f"Resuming run {args.run_id or '(latest unfinished)'}")
+                else:
+                    logging.info(f"Generating {count} blogs from business configuration")
+                result = generate_multiple_blogs(
+                    generator, count, workers=args.workers, ollama_hosts=args.ollama_hosts, delay=args.delay,
+                    pipeline=args.pipeline, run_id=args.run_id, resume=args.resume
+                )
                 if result.get("success"):
                     successful = len(result["successful"])
                     failed = len(result["failed"])
@@ -102,9 +168,12 @@ Examples:
                     logging.info(f"  Successful: {successful}/{result['total_requested']}")
                     logging.info(f"  Failed: {failed}")
                     logging.info(f"  By status: {result['by_status']}")
+                    logging.info(f"  Run {result['run_id']} tasks: {result['run_tasks']}")
                     logging.info(f"  Total time: {total_time:.2f}s")
                     if successful > 0:
                         logging.info(f"  Average time per blog: {total_time/successful:.2f}s")
+                    if 'pipeline_stats' in result:
+                        logging.info(f"  Throughput: {result['pipeline_stats']['blogs_per_hour']} blogs/hour")
                     if 'export_count' in result:
                         logging.info(f"  Exported: {result['export_count']} blogs")
                     if failed > 0:
@@ -127,6 +196,7 @@ Examples:
                 logging.info("Choose an option:")
                 logging.info("  --single KEYWORD LOCATION    Generate one blog")
                 logging.info("  --generate COUNT             Generate multiple blogs")
+                logging.info("  --resume [--run-id RUN]      Continue an interrupted --generate run")
                 logging.info("  --verify                     Check setup")
 
         finally:
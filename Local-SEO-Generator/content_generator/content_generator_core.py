@@ -2,6 +2,7 @@
 import time
 import signal
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -11,6 +12,7 @@ from utils.logging_utils import setup_logging
 from utils.db_utils import setup_database
 from utils.content_utils import enhanced_seo_friendly_url, parse_location, clean_content
 from utils.ollama_utils import OllamaManager
+from utils.llm_cache import LLMResponseCache, DEFAULT_CACHE_SIZE_MB
 
 from prompts.prompt_logic import EnhancedContentPrompts
 from business_config.business_config import BusinessConfig
@@ -19,10 +21,22 @@ from unified_export.exporter_core import UnifiedExporter
 
 logger = setup_logging('content_generator.log')
 
+# Generated in this order; each prompt includes the sections before it
+SECTIONS = ('intro', 'middle', 'conclusion')
+SECTION_LABELS = {'intro': 'introduction', 'middle': 'middle', 'conclusion': 'conclusion'}
+SECTION_ATTEMPTS = 2
+
 class SimplifiedContentGenerator:
     """Simplified content generator with status-based logic"""
 
-    def __init__(self, business_id: str = 'nash-and-smashed', model_name: str = 'llama3.2'):
+    def __init__(self, business_id: str = 'nash-and-smashed', model_name: str = 'llama3.2', ollama_backend: str = 'auto',
+                 use_cache: bool = True, cache_size_mb: int = DEFAULT_CACHE_SIZE_MB):
+        """
+        Args:
+            use_cache: Replay model responses from llm_cache.db (next to the blogs
+                database) for prompts already answered; False always calls the model
+            cache_size_mb: Least recently used responses are evicted beyond this size
+        """
         self.business_id = business_id
         self.model_name = model_name
         self.running = True
@@ -37,17 +51,28 @@ class SimplifiedContentGenerator:
             logger.error(f"Failed to load business config: {e}")
             raise
 
+        # Initialize the response cache
+        self.llm_cache = None
+        if use_cache:
+            try:
+                cache_path = Path(self.business_config.db_path).with_name('llm_cache.db')
+                self.llm_cache = LLMResponseCache(str(cache_path), cache_size_mb * 1024 * 1024)
+                logger.info(f"✓ Response cache ready: {cache_path}")
+            except Exception as e:
+                logger.warning(f"Response cache unavailable, generating without it: {e}")
+
         # Initialize Ollama
         try:
-            self.ollama = OllamaManager(model_name)
-            logger.info(f"✓ Ollama initialized: {model_name}")
+            self.ollama = OllamaManager(model_name, backend=ollama_backend, cache=self.llm_cache)
+            logger.info(f"✓ Ollama initialized: {model_name} ({ollama_backend} backend)")
         except Exception as e:
             logger.error(f"Failed to initialize Ollama: {e}")
             raise
 
-        # Initialize database
+        # Initialize database - one connection shared by worker threads, guarded by db_lock
+        self.db_lock = threading.Lock()
         try:
-            self.conn = setup_database(self.business_config.db_path)
+            self.conn = setup_database(self.business_config.db_path, check_same_thread=False)
             logger.info(f"✓ Database ready: {self.business_config.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
@@ -92,23 +117,33 @@ class SimplifiedContentGenerator:
     def _content_exists(self, url: str) -> bool:
         """Check if content already exists"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT id FROM blogs WHERE seo_friendly_url = ? AND business_id = ?', (url, self.business_id))
-            return cursor.fetchone() is not None
+            with self.db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT id FROM blogs WHERE seo_friendly_url = ? AND business_id = ?', (url, self.business_id))
+                return cursor.fetchone() is not None
         except Exception as e:
             logger.warning(f"Error checking existing content: {e}")
             return False
 
-    def _generate_content(self, prompt: str, content_type: str) -> Optional[str]:
+    def _clean_section(self, raw_content: Optional[str]) -> Optional[str]:
+        """Clean generated text, or None when too little is left"""
+        if raw_content:
+            cleaned = clean_content(raw_content)
+            if len(cleaned.strip()) > 20:
+                return cleaned
+        return None
+
+    def _generate_content(self, prompt: str, content_type: str, ollama: Optional[OllamaManager] = None,
+                          cache_scope: str = '') -> Optional[str]:
         """Generate content with basic retry"""
-        max_retries = 2
+        ollama = ollama or self.ollama
+        max_retries = SECTION_ATTEMPTS
         for attempt in range(max_retries):
             try:
-                raw_content = self.ollama.run_prompt(prompt)
-                if raw_content:
-                    cleaned = clean_content(raw_content)
-                    if len(cleaned.strip()) > 20:
-                        return cleaned
+                # A retry must not get the rejected cached response back
+                cleaned = self._clean_section(ollama.run_prompt(prompt, refresh=attempt > 0, cache_scope=cache_scope))
+                if cleaned:
+                    return cleaned
                 logger.warning(f"{content_type} attempt {attempt + 1} failed - content too short")
             except Exception as e:
                 logger.warning(f"{content_type} attempt {attempt + 1} failed: {e}")
@@ -117,8 +152,13 @@ class SimplifiedContentGenerator:
         logger.error(f"Failed to generate {content_type} after {max_retries} attempts")
         return None
 
-    def generate_blog_content(self, keyword: str, location: str) -> Dict[str, Any]:
-        """Generate complete blog content with status-based approach"""
+    def plan_blog(self, keyword: str, location: str) -> Dict[str, Any]:
+        """
+        Resolve the location and reserve a unique title, description and URL
+
+        Returns a plan for section_prompt()/save_blog(), or a failure result
+        ({"success": False, ...}) when the URL already exists.
+        """
         start_time = time.time()
         city, state = parse_location(location)
         if not city or city == "UNKNOWN":
@@ -146,15 +186,17 @@ class SimplifiedContentGenerator:
             title_preposition = "coming to"
             content_tone = "coming_soon"
 
-        title = EnhancedContentPrompts.generate_unique_title(
-            keyword, city, state, self.used_titles, title_preposition
-        )
-        meta_description = EnhancedContentPrompts.generate_unique_meta_description(
-            keyword, city, state, self.used_descriptions, location_info.status
-        )
+        # Pick and reserve a unique title/description before another worker can
+        with self.db_lock:
+            title = EnhancedContentPrompts.generate_unique_title(
+                keyword, city, state, self.used_titles, title_preposition
+            )
+            meta_description = EnhancedContentPrompts.generate_unique_meta_description(
+                keyword, city, state, self.used_descriptions, location_info.status
+            )
 
-        self.used_titles.add(title)
-        self.used_descriptions.add(meta_description)
+            self.used_titles.add(title)
+            self.used_descriptions.add(meta_description)
         url = enhanced_seo_friendly_url(title, keyword, location)
 
         if self._content_exists(url):
@@ -163,38 +205,61 @@ class SimplifiedContentGenerator:
 
         logger.info(f"Generating ({location_info.status}): {title}")
 
-        contents = {}
-        location_dict = {
-            "city": location_info.city,
-            "state": location_info.state,
-            "email": location_info.email,
-            "phone": location_info.phone,
-            "address": location_info.address
+        return {
+            "success": True,
+            "keyword": keyword,
+            "location": location,
+            "city": city,
+            "state": state,
+            "location_info": location_info,
+            "location_dict": {
+                "city": location_info.city,
+                "state": location_info.state,
+                "email": location_info.email,
+                "phone": location_info.phone,
+                "address": location_info.address
+            },
+            "title_preposition": title_preposition,
+            "content_tone": content_tone,
+            "title": title,
+            "meta_description": meta_description,
+            "url": url,
+            # Cached responses are only replayed for the same blog. The URL only
+            # encodes keyword and location; the reserved title is unique per blog
+            # and the same title is picked again when an unsaved blog is resumed
+            "cache_scope": title,
+            "contents": {},
+            "start_time": start_time
         }
 
-        intro_prompt = EnhancedContentPrompts.intro_prompt(
-            keyword, title_preposition, location, self.business_config.business_name,
-            self.business_config.description, location_dict, city, content_tone
-        )
-        contents['intro'] = self._generate_content(intro_prompt, 'introduction')
-
-        if contents['intro']:
-            middle_prompt = EnhancedContentPrompts.middle_prompt(
-                keyword, self.business_config.business_name, location_dict, 
-                city, contents['intro'], content_tone
+    def section_prompt(self, plan: Dict[str, Any], section: str) -> str:
+        """Build the prompt for one section; later sections include the earlier ones"""
+        contents = plan["contents"]
+        if section == 'intro':
+            return EnhancedContentPrompts.intro_prompt(
+                plan["keyword"], plan["title_preposition"], plan["location"], self.business_config.business_name,
+                self.business_config.description, plan["location_dict"], plan["city"], plan["content_tone"]
             )
-            contents['middle'] = self._generate_content(middle_prompt, 'middle')
-
-        if contents['intro'] and contents['middle']:
-            conclusion_prompt = EnhancedContentPrompts.conclusion_prompt(
-                self.business_config.business_name, location_dict, city,
+        if section == 'middle':
+            return EnhancedContentPrompts.middle_prompt(
+                plan["keyword"], self.business_config.business_name, plan["location_dict"],
+                plan["city"], contents['intro'], plan["content_tone"]
+            )
+        if section == 'conclusion':
+            return EnhancedContentPrompts.conclusion_prompt(
+                self.business_config.business_name, plan["location_dict"], plan["city"],
                 contents['intro'], contents['middle'], self.business_config.online_ordering_url,
-                content_tone
+                plan["content_tone"]
             )
-            contents['conclusion'] = self._generate_content(conclusion_prompt, 'conclusion')
+        raise ValueError(f"Unknown section: {section}")
 
-        required_sections = ['intro', 'middle', 'conclusion']
-        missing_sections = [section for section in required_sections if not contents.get(section)]
+    def save_blog(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a planned blog once its sections are generated"""
+        contents = plan["contents"]
+        location_info = plan["location_info"]
+        title = plan["title"]
+
+        missing_sections = [section for section in SECTIONS if not contents.get(section)]
 
         if missing_sections:
             logger.error(f"Failed to generate: {missing_sections}")
@@ -202,10 +267,10 @@ class SimplifiedContentGenerator:
 
         full_content = f"{contents['intro']} {contents['middle']} {contents['conclusion']}"
         word_count = len(full_content.split())
-        generation_time = time.time() - start_time
+        generation_time = time.time() - plan["start_time"]
 
         try:
-            with self.conn:
+            with self.db_lock, self.conn:
                 cursor = self.conn.execute('''
                     INSERT INTO blogs (
                         business_id, title, seo_friendly_url, metaDescription,
@@ -215,9 +280,9 @@ class SimplifiedContentGenerator:
                     )
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
-                    self.business_id, title, url, meta_description,
+                    self.business_id, title, plan["url"], plan["meta_description"],
                     contents['intro'], contents['middle'], contents['conclusion'],
-                    keyword, location, city, state, location_info.status,
+                    plan["keyword"], plan["location"], plan["city"], plan["state"], location_info.status,
                     location_info.phone, location_info.address,
                     word_count, datetime.now().isoformat(), datetime.now().isoformat()
                 ))
@@ -228,7 +293,7 @@ class SimplifiedContentGenerator:
                 "success": True,
                 "blog_id": blog_id,
                 "title": title,
-                "url": url,
+                "url": plan["url"],
                 "word_count": word_count,
                 "generation_time": generation_time,
                 "location_status": location_info.status
@@ -237,9 +302,38 @@ class SimplifiedContentGenerator:
             logger.error(f"Database error: {e}")
             return {"success": False, "reason": "database_error", "error": str(e)}
 
+    def generate_blog_content(self, keyword: str, location: str, ollama: Optional[OllamaManager] = None) -> Dict[str, Any]:
+        """Generate complete blog content with status-based approach
+
+        Safe to call from several threads at once; pass each worker's own
+        OllamaManager as ollama to spread prompts over several model hosts.
+        """
+        plan = self.plan_blog(keyword, location)
+        if not plan.get("success"):
+            return plan
+
+        # Each section's prompt includes the sections before it
+        for section in SECTIONS:
+            plan["contents"][section] = self._generate_content(
+                self.section_prompt(plan, section), SECTION_LABELS[section], ollama, plan["cache_scope"]
+            )
+            if not plan["contents"][section]:
+                break
+
+        return self.save_blog(plan)
+
     def cleanup(self):
         """Clean up resources"""
         try:
+            if hasattr(self, 'ollama') and self.ollama:
+                self.ollama.close()
+            if getattr(self, 'llm_cache', None):
+                stats = self.llm_cache.stats()
+                logger.info(f"Response cache: {stats['hits']} hits, {stats['misses']} misses "
+                            f"({stats['hit_rate']:.0%}), {stats['entries']} entries, {stats['size_mb']} MB")
+                self.llm_cache.close()
+            if getattr(self, 'exporter', None):
+                self.exporter.close()
             if hasattr(self, 'conn') and self.conn:
                 self.conn.close()
                 logger.info("Database connection closed")
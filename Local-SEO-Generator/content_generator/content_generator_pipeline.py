@@ -0,0 +1,206 @@
+# Local-SEO-Generator/generete-blogs/version-2/content_generator/content_generator_pipeline.py
+import time
+import queue
+import logging
+import itertools
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.ollama_utils import OllamaManager
+from .content_generator_core import SimplifiedContentGenerator, SECTIONS, SECTION_LABELS, SECTION_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class SectionPipeline:
+    """
+    Interleaves intro/middle/conclusion prompts from several blogs
+
+    A blog's sections still run in order (each prompt includes the earlier
+    sections), but `llm_slots` threads only ever call the model. Cleanup,
+    prompt building, title reservation and DB writes happen on the calling
+    thread, so a slot picks up blog B's intro while blog A's middle result
+    is being cleaned and saved. Later sections are served first, which
+    finishes blogs already started before new ones are opened.
+    """
+
+    def __init__(self, generator: SimplifiedContentGenerator, llm_slots: int = 1,
+                 max_in_flight: Optional[int] = None, ollama_hosts: Optional[List[str]] = None):
+        self.generator = generator
+        self.llm_slots = max(1, llm_slots)
+        # More blogs than slots, so a slot always has a prompt waiting for it
+        self.max_in_flight = max_in_flight or self.llm_slots * 2
+        self.ollama_hosts = ollama_hosts or []
+
+        self._jobs = queue.PriorityQueue()
+        self._done = queue.Queue()
+        self._order = itertools.count()
+        self._stage_wait = {section: [] for section in SECTIONS}
+        self._stage_llm = {section: [] for section in SECTIONS}
+        self._depth_samples = []
+        self._llm_busy = 0.0
+        self._busy_lock = threading.Lock()
+
+    def _submit(self, plan: Dict[str, Any], section: str, attempt: int = 0):
+        """Queue one section prompt; later sections go first"""
+        job = {
+            "plan": plan,
+            "section": section,
+            "attempt": attempt,
+            "prompt": self.generator.section_prompt(plan, section),
+            "queued_at": time.perf_counter()
+        }
+        self._jobs.put((-SECTIONS.index(section), next(self._order), job))
+        self._depth_samples.append(self._jobs.qsize())
+
+    def _llm_worker(self, ollama: OllamaManager):
+        while True:
+            _, _, job = self._jobs.get()
+            if job is None:
+                return
+            started = time.perf_counter()
+            try:
+                job["raw"] = ollama.run_prompt(job["prompt"], refresh=job["attempt"] > 0,
+                                               cache_scope=job["plan"]["cache_scope"])
+            except Exception as e:
+                job["error"] = e
+            finished = time.perf_counter()
+
+            with self._busy_lock:
+                self._llm_busy += finished - started
+            self._stage_wait[job["section"]].append(started - job["queued_at"])
+            self._stage_llm[job["section"]].append(finished - started)
+            self._done.put(job)
+
+    def run(self, items: Iterable[Tuple[str, str, str]],
+            on_result: Callable[[Tuple[str, str, str], Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Generate a blog for every (keyword, location, status) item, in order
+
+        Longer tuples, such as a RunTask with its position, are accepted and
+        handed back to on_result unchanged. Items are taken from the iterable only when there is room for another
+        blog, so it can claim work lazily (GenerationRun.claim_all).
+        on_result(item, result) is called on this thread as each blog finishes.
+        Clearing generator.running stops new blogs; started ones are finished.
+        Returns latency, queue depth and throughput statistics.
+        """
+        generator = self.generator
+        start = time.perf_counter()
+
+        managers = [OllamaManager(generator.model_name, backend=generator.ollama.backend, host=host,
+                                  cache=generator.llm_cache)
+                    for host in self.ollama_hosts]
+        threads = [
+            threading.Thread(target=self._llm_worker, args=(managers[n % len(managers)] if managers else generator.ollama,),
+                             name=f"llm-slot-{n + 1}", daemon=True)
+            for n in range(self.llm_slots)
+        ]
+        for thread in threads:
+            thread.start()
+
+        pending = iter(items)
+        exhausted = False
+        in_flight = {}
+        completed = 0
+
+        try:
+            while True:
+                # Open new blogs while there is room
+                while not exhausted and generator.running and len(in_flight) < self.max_in_flight:
+                    item = next(pending, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    keyword, location = item[:2]
+                    try:
+                        plan = generator.plan_blog(keyword, location)
+                    except Exception as e:
+                        logger.error(f"Error generating {keyword}/{location}: {e}")
+                        on_result(item, {"success": False, "reason": f"exception: {e}"})
+                        continue
+                    if not plan.get("success"):
+                        on_result(item, plan)
+                        continue
+                    in_flight[id(plan)] = item
+                    self._submit(plan, SECTIONS[0])
+
+                if not in_flight:
+                    if not exhausted and generator.running:
+                        continue
+                    if not generator.running:
+                        logger.info("Generation stopped by user")
+                    break
+
+                try:
+                    job = self._done.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                plan, section = job["plan"], job["section"]
+                label = SECTION_LABELS[section]
+                cleaned = generator._clean_section(job.get("raw")) if "error" not in job else None
+
+                if cleaned:
+                    plan["contents"][section] = cleaned
+                    next_index = SECTIONS.index(section) + 1
+                    if next_index < len(SECTIONS):
+                        self._submit(plan, SECTIONS[next_index])
+                        continue
+                else:
+                    reason = job.get("error") or "content too short"
+                    logger.warning(f"{label} attempt {job['attempt'] + 1} failed: {reason}")
+                    if job["attempt"] + 1 < SECTION_ATTEMPTS:
+                        self._submit(plan, section, job["attempt"] + 1)
+                        continue
+                    logger.error(f"Failed to generate {label} after {SECTION_ATTEMPTS} attempts")
+
+                # Blog finished, or gave up on a section
+                item = in_flight.pop(id(plan))
+                on_result(item, generator.save_blog(plan))
+                completed += 1
+        finally:
+            for _ in threads:
+                self._jobs.put((len(SECTIONS), next(self._order), None))
+            for thread in threads:
+                thread.join()
+            for manager in managers:
+                manager.close()
+
+        return self._stats(time.perf_counter() - start, completed)
+
+    def _stats(self, elapsed: float, completed: int) -> Dict[str, Any]:
+        stages = {}
+        for section in SECTIONS:
+            waits, llm = self._stage_wait[section], self._stage_llm[section]
+            stages[section] = {
+                "count": len(llm),
+                "llm_avg_s": round(sum(llm) / len(llm), 3) if llm else 0.0,
+                "llm_p95_s": round(_percentile(llm, 0.95), 3),
+                "queue_wait_avg_s": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            }
+        depths = self._depth_samples
+        return {
+            "blogs_completed": completed,
+            "elapsed_s": round(elapsed, 2),
+            "blogs_per_hour": round(completed / elapsed * 3600, 1) if elapsed else 0.0,
+            "llm_slots": self.llm_slots,
+            "llm_utilization": round(self._llm_busy / (elapsed * self.llm_slots), 3) if elapsed else 0.0,
+            "queue_depth_avg": round(sum(depths) / len(depths), 2) if depths else 0.0,
+            "queue_depth_max": max(depths) if depths else 0,
+            "stages": stages,
+        }
+
+def log_pipeline_stats(stats: Dict[str, Any]):
+    """Log a pipeline run's throughput, per-stage latency and queue depth"""
+    logger.info(f"Pipeline: {stats['blogs_completed']} blogs in {stats['elapsed_s']}s "
+                f"({stats['blogs_per_hour']} blogs/hour), {stats['llm_slots']} LLM slot(s) "
+                f"{stats['llm_utilization']:.0%} busy")
+    logger.info(f"  Queue depth: avg {stats['queue_depth_avg']}, max {stats['queue_depth_max']}")
+    for section, stage in stats["stages"].items():
+        logger.info(f"  {section}: {stage['count']} prompts, LLM avg {stage['llm_avg_s']}s "
+                    f"(p95 {stage['llm_p95_s']}s), queue wait avg {stage['queue_wait_avg_s']}s")
@@ -0,0 +1,162 @@
+# Local-SEO-Generator/generete-blogs/version-2/content_generator/content_generator_runs.py
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .content_generator_core import SimplifiedContentGenerator
+
+logger = logging.getLogger(__name__)
+
+# A failed task is retried by --resume until it has been attempted this often
+MAX_TASK_ATTEMPTS = 3
+
+class RunTask(NamedTuple):
+    """A claimed task; position identifies it, since two tasks may share keyword and location"""
+    keyword: str
+    location: str
+    status: str
+    position: int
+
+class GenerationRun:
+    """
+    A batch run's planned (keyword, location) tasks, persisted in the blogs database
+
+    The plan is written once, in priority order, and each task moves from
+    pending to in_progress (claimed by a worker) to done or failed. A run
+    interrupted by Ctrl+C, a crash or a timeout storm is picked up again
+    with resume(): finished tasks are never replanned or regenerated, and
+    tasks left in progress or failed go back to pending.
+
+    Uses the generator's shared connection under its db_lock.
+    """
+
+    def __init__(self, generator: SimplifiedContentGenerator, run_id: str):
+        self.generator = generator
+        self.run_id = run_id
+        self.total = 0
+
+    @classmethod
+    def create(cls, generator: SimplifiedContentGenerator, selected: List[Tuple[str, str, str]],
+               run_id: Optional[str] = None) -> 'GenerationRun':
+        """Persist a new run's tasks in the order they should be generated"""
+        run = cls(generator, run_id or datetime.now().strftime('%Y%m%d-%H%M%S'))
+        now = datetime.now().isoformat()
+        with generator.db_lock, generator.conn:
+            if generator.conn.execute('SELECT 1 FROM generation_runs WHERE run_id = ?', (run.run_id,)).fetchone():
+                raise ValueError(f"Run {run.run_id} already exists; use --resume to continue it")
+            generator.conn.execute(
+                'INSERT INTO generation_runs (run_id, business_id, total, status, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (run.run_id, generator.business_id, len(selected), 'running', now, now)
+            )
+            generator.conn.executemany(
+                'INSERT INTO generation_tasks (run_id, position, keyword, location, location_status, state, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(run.run_id, i, keyword, location, status, 'pending', now)
+                 for i, (keyword, location, status) in enumerate(selected, 1)]
+            )
+        run.total = len(selected)
+        logger.info(f"Planned run {run.run_id}: {len(selected)} tasks")
+        return run
+
+    @classmethod
+    def resume(cls, generator: SimplifiedContentGenerator, run_id: Optional[str] = None) -> 'GenerationRun':
+        """Reopen a run (the latest unfinished one by default) and requeue unfinished tasks"""
+        with generator.db_lock, generator.conn:
+            if run_id is None:
+                row = generator.conn.execute(
+                    "SELECT run_id FROM generation_runs WHERE business_id = ? AND status != 'completed' "
+                    "ORDER BY created_at DESC LIMIT 1",
+                    (generator.business_id,)
+                ).fetchone()
+                if row is None:
+                    raise ValueError(f"No unfinished run to resume for {generator.business_id}")
+                run_id = row[0]
+            elif not generator.conn.execute('SELECT 1 FROM generation_runs WHERE run_id = ?', (run_id,)).fetchone():
+                raise ValueError(f"Unknown run: {run_id}")
+
+            # In progress means the previous process died mid-blog
+            now = datetime.now().isoformat()
+            generator.conn.execute(
+                "UPDATE generation_tasks SET state = 'pending', updated_at = ? "
+                "WHERE run_id = ? AND (state = 'in_progress' OR (state = 'failed' AND attempts < ?))",
+                (now, run_id, MAX_TASK_ATTEMPTS)
+            )
+            generator.conn.execute(
+                "UPDATE generation_runs SET status = 'running', updated_at = ? WHERE run_id = ?", (now, run_id)
+            )
+            total = generator.conn.execute(
+                'SELECT COUNT(*) FROM generation_tasks WHERE run_id = ?', (run_id,)
+            ).fetchone()[0]
+
+        run = cls(generator, run_id)
+        run.total = total
+        counts = run.counts()
+        logger.info(f"Resuming run {run_id}: {counts.get('pending', 0)} pending, "
+                    f"{counts.get('done', 0)} done, {counts.get('failed', 0)} failed for good")
+        return run
+
+    def claim(self) -> Optional[RunTask]:
+        """Take the highest-priority pending task, or None when there is none left"""
+        generator = self.generator
+        with generator.db_lock, generator.conn:
+            row = generator.conn.execute(
+                "SELECT position, keyword, location, location_status FROM generation_tasks "
+                "WHERE run_id = ? AND state = 'pending' ORDER BY position LIMIT 1",
+                (self.run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            generator.conn.execute(
+                "UPDATE generation_tasks SET state = 'in_progress', attempts = attempts + 1, updated_at = ? "
+                "WHERE run_id = ? AND position = ?",
+                (datetime.now().isoformat(), self.run_id, row[0])
+            )
+        return RunTask(row[1], row[2], row[3], row[0])
+
+    def claim_all(self):
+        """Claim tasks one at a time, as the caller asks for them"""
+        while self.generator.running:
+            task = self.claim()
+            if task is None:
+                return
+            yield task
+
+    def finish(self, task: RunTask, result: Dict[str, Any]):
+        """Record a claimed task's outcome; a URL that already exists counts as done"""
+        succeeded = result.get("success") or result.get("reason") == "duplicate_content"
+        with self.generator.db_lock, self.generator.conn:
+            self.generator.conn.execute(
+                'UPDATE generation_tasks SET state = ?, blog_id = ?, last_error = ?, updated_at = ? '
+                'WHERE run_id = ? AND position = ?',
+                ('done' if succeeded else 'failed', result.get("blog_id"),
+                 None if result.get("success") else result.get("reason", "unknown"),
+                 datetime.now().isoformat(), self.run_id, task.position)
+            )
+
+    def counts(self) -> Dict[str, int]:
+        with self.generator.db_lock:
+            rows = self.generator.conn.execute(
+                'SELECT state, COUNT(*) FROM generation_tasks WHERE run_id = ? GROUP BY state', (self.run_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> Dict[str, int]:
+        """Mark the run completed if nothing is left to retry, else interrupted; returns task counts"""
+        counts = self.counts()
+        with self.generator.db_lock, self.generator.conn:
+            retryable = self.generator.conn.execute(
+                "SELECT COUNT(*) FROM generation_tasks WHERE run_id = ? "
+                "AND (state IN ('pending', 'in_progress') OR (state = 'failed' AND attempts < ?))",
+                (self.run_id, MAX_TASK_ATTEMPTS)
+            ).fetchone()[0]
+            status = 'interrupted' if retryable else 'completed'
+            self.generator.conn.execute(
+                'UPDATE generation_runs SET status = ?, updated_at = ? WHERE run_id = ?',
+                (status, datetime.now().isoformat(), self.run_id)
+            )
+        if retryable:
+            logger.info(f"Run {self.run_id} {status}: {retryable} task(s) left, continue with --resume --run-id {self.run_id}")
+        else:
+            logger.info(f"Run {self.run_id} {status}")
+        return counts
@@ -1,18 +1,22 @@
 # Local-SEO-Generator/generete-blogs/version-2/content_generator/content_generator_tasks.py
+import os
 import time
 import logging
 import random
-from typing import Dict, Any, List, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from .content_generator_core import SimplifiedContentGenerator
+from .content_generator_pipeline import SectionPipeline, log_pipeline_stats
+from .content_generator_runs import GenerationRun
+from utils.ollama_utils import OllamaManager
 
 logger = logging.getLogger(__name__)
 
-def generate_multiple_blogs(generator: SimplifiedContentGenerator, count: int) -> Dict[str, Any]:
-    """
-    Generate specified number of blogs using the generator's business configuration.
-    Prioritizes operational locations, then upcoming.
-    """
-    start_time = time.time()
+# Ollama serves this many requests per model at once; a sensible default worker count
+DEFAULT_WORKERS = int(os.environ.get('OLLAMA_NUM_PARALLEL', '1'))
+
+def select_combinations(generator: SimplifiedContentGenerator, count: int) -> Tuple[List[Tuple[str, str, str]], int]:
+    """Pick up to count keyword/location combinations, operational locations first"""
     business_config = generator.business_config
 
     # Get SEO keywords and location combinations
@@ -26,9 +30,6 @@ def generate_multiple_blogs(generator: SimplifiedContentGenerator, count: int) -
                 location_info.status
             ))
 
-    if not combinations:
-        return {"success": False, "reason": "no_combinations_found"}
-
     # Shuffle and prioritize operational locations
     operational = [(k, l, s) for k, l, s in combinations if s == "operational"]
     upcoming = [(k, l, s) for k, l, s in combinations if s != "operational"]
@@ -36,30 +37,68 @@ def generate_multiple_blogs(generator: SimplifiedContentGenerator, count: int) -
     random.shuffle(operational)
     random.shuffle(upcoming)
 
-    selected = (operational + upcoming)[:count]
+    return (operational + upcoming)[:count], len(combinations)
 
-    logger.info(f"Generating {len(selected)} blogs from {len(combinations)} possible combinations")
-    logger.info(f"Priority: {len([s for _, _, s in selected if s == 'operational'])} operational, "
-                f"{len([s for _, _, s in selected if s != 'operational'])} upcoming")
+def generate_multiple_blogs(generator: SimplifiedContentGenerator, count: int = 0, workers: int = DEFAULT_WORKERS,
+                            ollama_hosts: Optional[List[str]] = None, delay: float = 0,
+                            pipeline: bool = False, run_id: Optional[str] = None,
+                            resume: bool = False) -> Dict[str, Any]:
+    """
+    Generate specified number of blogs using the generator's business configuration.
+    Prioritizes operational locations, then upcoming.
+
+    The selected keyword/location pairs are saved as a GenerationRun (run_id
+    defaults to a timestamp) and `workers` threads claim them from the
+    table in priority order, so operational locations are always started
+    first. Match workers to the backend's parallel capacity
+    (OLLAMA_NUM_PARALLEL, or the number of ollama_hosts; workers are spread
+    across the hosts). Setting generator.running to False stops new blogs
+    from starting and lets the ones in progress finish.
+
+    With resume=True, count is ignored and run_id (or the latest unfinished
+    run) continues where it stopped: done tasks are skipped, interrupted
+    and failed ones are generated again.
+
+    With pipeline=True the workers become LLM slots of a SectionPipeline:
+    sections of different blogs are interleaved and slots never wait on
+    cleanup or DB writes. Its statistics are returned as pipeline_stats.
+    """
+    start_time = time.time()
+    try:
+        if resume:
+            run = GenerationRun.resume(generator, run_id)
+        else:
+            selected, total_combinations = select_combinations(generator, count)
+            if not selected:
+                return {"success": False, "reason": "no_combinations_found"}
+            logger.info(f"Generating {len(selected)} blogs from {total_combinations} possible combinations")
+            logger.info(f"Priority: {len([s for _, _, s in selected if s == 'operational'])} operational, "
+                        f"{len([s for _, _, s in selected if s != 'operational'])} upcoming")
+            run = GenerationRun.create(generator, selected, run_id)
+    except ValueError as e:
+        return {"success": False, "reason": "run_not_found" if resume else "run_exists", "error": str(e)}
+
+    total = run.total
+    pending = run.counts().get('pending', 0)
+    workers = max(1, min(workers, pending))
+    logger.info(f"Run {run.run_id}: {pending} of {total} tasks to generate with {workers} worker(s)")
 
     results = {
         "success": True,
-        "total_requested": count,
+        "run_id": run.run_id,
+        "total_requested": pending,
         "total_generated": 0,
         "successful": [],
         "failed": [],
         "generation_time": 0,
         "by_status": {"operational": 0, "upcoming": 0, "coming_soon": 0}
     }
+    results_lock = threading.Lock()
 
-    for i, (keyword, location, status) in enumerate(selected, 1):
-        if not generator.running:
-            logger.info("Generation stopped by user")
-            break
-
-        logger.info(f"Generating {i}/{len(selected)}: {keyword} | {location} ({status})")
-        try:
-            result = generator.generate_blog_content(keyword, location)
+    def record(task, result):
+        keyword, location, status, i = task
+        run.finish(task, result)
+        with results_lock:
             if result.get("success"):
                 results["successful"].append({
                     "keyword": keyword,
@@ -71,27 +110,72 @@ def generate_multiple_blogs(generator: SimplifiedContentGenerator, count: int) -
                 })
                 results["total_generated"] += 1
                 results["by_status"][result.get("location_status", status)] += 1
-                logger.info(f"✓ {i}/{len(selected)}: {result['title']}")
+                logger.info(f"✓ {i}/{total}: {result['title']}")
             else:
                 results["failed"].append({
                     "keyword": keyword,
                     "location": location,
                     "reason": result.get("reason", "unknown")
                 })
-                logger.warning(f"✗ {i}/{len(selected)}: {result.get('reason', 'unknown')}")
-            time.sleep(2)
-        except Exception as e:
-            logger.error(f"Error generating {keyword}/{location}: {e}")
-            results["failed"].append({
-                "keyword": keyword,
-                "location": location,
-                "reason": f"exception: {e}"
-            })
+                logger.warning(f"✗ {i}/{total}: {result.get('reason', 'unknown')}")
+
+    try:
+        if pipeline:
+            section_pipeline = SectionPipeline(generator, llm_slots=workers, ollama_hosts=ollama_hosts)
+            # Tasks are claimed only as the pipeline has room for another blog
+            stats = section_pipeline.run(run.claim_all(), record)
+            log_pipeline_stats(stats)
+            results["pipeline_stats"] = stats
+            return _finish(generator, results, start_time)
+
+        def worker(ollama: Optional[OllamaManager]):
+            for task in run.claim_all():
+                keyword, location, status, i = task
+                logger.info(f"Generating {i}/{total}: {keyword} | {location} ({status})")
+                try:
+                    result = generator.generate_blog_content(keyword, location, ollama)
+                except Exception as e:
+                    logger.error(f"Error generating {keyword}/{location}: {e}")
+                    result = {"success": False, "reason": f"exception: {e}"}
+                record(task, result)
+                if delay and generator.running:
+                    time.sleep(delay)
+
+        # One OllamaManager per host; workers share them round-robin
+        managers = [
+            OllamaManager(generator.model_name, backend=generator.ollama.backend, host=host,
+                          cache=generator.llm_cache)
+            for host in (ollama_hosts or [])
+        ]
+        threads = [
+            threading.Thread(target=worker, args=(managers[n % len(managers)] if managers else None,),
+                             name=f"blog-worker-{n + 1}", daemon=True)
+            for n in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Short timeouts keep Ctrl+C responsive
+        try:
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=0.5)
+            if not generator.running:
+                logger.info("Generation stopped by user")
+        finally:
+            for manager in managers:
+                manager.close()
+
+        return _finish(generator, results, start_time)
+    finally:
+        results["run_tasks"] = run.close()
 
+def _finish(generator: SimplifiedContentGenerator, results: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+    """Export what was generated and stamp the total time"""
     # Export all generated content
     if results["total_generated"] > 0:
         try:
-            export_count = generator.exporter.export_to_react_app(force_update=True)
+            export_count = generator.exporter.export_to_react_app()
             logger.info(f"✓ Exported {export_count} blogs to React app")
             results["export_count"] = export_count
         except Exception as e:
@@ -99,4 +183,4 @@ def generate_multiple_blogs(generator: SimplifiedContentGenerator, count: int) -
             results["export_error"] = str(e)
 
     results["generation_time"] = time.time() - start_time
-    return results
\ No newline at end of file
+    return results
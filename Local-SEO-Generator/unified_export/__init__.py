@@ -1,6 +1,8 @@
 # Local-SEO-Generator/generete-blogs/version-2/unified_export/ __init__.py
 
 from .exporter_core import UnifiedExporter
-from .exporter_db import query_blogs
-from .exporter_utils import sanitize_filename, cleanup_old_backups
+from .exporter_db import BlogStore, query_blogs
+from .exporter_utils import sanitize_filename, cleanup_old_backups, atomic_write, ArtifactWriter, ArtifactStream
+from .exporter_stream import JsonArrayWriter, array_fragment, element_text, iter_array_fragments
+from .exporter_sitemap import SitemapWriter
 from .exporter_paths import ensure_default_paths
\ No newline at end of file
@@ -14,6 +14,7 @@ Examples:
   %(prog)s --business nash-and-smashed
   %(prog)s --business nash-and-smashed --individual
   %(prog)s --business nash-and-smashed --sitemap
+  %(prog)s --business nash-and-smashed --sitemap --gzip
   %(prog)s --business nash-and-smashed --force --individual
         """
     )
@@ -30,12 +31,17 @@ Examples:
     parser.add_argument(
         "--force", "-f", 
         action="store_true",
-        help="Force update regardless of content changes"
+        help="Rewrite every export from the database instead of only new or updated blogs"
     )
     parser.add_argument(
         "--sitemap", "-s", 
         action="store_true",
-        help="Generate sitemap entries"
+        help="Write the blog sitemap shards and their index"
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the sitemap shards (with --sitemap)"
     )
     parser.add_argument(
         "--stats", 
@@ -54,6 +60,7 @@ Examples:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    exporter = None
     try:
         # Import here to avoid circular imports
         from business_config.business_config import BusinessConfig
@@ -74,18 +81,16 @@ Examples:
                 print(f"{key}: {value}")
                 
         elif args.sitemap:
-            sitemap_entries = exporter.generate_sitemap_entries()
-            print(f"Generated {len(sitemap_entries)} sitemap entries:")
-            print(json.dumps(sitemap_entries, indent=2))
+            result = exporter.write_sitemaps(gzip_output=args.gzip)
+            if result.get("error"):
+                print(f"❌ Sitemap failed: {result['error']}", file=sys.stderr)
+                sys.exit(1)
+            print(f"✓ Sitemap: {result['urls']} URLs in {result['shards']} shard(s) "
+                  f"({result['written']} written, {result['unchanged']} unchanged)")
             
         else:
-            # Standard export
-            if args.force:
-                # Force update to React app first
-                count = exporter.export_to_react_app(force_update=True)
-                print(f"✓ Force exported {count} blogs to React app")
-                
-            result = exporter.export_all(include_individual_files=args.individual)
+            # Standard export, in one pass over the database
+            result = exporter.export_all(include_individual_files=args.individual, force_update=args.force)
             
             if result.get("error"):
                 print(f"❌ Export failed: {result['error']}", file=sys.stderr)
@@ -93,6 +98,8 @@ Examples:
             else:
                 print(f"✓ Export completed successfully!")
                 print(f"  Total blogs: {result['total']}")
+                if not args.force:
+                    print(f"  New or updated: {result['changed']}")
                 print(f"  React app: {result['react']}")
                 print(f"  Dist: {result['dist']}")
                 print(f"  Backup: {result['backup']}")
@@ -113,6 +120,10 @@ Examples:
             import traceback
             traceback.print_exc()
         sys.exit(1)
+
+    finally:
+        if exporter is not None:
+            exporter.close()
         
     sys.exit(0)
 
@@ -1,15 +1,58 @@
 # Local-SEO-Generator/generete-blogs/version-2/unified_export/exporter_core.py
 import json
-import sqlite3
+import hashlib
 import os
 import logging
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import asdict
 
+from .exporter_db import BlogStore, SITEMAP_COLUMNS
+from .exporter_sitemap import SitemapWriter, site_url, blog_url, lastmod_date
+from .exporter_utils import ArtifactWriter, ArtifactStream, atomic_write
+from .exporter_stream import JsonArrayWriter, array_fragment, element_text, iter_array_fragments
+
 logger = logging.getLogger(__name__)
 
+# Watermark of the last export, kept with the backups (not in the React tree)
+EXPORT_STATE_FILE = "export_state.json"
+# Hashes of the written files, so unchanged ones are not rewritten
+EXPORT_MANIFEST_FILE = "export_manifest.json"
+# Incremental exports write a full backup at most this often
+BACKUP_INTERVAL_HOURS = 24
+def _normalize_timestamp(value: Any) -> str:
+    """Make ISO ('2024-01-01T10:00:00.123') and SQLite ('2024-01-01 10:00:00') timestamps comparable"""
+    return str(value or "").replace("T", " ")[:19]
+
+def _fingerprint(fragment: str) -> str:
+    return hashlib.sha256(fragment.encode('utf-8')).hexdigest()
+
+class _Watermark:
+    """Tracks what an export contains as blogs stream past"""
+
+    def __init__(self, state: Optional[Dict[str, Any]] = None):
+        state = state or {}
+        self.count = state.get("count", 0)
+        self.last_id = state.get("last_id", 0)
+        self.last_updated_at = state.get("last_updated_at", "")
+        self.columns = state.get("columns")
+        # Blogs from the watermark's second, which every later query returns again
+        self.boundary = dict(state.get("boundary", {}))
+
+    def add(self, blog: Dict[str, Any], fragment: str, new: bool = True):
+        if new:
+            self.count += 1
+        self.last_id = max(self.last_id, blog["id"])
+        if self.columns is None:
+            self.columns = list(blog)
+        updated_at = _normalize_timestamp(blog.get("updated_at"))
+        if updated_at > self.last_updated_at:
+            self.last_updated_at = updated_at
+            self.boundary = {}
+        if updated_at == self.last_updated_at:
+            self.boundary[str(blog["id"])] = _fingerprint(fragment)
+
 class UnifiedExporter:
     """Advanced unified export system that puts content where it belongs"""
 
@@ -24,11 +67,15 @@ class UnifiedExporter:
 
         self.business_id = self.business_config.get("business_id")
         self.db_path = self.business_config.get("db_path")
+        self.store = BlogStore(self.db_path, self.business_id)
 
         # Extract output paths
         self.output_paths = self.business_config.get("output_paths", {})
         self._ensure_default_paths()
 
+        # Every export file goes through this: skipped if unchanged, else written atomically
+        self.writer = ArtifactWriter(Path(self.output_paths["backup"]) / EXPORT_MANIFEST_FILE)
+
         logger.debug(f"Initialized exporter for {self.business_id} with paths: {self.output_paths}")
 
     def _ensure_default_paths(self):
@@ -37,7 +84,7 @@ class UnifiedExporter:
             "react_app": f"src/core/Blogs/Templates/LocalSEO",
             "dist": f"dist/blogs/{self.business_id}/json",
             "backup": f"backup/blogs/{self.business_id}",
-            "sitemap": "dist/sitemaps"
+            "sitemap": "../public/sitemaps"
         }
         for key, path in defaults.items():
             if key not in self.output_paths:
@@ -51,231 +98,330 @@ class UnifiedExporter:
 
     def _query_blogs(self) -> List[Dict[str, Any]]:
         """Query blogs from database"""
-        conn = None
         try:
-            if not os.path.exists(self.db_path):
-                logger.error(f"Database file not found: {self.db_path}")
-                return []
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='blogs'
-            """)
-            if not cursor.fetchone():
-                logger.error("Blogs table not found in database")
-                return []
-            cursor.execute("PRAGMA table_info(blogs)")
-            columns = [column[1] for column in cursor.fetchall()]
-            if not columns:
-                logger.error("No columns found in blogs table")
-                return []
-            cursor.execute(
-                'SELECT * FROM blogs WHERE business_id = ? ORDER BY id DESC', 
-                (self.business_id,)
-            )
-            rows = cursor.fetchall()
-            blogs = []
-            field_mapping = {
-                "metaDescription": "metaDescription",
-                "introParagraph": "introParagraph", 
-                "middleParagraph": "middleParagraph",
-                "conclusionParagraph": "conclusionParagraph",
-                "seo_friendly_url": "url",
-                "business_id": "businessId"
-            }
-            for row in rows:
-                blog = {}
-                for col in columns:
-                    key = field_mapping.get(col, col)
-                    value = row[col]
-                    if value is None:
-                        value = ""
-                    blog[key] = value
-                blogs.append(blog)
+            blogs = list(self.store.iter_blogs())
             logger.debug(f"Queried {len(blogs)} blogs from database")
             return blogs
         except Exception as e:
             logger.error(f"Error querying blogs: {str(e)}")
             return []
-        finally:
-            if conn:
-                conn.close()
 
     def export_to_react_app(self, force_update: bool = False) -> int:
-        """Export content directly to React app location"""
+        """Export content directly to React app location
+
+        Only blogs added or updated since the last export (the watermark in
+        export_state.json) are read; they are spliced into the previous
+        database_content.json and blogs-list.json as those are streamed to
+        the React and dist locations. Everything is rewritten from the
+        database with force_update, on the first export, when an output was
+        changed by something else or when blogs were deleted.
+        """
         try:
-            react_path = Path(self.output_paths["react_app"])
-            react_path.mkdir(parents=True, exist_ok=True)
-            output_file = react_path / "database_content.json"
-            old_modified_time = None
-            if output_file.exists() and not force_update:
-                old_modified_time = os.path.getmtime(output_file)
-            blogs = self._query_blogs()
-            if not blogs:
+            state = self._load_export_state()
+            if state and not force_update:
+                result = self._export_changes(state)
+                if result is not None:
+                    return result["total"]
+
+            result = self._write_full_export(include_individual_files=bool(state and state.get("individual")))
+            if not result["total"]:
                 logger.warning(f"No blogs found for {self.business_id}")
                 return 0
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(blogs, f, indent=2, ensure_ascii=False)
-            if old_modified_time and not force_update:
-                new_modified_time = os.path.getmtime(output_file)
-                if abs(new_modified_time - old_modified_time) < 0.1:
-                    logger.debug("React app content unchanged - skipping additional exports")
-                    return len(blogs)
-            logger.info(f"Exported {len(blogs)} blogs to React app at {output_file}")
-            self._export_to_dist_location(blogs)
-            self._export_blogs_list(blogs)
-            self._create_backup(blogs)
-            return len(blogs)
+            logger.info(f"Exported {result['total']} blogs to React app at {Path(self.output_paths['react_app']) / 'database_content.json'}")
+            return result["total"]
         except Exception as e:
             logger.error(f"Error exporting to React app: {e}")
             return 0
 
-    def export_all(self, include_individual_files: bool = True) -> Dict[str, int]:
-        """Export content to all configured locations"""
+    def export_all(self, include_individual_files: bool = True, force_update: bool = True) -> Dict[str, int]:
+        """Export content to all configured locations
+
+        Without force_update, only new and updated blogs are exported when
+        the last export had the same include_individual_files setting.
+        """
         try:
-            blogs = self._query_blogs()
-            if not blogs:
+            result = None
+            if not force_update:
+                state = self._load_export_state()
+                if state and bool(state.get("individual")) == include_individual_files:
+                    result = self._export_changes(state)
+            if result is None:
+                result = self._write_full_export(include_individual_files)
+            if not result["total"]:
                 logger.warning(f"No blogs found for {self.business_id}")
                 return {"total": 0}
-            react_count = self._export_to_react_app(blogs)
-            dist_count = self._export_to_dist_location(blogs)
-            list_count = self._export_blogs_list(blogs)
-            backup_count = self._create_backup(blogs)
-            individual_count = 0
-            if include_individual_files:
-                individual_count = self._export_individual_files(blogs)
-            result = {
-                "react": react_count,
-                "dist": dist_count,
-                "list": list_count,
-                "backup": backup_count,
-                "individual": individual_count,
-                "total": len(blogs)
-            }
-            logger.info(f"Exported {len(blogs)} blogs to all locations: {result}")
+            logger.info(f"Exported {result['total']} blogs to all locations: {result}")
             return result
         except Exception as e:
             logger.error(f"Error in export_all: {e}")
             return {"total": 0, "error": str(e)}
 
-    def _export_to_react_app(self, blogs: List[Dict[str, Any]]) -> int:
-        """Write blogs to React app location"""
-        try:
-            react_path = Path(self.output_paths["react_app"])
-            react_path.mkdir(parents=True, exist_ok=True)
-            output_file = react_path / "database_content.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(blogs, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Exported {len(blogs)} blogs to React app at {output_file}")
-            return len(blogs)
-        except Exception as e:
-            logger.error(f"Error exporting to React app: {e}")
-            return 0
+    def _open_aggregates(self, filename: str) -> List[ArtifactStream]:
+        """Streams for an aggregate file in the React and dist locations"""
+        return [self.writer.open(Path(self.output_paths[path_name]) / filename)
+                for path_name in ["react_app", "dist"] if path_name in self.output_paths]
+
+    def _open_backup(self, count: int) -> Optional[ArtifactStream]:
+        """A backup file, already holding everything before the blogs array"""
+        if "backup" not in self.output_paths:
+            logger.debug("No backup path configured, skipping backup")
+            return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stream = ArtifactStream(Path(self.output_paths["backup"]) / f"blogs_backup_{timestamp}.json")
+        header = json.dumps({
+            "business_id": self.business_id,
+            "timestamp": timestamp,
+            "count": count,
+            "export_date": datetime.now().isoformat()
+        }, indent=2, ensure_ascii=False)
+        # Same layout as json.dump({..., "blogs": blogs}, indent=2)
+        stream.write(header[:-2] + ',\n  "blogs": ')
+        return stream
 
-    def _export_to_dist_location(self, blogs: List[Dict[str, Any]]) -> int:
-        """Write blogs to dist location"""
+    def _finish_backup(self, stream: Optional[ArtifactStream], content_digest: str) -> bool:
+        """Keep the backup unless the last one holds the same blogs"""
+        if stream is None:
+            return False
+        stream.write("\n}")
+        if self.writer.same_fingerprint("backup", content_digest):
+            logger.debug("Blogs unchanged since the last backup - skipping backup")
+            stream.discard()
+            return False
+        stream.commit()
+        self.writer.record_fingerprint("backup", content_digest)
+        self._cleanup_old_backups(stream.path.parent)
+        return True
+
+    def _write_individual_file(self, blog: Dict[str, Any], fragment: str) -> bool:
+        """Write one blog's own JSON file in the dist location"""
         try:
-            if "dist" not in self.output_paths:
-                logger.debug("No dist path configured, skipping dist export")
-                return 0
+            url = blog.get("url", blog.get("seo_friendly_url", f"blog-{blog.get('id', 'unknown')}"))
+            filename = self._sanitize_filename(url)
+            if not filename.endswith(".json"):
+                filename = f"{filename}.json"
             dist_path = Path(self.output_paths["dist"])
             dist_path.mkdir(parents=True, exist_ok=True)
-            output_file = dist_path / "database_content.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(blogs, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Exported {len(blogs)} blogs to dist directory at {output_file}")
-            return len(blogs)
+            self.writer.write_untracked(dist_path / filename, element_text(fragment))
+            return True
         except Exception as e:
-            logger.error(f"Error exporting to dist location: {e}")
-            return 0
+            logger.error(f"Error exporting individual file for blog {blog.get('id', 'unknown')}: {e}")
+            return False
+
+    def _write_full_export(self, include_individual_files: bool = False) -> Dict[str, int]:
+        """Stream every blog from the database into all exports in one pass and reset the watermark
 
-    def _export_blogs_list(self, blogs: List[Dict[str, Any]]) -> int:
-        """Create simplified blog list JSON"""
+        Only FETCH_SIZE rows and one serialised blog are held at a time;
+        each output is written to a temporary file and put in place at the
+        end (or dropped if its content did not change).
+        """
+        include_individual_files = include_individual_files and "dist" in self.output_paths
+        streams = []
         try:
-            blog_list = []
-            for blog in blogs:
-                blog_entry = {
-                    "title": blog.get("title", ""),
-                    "seo_friendly_url": blog.get("url", blog.get("seo_friendly_url", "")),
-                    "keyword": blog.get("keyword", ""),
-                    "location": blog.get("location", ""),
-                    "id": blog.get("id", ""),
-                    "city": blog.get("city", ""),
-                    "state": blog.get("state", "")
-                }
-                blog_list.append(blog_entry)
-            for path_name in ["react_app", "dist"]:
-                if path_name in self.output_paths:
-                    try:
-                        output_path = Path(self.output_paths[path_name])
-                        output_path.mkdir(parents=True, exist_ok=True)
-                        output_file = output_path / "blogs-list.json"
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(blog_list, f, indent=2, ensure_ascii=False)
-                        logger.debug(f"Created blogs list at {output_file}")
-                    except Exception as e:
-                        logger.error(f"Error creating blogs list for {path_name}: {e}")
-            logger.debug(f"Created blogs list with {len(blog_list)} entries")
-            return len(blog_list)
-        except Exception as e:
-            logger.error(f"Error creating blogs list: {e}")
-            return 0
+            with self.store.snapshot():
+                total = self.store.count()
+                if not total:
+                    return {"total": 0}
+                content_streams = self._open_aggregates("database_content.json")
+                list_streams = self._open_aggregates("blogs-list.json")
+                streams = content_streams + list_streams
+                backup_stream = self._open_backup(total)
+                if backup_stream:
+                    streams.append(backup_stream)
+
+                content = JsonArrayWriter(*content_streams)
+                blog_list = JsonArrayWriter(*list_streams)
+                backup = JsonArrayWriter(backup_stream, nesting=1) if backup_stream else None
+                watermark = _Watermark()
+                individual = 0
+
+                for blog in self.store.iter_blogs():
+                    fragment = array_fragment(blog)
+                    content.add(fragment)
+                    blog_list.add(array_fragment(self._blog_list_entry(blog)))
+                    if backup:
+                        backup.add(fragment)
+                    if include_individual_files:
+                        individual += self._write_individual_file(blog, fragment)
+                    watermark.add(blog, fragment)
+
+            content.close()
+            blog_list.close()
+            if backup:
+                backup.close()
+            for stream in content_streams + list_streams:
+                stream.commit()
+            backed_up = self._finish_backup(backup_stream, content_streams[0].digest)
+        finally:
+            for stream in streams:
+                if stream.temp_path.exists():
+                    stream.discard()
+
+        self._save_export_state(watermark, individual=include_individual_files, backed_up=backed_up)
+        return self._export_result(content.count, changed=content.count, backup=backed_up, individual=individual)
+
+    def _export_changes(self, state: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """Splice new and updated blogs into the exports; None if a full export is needed"""
+        with self.store.snapshot():
+            changed = list(self.store.iter_blogs(changed_since=state))
+            total = self.store.count()
+
+        new_ids = sorted((blog["id"] for blog in changed if blog["id"] > state["last_id"]), reverse=True)
+        if total != state["count"] + len(new_ids):
+            logger.info("Blogs were removed since the last export - rewriting all exports")
+            return None
+        if any(list(blog) != state.get("columns") for blog in changed):
+            logger.info("Blog columns changed since the last export - rewriting all exports")
+            return None
+
+        # Blogs from the watermark's second come back every time; drop the ones already exported as they are
+        fragments = {blog["id"]: array_fragment(blog) for blog in changed}
+        boundary = state.get("boundary", {})
+        changed = [blog for blog in changed if boundary.get(str(blog["id"])) != _fingerprint(fragments[blog["id"]])]
+        if not changed:
+            logger.debug("No new or updated blogs since the last export")
+            return self._export_result(total, changed=0)
+        changed_by_id = {blog["id"]: blog for blog in changed}
+
+        last_backup = state.get("last_backup")
+        backup_due = not last_backup or datetime.now() - datetime.fromisoformat(last_backup) > timedelta(hours=BACKUP_INTERVAL_HOURS)
+        react_path = Path(self.output_paths["react_app"])
+        previous_content = react_path / "database_content.json"
+        previous_list = react_path / "blogs-list.json"
+
+        content_streams = self._open_aggregates("database_content.json")
+        list_streams = self._open_aggregates("blogs-list.json")
+        backup_stream = self._open_backup(total) if backup_due else None
+        streams = content_streams + list_streams + ([backup_stream] if backup_stream else [])
+        content = JsonArrayWriter(*content_streams)
+        blog_list = JsonArrayWriter(*list_streams)
+        backup = JsonArrayWriter(backup_stream, nesting=1) if backup_stream else None
+        watermark = _Watermark(state)
+
+        def emit(fragment, list_fragment):
+            content.add(fragment)
+            blog_list.add(list_fragment)
+            if backup:
+                backup.add(fragment)
 
-    def _export_individual_files(self, blogs: List[Dict[str, Any]]) -> int:
-        """Export individual JSON files for each blog"""
         try:
-            if "dist" not in self.output_paths:
-                logger.debug("No dist path configured, skipping individual file export")
-                return 0
-            dist_path = Path(self.output_paths["dist"])
-            dist_path.mkdir(parents=True, exist_ok=True)
-            count = 0
-            for blog in blogs:
-                try:
-                    url = blog.get("url", blog.get("seo_friendly_url", f"blog-{blog.get('id', 'unknown')}"))
-                    filename = self._sanitize_filename(url)
-                    if not filename.endswith(".json"):
-                        filename = f"{filename}.json"
-                    output_file = dist_path / filename
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(blog, f, indent=2, ensure_ascii=False)
-                        count += 1
-                except Exception as e:
-                    logger.error(f"Error exporting individual file for blog {blog.get('id', 'unknown')}: {e}")
-                    continue
-            logger.debug(f"Exported {count} individual blog files")
-            return count
+            for blog_id in new_ids:
+                blog = changed_by_id[blog_id]
+                emit(fragments[blog_id], array_fragment(self._blog_list_entry(blog)))
+                watermark.add(blog, fragments[blog_id])
+
+            # Copy the previous export, swapping in updated blogs
+            exported = 0
+            previous_lists = iter_array_fragments(previous_list)
+            for fragment in iter_array_fragments(previous_content):
+                list_fragment = next(previous_lists)
+                blog_id = json.loads(list_fragment)["id"]
+                exported += 1
+                if blog_id in changed_by_id:
+                    blog = changed_by_id[blog_id]
+                    emit(fragments[blog_id], array_fragment(self._blog_list_entry(blog)))
+                    watermark.add(blog, fragments[blog_id], new=False)
+                else:
+                    emit(fragment, list_fragment)
+            if exported != state["count"] or next(previous_lists, None) is not None:
+                raise ValueError("previous export does not match its state")
+
+            content.close()
+            blog_list.close()
+            if backup:
+                backup.close()
+            for stream in content_streams + list_streams:
+                stream.commit()
+            backed_up = self._finish_backup(backup_stream, content_streams[0].digest)
+            if backed_up:
+                last_backup = datetime.now().isoformat()
+        except (ValueError, StopIteration, KeyError) as e:
+            logger.info(f"Could not patch the previous export ({e or type(e).__name__}) - rewriting all exports")
+            return None
+        finally:
+            for stream in streams:
+                if stream.temp_path.exists():
+                    stream.discard()
+
+        individual = 0
+        if state.get("individual") and "dist" in self.output_paths:
+            for blog in changed:
+                individual += self._write_individual_file(blog, fragments[blog["id"]])
+
+        self._save_export_state(watermark, individual=bool(state.get("individual")), last_backup=last_backup)
+        logger.info(f"Exported {len(changed)} new or updated blogs ({total} total) to React app")
+        return self._export_result(total, changed=len(changed), backup=backed_up, individual=individual)
+
+    def _export_result(self, total: int, changed: int, backup: bool = False, individual: int = 0) -> Dict[str, int]:
+        return {
+            "react": total if "react_app" in self.output_paths else 0,
+            "dist": total if "dist" in self.output_paths else 0,
+            "list": total,
+            "backup": total if backup else 0,
+            "individual": individual,
+            "changed": changed,
+            "total": total
+        }
+
+    def _blog_list_entry(self, blog: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "title": blog.get("title", ""),
+            "seo_friendly_url": blog.get("url", blog.get("seo_friendly_url", "")),
+            "keyword": blog.get("keyword", ""),
+            "location": blog.get("location", ""),
+            "id": blog.get("id", ""),
+            "city": blog.get("city", ""),
+            "state": blog.get("state", "")
+        }
+
+    def _export_state_path(self) -> Path:
+        return Path(self.output_paths["backup"]) / EXPORT_STATE_FILE
+
+    def _load_export_state(self) -> Optional[Dict[str, Any]]:
+        """The last export's watermark, if its outputs are still as it left them"""
+        try:
+            state_path = self._export_state_path()
+            if not state_path.exists():
+                return None
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get("business_id") != self.business_id or state.get("db_path") != os.path.abspath(self.db_path):
+                return None
+            for path_name in ["react_app", "dist"]:
+                for filename in ["database_content.json", "blogs-list.json"]:
+                    if path_name in self.output_paths and not self.writer.is_current(Path(self.output_paths[path_name]) / filename):
+                        logger.info(f"{filename} in {path_name} is missing or was changed - rewriting all exports")
+                        return None
+            return state
         except Exception as e:
-            logger.error(f"Error exporting individual files: {e}")
-            return 0
+            logger.warning(f"Could not read export state, doing a full export: {e}")
+            return None
 
-    def _create_backup(self, blogs: List[Dict[str, Any]]) -> int:
-        """Create backup of blog content"""
+    def _save_export_state(self, watermark: _Watermark, individual: bool, last_backup: Optional[str] = None,
+                           backed_up: bool = False):
         try:
-            if "backup" not in self.output_paths:
-                logger.debug("No backup path configured, skipping backup")
-                return 0
-            backup_path = Path(self.output_paths["backup"])
-            backup_path.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = backup_path / f"blogs_backup_{timestamp}.json"
-            backup_data = {
+            state = {
                 "business_id": self.business_id,
-                "timestamp": timestamp,
-                "count": len(blogs),
-                "export_date": datetime.now().isoformat(),
-                "blogs": blogs
+                "db_path": os.path.abspath(self.db_path),
+                "last_id": watermark.last_id,
+                "last_updated_at": watermark.last_updated_at,
+                "boundary": watermark.boundary,
+                "count": watermark.count,
+                "columns": watermark.columns or [],
+                "individual": individual,
+                "last_backup": datetime.now().isoformat() if backed_up else last_backup,
+                "exported_at": datetime.now().isoformat()
             }
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Created backup with {len(blogs)} blogs at {backup_file}")
-            self._cleanup_old_backups(backup_path)
-            return len(blogs)
+            state_path = self._export_state_path()
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(state_path, json.dumps(state, indent=2).encode('utf-8'))
+            self.writer.save()
+            logger.debug(f"Export files: {self.writer.written} written, {self.writer.skipped} unchanged")
         except Exception as e:
-            logger.error(f"Error creating backup: {e}")
-            return 0
+            logger.warning(f"Could not save export state, the next export will be a full one: {e}")
+
+    def close(self):
+        """Close the database connection (reopened by the next export)"""
+        self.store.close()
 
     def _cleanup_old_backups(self, backup_path: Path, keep_count: int = 5):
         """Clean up old backup files, keeping only the most recent ones"""
@@ -302,37 +448,31 @@ class UnifiedExporter:
             filename = filename[:100]
         return filename or "unnamed"
 
+    def write_sitemaps(self, gzip_output: bool = False) -> Dict[str, int]:
+        """Write the blog sitemap shards and their index to the sitemap path"""
+        try:
+            return SitemapWriter(self.store, self.writer, self.output_paths["sitemap"],
+                                 self.business_config.get("base_url", ""), gzip_output=gzip_output).write()
+        except Exception as e:
+            logger.error(f"Error writing sitemaps: {e}")
+            return {"urls": 0, "error": str(e)}
+
     def generate_sitemap_entries(self) -> List[Dict[str, str]]:
         """Generate sitemap entries for all blogs"""
         try:
-            blogs = self._query_blogs()
-            base_url = self.business_config.get("base_url", "")
-            if not base_url:
-                logger.warning("No base_url configured, using placeholder")
-                base_url = "example.com"
-            if base_url.startswith(("http://", "https://")):
-                base_url = base_url.split("//", 1)[1]
-            base_url = base_url.rstrip("/")
+            site = site_url(self.business_config.get("base_url", ""))
             sitemap_entries = []
-            for blog in blogs:
-                try:
-                    url = blog.get("url", blog.get("seo_friendly_url", ""))
-                    if not url:
-                        logger.debug(f"Skipping blog {blog.get('id', 'unknown')} - no URL")
-                        continue
-                    full_url = f"https://{base_url}/blog/{url}"
-                    lastmod = blog.get("updated_at", blog.get("created_at", datetime.now().isoformat()))
-                    if " " in str(lastmod):
-                        lastmod = str(lastmod).split(" ")[0]
-                    sitemap_entries.append({
-                        "url": full_url,
-                        "lastmod": str(lastmod),
-                        "changefreq": "monthly",
-                        "priority": "0.7"
-                    })
-                except Exception as e:
-                    logger.error(f"Error processing sitemap entry for blog {blog.get('id', 'unknown')}: {e}")
+            for blog in self.store.iter_blogs(SITEMAP_COLUMNS):
+                url = blog.get("url", "")
+                if not url:
+                    logger.debug(f"Skipping blog {blog.get('id', 'unknown')} - no URL")
                     continue
+                sitemap_entries.append({
+                    "url": blog_url(site, url),
+                    "lastmod": lastmod_date(blog),
+                    "changefreq": "monthly",
+                    "priority": "0.7"
+                })
             logger.info(f"Generated {len(sitemap_entries)} sitemap entries")
             return sitemap_entries
         except Exception as e:
@@ -342,10 +482,10 @@ class UnifiedExporter:
     def get_export_stats(self) -> Dict[str, Any]:
         """Get export statistics"""
         try:
-            blogs = self._query_blogs()
+            total = self.store.count()
             stats = {
                 "business_id": self.business_id,
-                "total_blogs": len(blogs),
+                "total_blogs": total,
                 "output_paths": dict(self.output_paths),
                 "last_export": datetime.now().isoformat(),
                 "database_path": self.db_path
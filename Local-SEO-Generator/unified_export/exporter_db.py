@@ -2,60 +2,118 @@
 import sqlite3
 import os
 import logging
-from typing import List, Dict, Any
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched from SQLite at a time while streaming
+FETCH_SIZE = 500
+
+# Database column -> exported key (other columns keep their name)
+FIELD_MAPPING = {
+    "metaDescription": "metaDescription",
+    "introParagraph": "introParagraph",
+    "middleParagraph": "middleParagraph",
+    "conclusionParagraph": "conclusionParagraph",
+    "seo_friendly_url": "url",
+    "business_id": "businessId"
+}
+
+# The sitemap needs none of the paragraphs
+SITEMAP_COLUMNS = ("id", "seo_friendly_url", "created_at", "updated_at")
+
+# blogs columns by (database path, PRAGMA schema_version), shared by every store
+_schema_cache: Dict[Tuple[str, int], List[str]] = {}
+
+class BlogStore:
+    """
+    Read access to one business's blogs over a single reusable connection
+
+    The blogs table's columns are looked up once per schema version, and
+    queries select only the columns they are asked for. Wrap related
+    queries in snapshot() to have them all see the same data.
+    """
+
+    def __init__(self, db_path: str, business_id: str):
+        self.db_path = db_path
+        self.business_id = business_id
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not os.path.exists(self.db_path):
+                raise FileNotFoundError(f"Database file not found: {self.db_path}")
+            self._conn = sqlite3.connect(self.db_path)
+        return self._conn
+
+    def columns(self) -> List[str]:
+        """The blogs table's columns, introspected only when the schema changed"""
+        version = self.conn.execute("PRAGMA schema_version").fetchone()[0]
+        key = (os.path.abspath(self.db_path), version)
+        columns = _schema_cache.get(key)
+        if columns is None:
+            columns = [column[1] for column in self.conn.execute("PRAGMA table_info(blogs)")]
+            if not columns:
+                raise LookupError("Blogs table not found in database")
+            _schema_cache[key] = columns
+        return columns
+
+    @contextmanager
+    def snapshot(self) -> Iterator['BlogStore']:
+        """Run the enclosed queries in one read transaction"""
+        conn = self.conn
+        conn.execute("BEGIN")
+        try:
+            yield self
+        finally:
+            conn.rollback()
+
+    def iter_blogs(self, columns: Optional[Sequence[str]] = None, changed_since: Optional[Dict[str, Any]] = None,
+                   batch_size: int = FETCH_SIZE, oldest_first: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream blogs, newest first unless oldest_first, batch_size rows at a time
+
+        Rows are dicts keyed by FIELD_MAPPING, with NULL as "". columns limits
+        the query to those columns (ones the table lacks are skipped). With
+        changed_since (an export state), only blogs added after its last_id
+        or updated in or after the second of its last_updated_at are returned.
+        """
+        available = self.columns()
+        selected = available if columns is None else [column for column in columns if column in available]
+        sql = f"SELECT {', '.join(selected)} FROM blogs WHERE business_id = ?"
+        params: Tuple[Any, ...] = (self.business_id,)
+        if changed_since:
+            sql += " AND (id > ? OR substr(replace(updated_at, 'T', ' '), 1, 19) >= ?)"
+            params += (changed_since["last_id"], changed_since["last_updated_at"])
+        cursor = self.conn.execute(sql + (" ORDER BY id" if oldest_first else " ORDER BY id DESC"), params)
+
+        keys = [FIELD_MAPPING.get(column, column) for column in selected]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield {key: "" if value is None else value for key, value in zip(keys, row)}
+
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM blogs WHERE business_id = ?', (self.business_id,)).fetchone()[0]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
 def query_blogs(db_path: str, business_id: str) -> List[Dict[str, Any]]:
     """Query blogs from the database for a given business_id."""
-    conn = None
+    store = BlogStore(db_path, business_id)
     try:
-        if not os.path.exists(db_path):
-            logger.error(f"Database file not found: {db_path}")
-            return []
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='blogs'
-        """)
-        if not cursor.fetchone():
-            logger.error("Blogs table not found in database")
-            return []
-        cursor.execute("PRAGMA table_info(blogs)")
-        columns = [column[1] for column in cursor.fetchall()]
-        if not columns:
-            logger.error("No columns found in blogs table")
-            return []
-        cursor.execute(
-            'SELECT * FROM blogs WHERE business_id = ? ORDER BY id DESC', 
-            (business_id,)
-        )
-        rows = cursor.fetchall()
-        blogs = []
-        field_mapping = {
-            "metaDescription": "metaDescription",
-            "introParagraph": "introParagraph", 
-            "middleParagraph": "middleParagraph",
-            "conclusionParagraph": "conclusionParagraph",
-            "seo_friendly_url": "url",
-            "business_id": "businessId"
-        }
-        for row in rows:
-            blog = {}
-            for col in columns:
-                key = field_mapping.get(col, col)
-                value = row[col]
-                if value is None:
-                    value = ""
-                blog[key] = value
-            blogs.append(blog)
+        blogs = list(store.iter_blogs())
         logger.debug(f"Queried {len(blogs)} blogs from database")
         return blogs
     except Exception as e:
         logger.error(f"Error querying blogs: {str(e)}")
         return []
     finally:
-        if conn:
-            conn.close()
\ No newline at end of file
+        store.close()
@@ -11,7 +11,7 @@ def ensure_default_paths(output_paths: dict, business_id: str) -> dict:
         "react_app": f"src/core/Blogs/Templates/LocalSEO",
         "dist": f"dist/blogs/{business_id}/json",
         "backup": f"backup/blogs/{business_id}",
-        "sitemap": "dist/sitemaps"
+        "sitemap": "../public/sitemaps"
     }
     for key, path in defaults.items():
         if key not in output_paths:
@@ -0,0 +1,132 @@
+# Local-SEO-Generator/generete-blogs/version-2/unified_export/exporter_sitemap.py
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from .exporter_db import BlogStore, SITEMAP_COLUMNS
+from .exporter_utils import ArtifactWriter
+
+logger = logging.getLogger(__name__)
+
+# Limit per sitemap file set by the sitemaps.org protocol
+SITEMAP_MAX_URLS = 50000
+# The index lists the shards, named sitemap-blogs-1.xml, sitemap-blogs-2.xml, ...
+SITEMAP_INDEX_FILE = "sitemap-blogs.xml"
+SHARD_PREFIX = "sitemap-blogs-"
+
+URLSET_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_FOOTER = '</urlset>'
+
+def site_url(base_url: str) -> str:
+    """https://host for a configured base_url with or without a scheme"""
+    if not base_url:
+        logger.warning("No base_url configured, using placeholder")
+        base_url = "example.com"
+    if base_url.startswith(("http://", "https://")):
+        base_url = base_url.split("//", 1)[1]
+    return f"https://{base_url.rstrip('/')}"
+
+def blog_url(site: str, seo_friendly_url: str) -> str:
+    """A blog page's address; pages are routed at /<seo_friendly_url> (src/routes.tsx)"""
+    return f"{site}/{seo_friendly_url}"
+
+def lastmod_date(blog: Dict[str, Any]) -> str:
+    """W3C date (YYYY-MM-DD) of a blog's last change"""
+    return str(blog.get("updated_at") or blog.get("created_at") or "")[:10]
+
+class SitemapWriter:
+    """
+    Writes the blog section's sitemap: shards of at most max_urls URLs and an index
+
+    Blogs are read oldest first with only the sitemap columns, so new blogs
+    land in the last shard and the others keep their URLs. A shard whose
+    entries hash the same as last time, and whose file is untouched, is
+    not rendered or written again. With gzip_output the shards are .xml.gz
+    (compressed with a fixed timestamp, so equal content gives equal bytes).
+    """
+
+    def __init__(self, store: BlogStore, writer: ArtifactWriter, output_dir: str, base_url: str,
+                 gzip_output: bool = False, max_urls: int = SITEMAP_MAX_URLS):
+        self.store = store
+        self.writer = writer
+        self.output_dir = Path(output_dir)
+        self.site = site_url(base_url)
+        # Shards are linked from the index by their public address, e.g. https://host/sitemaps/...
+        self.public_url = f"{self.site}/{self.output_dir.name}"
+        self.gzip_output = gzip_output
+        self.max_urls = max_urls
+
+    def _shard_name(self, number: int) -> str:
+        return f"{SHARD_PREFIX}{number}.xml" + (".gz" if self.gzip_output else "")
+
+    def _entry(self, blog: Dict[str, Any]) -> str:
+        return (
+            "  <url>\n"
+            f"    <loc>{escape(blog_url(self.site, blog['url']))}</loc>\n"
+            f"    <lastmod>{lastmod_date(blog)}</lastmod>\n"
+            "    <changefreq>monthly</changefreq>\n"
+            "    <priority>0.7</priority>\n"
+            "  </url>\n"
+        )
+
+    def _write_shard(self, number: int, entries: List[str], stats: Dict[str, int]) -> str:
+        """Write one shard unless its entries are unchanged; returns its file name"""
+        name = self._shard_name(number)
+        path = self.output_dir / name
+        digest = hashlib.sha256("".join(entries).encode('utf-8')).hexdigest()
+        if self.writer.same_fingerprint(f"sitemap:{name}", digest) and self.writer.is_current(path):
+            stats["unchanged"] += 1
+            return name
+
+        data = (URLSET_HEADER + "".join(entries) + URLSET_FOOTER).encode('utf-8')
+        if self.gzip_output:
+            data = gzip.compress(data, mtime=0)
+        self.writer.write(path, data)
+        self.writer.record_fingerprint(f"sitemap:{name}", digest)
+        stats["written"] += 1
+        return name
+
+    def write(self) -> Dict[str, int]:
+        """Write the shards and the index; returns URL and shard counts"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stats = {"urls": 0, "shards": 0, "written": 0, "unchanged": 0}
+        shards: List[Tuple[str, str]] = []
+        entries: List[str] = []
+        newest = ""
+
+        for blog in self.store.iter_blogs(SITEMAP_COLUMNS, oldest_first=True):
+            if not blog.get("url"):
+                logger.debug(f"Skipping blog {blog.get('id', 'unknown')} - no URL")
+                continue
+            entries.append(self._entry(blog))
+            newest = max(newest, lastmod_date(blog))
+            stats["urls"] += 1
+            if len(entries) == self.max_urls:
+                shards.append((self._write_shard(len(shards) + 1, entries, stats), newest))
+                entries, newest = [], ""
+        if entries or not shards:
+            shards.append((self._write_shard(len(shards) + 1, entries, stats), newest))
+        stats["shards"] = len(shards)
+
+        index = ['<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+        for name, lastmod in shards:
+            index.append(f"  <sitemap>\n    <loc>{escape(self.public_url)}/{name}</loc>\n")
+            if lastmod:
+                index.append(f"    <lastmod>{lastmod}</lastmod>\n")
+            index.append("  </sitemap>\n")
+        index.append("</sitemapindex>")
+        self.writer.write(self.output_dir / SITEMAP_INDEX_FILE, "".join(index))
+
+        # Shards left over from a larger corpus or the other compression setting
+        current = {name for name, _ in shards}
+        for path in self.output_dir.glob(f"{SHARD_PREFIX}*.xml*"):
+            if path.name not in current:
+                self.writer.remove(path)
+        self.writer.save()
+
+        logger.info(f"Sitemap: {stats['urls']} URLs in {stats['shards']} shard(s), "
+                    f"{stats['written']} written, {stats['unchanged']} unchanged")
+        return stats
@@ -0,0 +1,58 @@
+# Local-SEO-Generator/generete-blogs/version-2/unified_export/exporter_stream.py
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+def array_fragment(item: Dict[str, Any]) -> str:
+    """An element exactly as json.dump(items, f, indent=2) writes it inside the array."""
+    # JSON strings never contain raw newlines, so every newline is indentation
+    return "  " + json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
+def element_text(fragment: str) -> str:
+    """An array fragment as json.dump(item, f, indent=2) writes the item on its own."""
+    return fragment[2:].replace("\n  ", "\n")
+
+class JsonArrayWriter:
+    """
+    Writes a JSON array to several streams at once, one element at a time
+
+    The output is byte for byte what json.dump(items, f, indent=2) writes;
+    with nesting=1 it is the array as the value of a top-level key.
+    """
+
+    def __init__(self, *sinks, nesting: int = 0):
+        self.sinks = sinks
+        self.pad = "  " * nesting
+        self.count = 0
+
+    def add(self, fragment: str):
+        if self.pad:
+            fragment = self.pad + fragment.replace("\n", "\n" + self.pad)
+        text = ("[\n" if self.count == 0 else ",\n") + fragment
+        for sink in self.sinks:
+            sink.write(text)
+        self.count += 1
+
+    def close(self):
+        text = f"\n{self.pad}]" if self.count else "[]"
+        for sink in self.sinks:
+            sink.write(text)
+
+def iter_array_fragments(path: Path) -> Iterator[str]:
+    """Read back, one element at a time, an array of flat objects written by JsonArrayWriter."""
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        if first == "[]":
+            return
+        if first != "[\n":
+            raise ValueError(f"{path} is not an exported JSON array")
+        lines = []
+        for line in f:
+            if not lines and line == "]":
+                return
+            lines.append(line)
+            # Elements are flat objects, so only their closing brace has two spaces of indent
+            if line == "  },\n" or line == "  }\n":
+                yield "".join(lines)[:-2 if line.endswith(",\n") else -1]
+                lines = []
+        raise ValueError(f"{path} ends before its closing bracket")
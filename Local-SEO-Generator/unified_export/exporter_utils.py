@@ -1,8 +1,12 @@
 
 # Local-SEO-Generator/generete-blogs/version-2/unified_export/exporter_utils.py
+import os
 import re
+import json
+import hashlib
 import logging
 from pathlib import Path
+from typing import Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -28,4 +32,163 @@ def cleanup_old_backups(backup_path: Path, keep_count: int = 5):
             except Exception as e:
                 logger.warning(f"Could not remove old backup {old_backup}: {e}")
     except Exception as e:
-        logger.warning(f"Error cleaning up old backups: {e}")
\ No newline at end of file
+        logger.warning(f"Error cleaning up old backups: {e}")
+
+def atomic_write(path: Path, data: bytes):
+    """Write data through a temporary file and a rename, so readers never see a partial file."""
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+class ArtifactWriter:
+    """
+    Writes export files only when their bytes change
+
+    A manifest keeps each file's SHA-256 with the size and mtime it had
+    after the write. A file whose new content hashes the same, and that
+    nobody has touched since, is not rewritten, so it keeps its mtime and
+    webpack rebuilds and S3 syncs skip it. Other writes are atomic.
+    """
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = Path(manifest_path)
+        self.written = 0
+        self.skipped = 0
+        self._dirty = False
+        try:
+            self.manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.manifest = {}
+        self.manifest.setdefault("files", {})
+        self.manifest.setdefault("fingerprints", {})
+
+    @staticmethod
+    def _digest(content: Union[str, bytes]) -> str:
+        return hashlib.sha256(content.encode('utf-8') if isinstance(content, str) else content).hexdigest()
+
+    def is_current(self, path: Path) -> bool:
+        """True if path is still exactly as this writer last wrote it (same size and mtime)."""
+        entry = self.manifest["files"].get(str(path))
+        if not entry:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def _unchanged(self, path: Path, digest: str) -> bool:
+        entry = self.manifest["files"].get(str(path))
+        return bool(entry) and entry["sha256"] == digest and self.is_current(path)
+
+    def _record(self, path: Path, digest: str):
+        stat = os.stat(path)
+        self.manifest["files"][str(path)] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self._dirty = True
+        self.written += 1
+
+    def write(self, path: Path, content: Union[str, bytes]) -> bool:
+        """Write content to path unless it already holds it; True if the file was written."""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        digest = self._digest(data)
+        if self._unchanged(path, digest):
+            self.skipped += 1
+            return False
+        atomic_write(path, data)
+        self._record(path, digest)
+        return True
+
+    def write_untracked(self, path: Path, content: Union[str, bytes]) -> bool:
+        """Like write(), but compared with the file's bytes instead of a manifest entry.
+
+        For the one-file-per-blog exports, so the manifest does not grow with the corpus.
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        if self.manifest["files"].pop(str(path), None):
+            self._dirty = True
+        try:
+            if os.path.getsize(path) == len(data) and Path(path).read_bytes() == data:
+                self.skipped += 1
+                return False
+        except OSError:
+            pass
+        atomic_write(path, data)
+        self.written += 1
+        return True
+
+    def remove(self, path: Path):
+        """Delete a file this writer no longer produces, and forget it."""
+        Path(path).unlink(missing_ok=True)
+        if self.manifest["files"].pop(str(path), None):
+            self._dirty = True
+
+    def open(self, path: Path) -> 'ArtifactStream':
+        """Stream a file's content; commit() replaces the file only if the bytes changed."""
+        return ArtifactStream(path, self)
+
+    def same_fingerprint(self, name: str, content: Union[str, bytes]) -> bool:
+        """True if content hashes the same as when record_fingerprint(name, ...) was last called."""
+        return self.manifest["fingerprints"].get(name) == self._digest(content)
+
+    def record_fingerprint(self, name: str, content: Union[str, bytes]):
+        self.manifest["fingerprints"][name] = self._digest(content)
+        self._dirty = True
+
+    def save(self):
+        """Persist the manifest if anything changed."""
+        if self._dirty:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.manifest_path, json.dumps(self.manifest, indent=2).encode('utf-8'))
+            self._dirty = False
+
+
+class ArtifactStream:
+    """
+    A file written in pieces to a temporary file and hashed on the way
+
+    commit() renames it into place, or with an ArtifactWriter drops it if
+    the file already holds the same bytes; discard() drops it.
+    """
+
+    def __init__(self, path: Path, writer: Optional[ArtifactWriter] = None):
+        self.path = Path(path)
+        self.writer = writer
+        self.temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.temp_path, 'wb', buffering=1024 * 1024)
+        self._hash = hashlib.sha256()
+        self.digest = None
+
+    def write(self, text: str):
+        data = text.encode('utf-8')
+        self._hash.update(data)
+        self._file.write(data)
+
+    def close(self) -> str:
+        """Finish writing; returns the content's SHA-256."""
+        if not self._file.closed:
+            self._file.close()
+            self.digest = self._hash.hexdigest()
+        return self.digest
+
+    def commit(self) -> bool:
+        """Put the file in place; True if it was written, False if it was unchanged."""
+        self.close()
+        if self.writer and self.writer._unchanged(self.path, self.digest):
+            self.temp_path.unlink(missing_ok=True)
+            self.writer.skipped += 1
+            return False
+        os.replace(self.temp_path, self.path)
+        if self.writer:
+            self.writer._record(self.path, self.digest)
+        return True
+
+    def discard(self):
+        self.close()
+        self.temp_path.unlink(missing_ok=True)
@@ -2,7 +2,8 @@
 from .logging_utils import setup_logging
 from .db_utils import setup_database
 from .content_utils import clean_content, enhanced_seo_friendly_url, parse_location
-from .ollama_utils import OllamaManager, retry_with_backoff
+from .ollama_utils import OllamaManager, OllamaHTTPClient, OllamaUnavailable, retry_with_backoff
+from .llm_cache import LLMResponseCache
 from .misc_utils import random_id, random_choice_weighted, chunk_list
 
 # Make all functions available when importing from utils
@@ -13,7 +14,10 @@ __all__ = [
     'enhanced_seo_friendly_url',
     'parse_location',
     'OllamaManager',
+    'OllamaHTTPClient',
+    'OllamaUnavailable',
     'retry_with_backoff',
+    'LLMResponseCache',
     'random_id',
     'random_choice_weighted',
     'chunk_list'
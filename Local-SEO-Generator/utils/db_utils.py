@@ -4,9 +4,13 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
-def setup_database(db_path: str) -> sqlite3.Connection:
-    """Set up SQLite database with simplified schema."""
-    conn = sqlite3.connect(db_path)
+def setup_database(db_path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Set up SQLite database with simplified schema.
+
+    Pass check_same_thread=False to share the connection between worker
+    threads; the caller must then serialise access with a lock.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.execute("PRAGMA foreign_keys = ON")
     
     with conn:
@@ -40,6 +44,34 @@ def setup_database(db_path: str) -> sqlite3.Connection:
         conn.execute('CREATE INDEX IF NOT EXISTS idx_city_state ON blogs(city, state)')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_location_status ON blogs(location_status)')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_keyword ON blogs(keyword)')
+
+        # Batch runs: the planned tasks of each run and how far each got
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS generation_runs (
+                run_id TEXT PRIMARY KEY,
+                business_id TEXT NOT NULL,
+                total INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'running',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS generation_tasks (
+                run_id TEXT NOT NULL REFERENCES generation_runs(run_id),
+                position INTEGER NOT NULL,
+                keyword TEXT NOT NULL,
+                location TEXT NOT NULL,
+                location_status TEXT,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                blog_id INTEGER,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_id, position)
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_task_state ON generation_tasks(run_id, state, position)')
     
     return conn
 
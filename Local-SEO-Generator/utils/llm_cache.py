@@ -0,0 +1,111 @@
+# Local-SEO-Generator/generete-blogs/version-2/utils/llm_cache.py
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+# Cached responses are a few KB each; this holds tens of thousands
+DEFAULT_CACHE_SIZE_MB = 256
+
+class LLMResponseCache:
+    """
+    On-disk cache of model responses, keyed on (model, options, prompt, scope)
+
+    A blog's prompts are deterministic for its title, and each later
+    section's prompt includes the earlier responses, so a rerun after a
+    crash replays every section from the cache instead of the model. The
+    scope (the blog's title, unique per blog) keeps two blogs whose
+    prompts happen to match, e.g. conclusions for the same city, from
+    sharing one response. Stored in its own SQLite file; the least
+    recently used entries are evicted once the responses exceed max_bytes.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_CACHE_SIZE_MB * 1024 * 1024):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        # Shared by worker threads, guarded by _lock
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            ''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)')
+        self._size = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    @staticmethod
+    def key(model: str, options: Optional[Dict[str, Any]], prompt: str, scope: str = '') -> str:
+        """SHA-256 of the model, its generation options, the prompt and the scope"""
+        payload = json.dumps([model, options or {}, prompt, scope], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute('SELECT response FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self.conn:
+                self.conn.execute('UPDATE responses SET last_used = ? WHERE key = ?', (time.time(), key))
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response, replacing any earlier one, then evict down to max_bytes"""
+        size = len(response.encode('utf-8'))
+        now = time.time()
+        with self._lock, self.conn:
+            old = self.conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, model, response, size, now, now)
+            )
+            self._size += size - (old[0] if old else 0)
+            self.writes += 1
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits (caller holds _lock)"""
+        rows = self.conn.execute('SELECT key, size FROM responses ORDER BY last_used').fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._size <= self.max_bytes:
+                break
+            doomed.append((key,))
+            self._size -= size
+        self.conn.executemany('DELETE FROM responses WHERE key = ?', doomed)
+        self.evictions += len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self.conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_mb": round(self._size / (1024 * 1024), 2),
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
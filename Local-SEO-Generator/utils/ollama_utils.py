@@ -1,7 +1,19 @@
 # Local-SEO-Generator/generete-blogs/version-2/utils/ollama_utils.py
+import os
+import json
+import queue
 import subprocess
 import logging
 import time
+import http.client
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from .llm_cache import LLMResponseCache
+
+# Same variables the ollama CLI reads
+OLLAMA_HOST = os.environ.get('OLLAMA_HOST', 'http://127.0.0.1:11434')
+OLLAMA_KEEP_ALIVE = os.environ.get('OLLAMA_KEEP_ALIVE', '30m')
 
 def retry_with_backoff(max_retries: int = 3):
     """Simple retry decorator"""
@@ -18,17 +30,190 @@ def retry_with_backoff(max_retries: int = 3):
         return wrapper
     return decorator
 
+class OllamaUnavailable(Exception):
+    """The Ollama HTTP server could not be reached"""
+
+class OllamaHTTPClient:
+    """
+    Client for the Ollama HTTP API over pooled keep-alive connections
+
+    Each connection stays open between prompts, so a blog's intro, middle
+    and conclusion reuse one socket to a model that is already loaded
+    (keep_alive) instead of starting an `ollama run` process each time.
+    """
+
+    def __init__(self, host: str = OLLAMA_HOST, timeout: int = 300, pool_size: int = 4):
+        parsed = urlparse(host if '://' in host else f'http://{host}')
+        self.host = parsed.hostname or '127.0.0.1'
+        self.port = parsed.port or 11434
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _release_connection(self, connection: http.client.HTTPConnection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None):
+        """Send a request, retrying once on a pooled connection the server has closed"""
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body else {}
+
+        for attempt in range(2):
+            connection = self._get_connection()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                return connection, connection.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                connection.close()
+                if attempt == 1:
+                    raise OllamaUnavailable(f"Ollama at {self.host}:{self.port} closed the connection")
+            except TimeoutError:
+                # A slow generation, not a missing server
+                connection.close()
+                raise
+            except OSError as e:
+                connection.close()
+                raise OllamaUnavailable(f"Ollama at {self.host}:{self.port} is not reachable: {e}")
+
+    def _json(self, method: str, path: str, payload: Optional[dict] = None) -> Dict[str, Any]:
+        connection, response = self._request(method, path, payload)
+        try:
+            data = response.read()
+        except Exception:
+            connection.close()
+            raise
+        self._release_connection(connection)
+        if response.status != 200:
+            raise Exception(f"Ollama HTTP {response.status}: {data.decode('utf-8', 'replace')}")
+        return json.loads(data)
+
+    def version(self) -> str:
+        return self._json('GET', '/api/version').get('version', '')
+
+    def is_available(self) -> bool:
+        try:
+            self.version()
+            return True
+        except Exception:
+            return False
+
+    def list_models(self) -> list:
+        return [model.get('name', '') for model in self._json('GET', '/api/tags').get('models', [])]
+
+    def generate(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None,
+                 keep_alive: Optional[str] = OLLAMA_KEEP_ALIVE,
+                 on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Run one prompt through /api/generate and return the full response
+
+        With on_token the response is streamed and each token is passed to it
+        as it arrives; the joined text is still returned.
+        """
+        payload = {'model': model, 'prompt': prompt, 'stream': on_token is not None}
+        if options:
+            payload['options'] = options
+        if keep_alive is not None:
+            payload['keep_alive'] = keep_alive
+
+        if on_token is None:
+            data = self._json('POST', '/api/generate', payload)
+            if data.get('error'):
+                raise Exception(f"Ollama error: {data['error']}")
+            return data.get('response', '')
+
+        connection, response = self._request('POST', '/api/generate', payload)
+        try:
+            if response.status != 200:
+                raise Exception(f"Ollama HTTP {response.status}: {response.read().decode('utf-8', 'replace')}")
+
+            # Newline-delimited JSON, one object per token, the last with done: true
+            tokens = []
+            for line in response:
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    raise Exception(f"Ollama error: {chunk['error']}")
+                token = chunk.get('response', '')
+                if token:
+                    tokens.append(token)
+                    on_token(token)
+                if chunk.get('done'):
+                    break
+        except Exception:
+            connection.close()
+            raise
+
+        # Only a fully read response leaves the connection reusable
+        if response.isclosed() or not response.read():
+            self._release_connection(connection)
+        else:
+            connection.close()
+        return ''.join(tokens)
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
 class OllamaManager:
     """Simple Ollama manager"""
 
-    def __init__(self, model_name: str = "llama3.2", timeout: int = 300):
+    def __init__(self, model_name: str = "llama3.2", timeout: int = 300, backend: str = 'auto',
+                 host: str = OLLAMA_HOST, keep_alive: Optional[str] = OLLAMA_KEEP_ALIVE,
+                 options: Optional[Dict[str, Any]] = None, cache: Optional[LLMResponseCache] = None):
+        """
+        Args:
+            backend: 'http' (Ollama API), 'cli' (one `ollama run` per prompt), or
+                'auto' to use the API and fall back to the CLI when it is not reachable
+            keep_alive: How long the server keeps the model loaded after a prompt
+            options: Generation options passed to the API (temperature, num_predict, ...)
+            cache: Responses are looked up here before the model is called, and stored
+        """
+        if backend not in ('auto', 'http', 'cli'):
+            raise ValueError(f"Unknown Ollama backend: {backend}")
         self.model_name = model_name
         self.timeout = timeout
+        self.backend = backend
+        self.keep_alive = keep_alive
+        self.options = options or {}
+        self.cache = cache
+        self.client = OllamaHTTPClient(host, timeout) if backend != 'cli' else None
         self.logger = logging.getLogger(__name__)
 
+    def _use_http(self) -> bool:
+        return self.client is not None and self.backend != 'cli'
+
+    def _fall_back_to_cli(self, error: Exception):
+        """In auto mode, switch to the CLI for the rest of the run"""
+        if self.backend != 'auto':
+            raise error
+        self.logger.warning(f"Ollama HTTP API unavailable ({error}), falling back to the ollama CLI")
+        self.backend = 'cli'
+
     @retry_with_backoff(max_retries=3)
     def verify_installation(self) -> bool:
         """Verify Ollama is working"""
+        if self._use_http():
+            try:
+                output = self.client.generate(self.model_name, 'Say "VERIFIED"', keep_alive=self.keep_alive)
+                if "VERIFIED" not in output:
+                    raise Exception("Ollama verification failed")
+                self.logger.info("✓ Ollama verification successful (HTTP API)")
+                return True
+            except OllamaUnavailable as e:
+                self._fall_back_to_cli(e)
+
         try:
             result = subprocess.run(
                 ['ollama', 'run', self.model_name, 'Say "VERIFIED"'],
@@ -45,9 +230,7 @@ class OllamaManager:
         except subprocess.TimeoutExpired:
             raise Exception("Ollama verification timed out")
 
-    @retry_with_backoff(max_retries=2)
-    def run_prompt(self, prompt: str) -> str:
-        """Run prompt through Ollama"""
+    def _run_cli(self, prompt: str) -> str:
         try:
             result = subprocess.run(
                 ['ollama', 'run', self.model_name, prompt],
@@ -57,11 +240,56 @@ class OllamaManager:
             )
             if result.returncode != 0:
                 raise Exception(f"Ollama error: {result.stderr}")
-            content = result.stdout.strip()
-            if not content or len(content) < 20:
-                raise Exception("Generated content too short")
-            if "I cannot" in content or "I'm sorry" in content:
-                raise Exception("Model refusal detected")
-            return content
+            return result.stdout
         except subprocess.TimeoutExpired:
-            raise Exception("Ollama request timed out")
\ No newline at end of file
+            raise Exception("Ollama request timed out")
+
+    def _run(self, prompt: str, on_token: Optional[Callable[[str], None]] = None) -> str:
+        if self._use_http():
+            try:
+                return self.client.generate(
+                    self.model_name, prompt, options=self.options, keep_alive=self.keep_alive, on_token=on_token
+                )
+            except OllamaUnavailable as e:
+                self._fall_back_to_cli(e)
+            except TimeoutError:
+                raise Exception("Ollama request timed out")
+        return self._run_cli(prompt)
+
+    @retry_with_backoff(max_retries=2)
+    def _run_checked(self, prompt: str, on_token: Optional[Callable[[str], None]] = None) -> str:
+        content = self._run(prompt, on_token).strip()
+        if not content or len(content) < 20:
+            raise Exception("Generated content too short")
+        if "I cannot" in content or "I'm sorry" in content:
+            raise Exception("Model refusal detected")
+        return content
+
+    def run_prompt(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, refresh: bool = False,
+                   cache_scope: str = '') -> str:
+        """Run prompt through Ollama (on_token receives streamed tokens on the HTTP backend)
+
+        With a cache, a stored response for the same model, options and prompt
+        is returned without calling the model (and passed to on_token whole).
+        refresh=True skips the lookup and replaces the stored response, e.g.
+        when retrying after the cached text was rejected. Only prompts with
+        the same cache_scope share responses.
+        """
+        if self.cache is None:
+            return self._run_checked(prompt, on_token)
+
+        key = self.cache.key(self.model_name, self.options, prompt, cache_scope)
+        if not refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if on_token:
+                    on_token(cached)
+                return cached
+
+        content = self._run_checked(prompt, on_token)
+        self.cache.put(key, self.model_name, content)
+        return content
+
+    def close(self):
+        if self.client:
+            self.client.close()
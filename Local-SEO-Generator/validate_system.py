@@ -139,6 +139,140 @@ def test_ollama_check():
     
     return True
 
+def test_ollama_http_client():
+    """Test the Ollama HTTP backend against a local fake server"""
+    print("\n🧪 Testing Ollama HTTP client (fake server)...")
+    try:
+        import json
+        import socket
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from utils.ollama_utils import OllamaManager, OllamaUnavailable
+
+        requests = []
+        connections = set()
+
+        class FakeOllama(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body, content_type='application/json'):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                connections.add(self.client_address)
+                self._send(json.dumps({'version': '0.0-fake'}).encode())
+
+            def do_POST(self):
+                connections.add(self.client_address)
+                payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                requests.append(payload)
+                text = f"Fresh Nashville hot chicken for: {payload['prompt']}"
+                if payload.get('stream'):
+                    lines = [json.dumps({'response': word + ' ', 'done': False}) for word in text.split()]
+                    lines.append(json.dumps({'response': '', 'done': True}))
+                    self._send(('\n'.join(lines) + '\n').encode(), 'application/x-ndjson')
+                else:
+                    self._send(json.dumps({'response': text, 'done': True}).encode())
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOllama)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            ollama = OllamaManager('llama3.2', host=host, keep_alive='10m', options={'temperature': 0.7})
+            for section in ('intro', 'middle', 'conclusion'):
+                assert section in ollama.run_prompt(f"Write the {section}")
+            assert len(connections) == 1, f"expected one keep-alive connection, got {len(connections)}"
+            assert requests[0]['keep_alive'] == '10m' and requests[0]['options'] == {'temperature': 0.7}
+            print("  ✅ Three prompts over one keep-alive connection")
+
+            tokens = []
+            streamed = ollama.run_prompt("Write a streamed intro", on_token=tokens.append)
+            assert len(tokens) > 1 and streamed == ''.join(tokens).strip()
+            print(f"  ✅ Streaming delivered {len(tokens)} tokens")
+            ollama.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Nothing listening: 'http' raises, 'auto' switches to the CLI
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            closed_host = f"http://127.0.0.1:{probe.getsockname()[1]}"
+        try:
+            OllamaManager('llama3.2', host=closed_host, backend='http')._run("Hello")
+            raise AssertionError("expected OllamaUnavailable")
+        except OllamaUnavailable:
+            pass
+        fallback = OllamaManager('llama3.2', host=closed_host)
+        try:
+            fallback._run("Hello")
+        except Exception:
+            pass  # the CLI itself may not be installed here
+        assert fallback.backend == 'cli'
+        print("  ✅ Falls back to the ollama CLI when the API is unreachable")
+
+        return True
+    except Exception as e:
+        print(f"  ❌ Ollama HTTP client error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_llm_cache():
+    """Test the response cache: replay, refresh and LRU eviction"""
+    print("\n🧪 Testing LLM response cache...")
+    try:
+        import tempfile
+        from utils.llm_cache import LLMResponseCache
+        from utils.ollama_utils import OllamaManager
+
+        class CountingOllama(OllamaManager):
+            """Answers locally and counts how often the model is called"""
+            calls = 0
+
+            def _run(self, prompt, on_token=None):
+                self.calls += 1
+                return f"Fresh Nashville hot chicken, response {self.calls} to: {prompt}"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LLMResponseCache(os.path.join(tmp, 'llm_cache.db'), max_bytes=1024)
+            ollama = CountingOllama('llama3.2', backend='cli', options={'temperature': 0.7}, cache=cache)
+
+            first = ollama.run_prompt("Write the intro")
+            assert ollama.run_prompt("Write the intro") == first and ollama.calls == 1
+            print("  ✅ Repeated prompt replayed from the cache")
+
+            refreshed = ollama.run_prompt("Write the intro", refresh=True)
+            assert refreshed != first and ollama.run_prompt("Write the intro") == refreshed
+            ollama.options = {'temperature': 0.2}
+            ollama.run_prompt("Write the intro")
+            assert ollama.calls == 3
+            print("  ✅ refresh=True and changed options call the model")
+
+            for n in range(40):
+                ollama.run_prompt(f"Write section {n}")
+            stats = cache.stats()
+            assert stats['evictions'] > 0 and stats['size_mb'] * 1024 * 1024 <= 1024
+            assert cache.get(cache.key('llama3.2', {'temperature': 0.2}, "Write section 39")) is not None
+            print(f"  ✅ LRU eviction kept {stats['entries']} entries under 1 KB "
+                  f"({stats['hits']} hits, {stats['misses']} misses)")
+            cache.close()
+
+        return True
+    except Exception as e:
+        print(f"  ❌ LLM cache error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     """Run all validation tests"""
     print("🚀 Local SEO Generator - System Validation\n")
@@ -150,6 +284,8 @@ def main():
     all_passed &= test_business_config()
     all_passed &= test_database()
     all_passed &= test_ollama_check()
+    all_passed &= test_ollama_http_client()
+    all_passed &= test_llm_cache()
     
     print("\n" + "="*50)
     if all_passed:
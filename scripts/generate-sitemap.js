@@ -3,18 +3,15 @@ import path from "path";
 import { fileURLToPath } from "url";
 import { routes as staticRoutes } from "../webpack/prod/staticRoutes.js";
 
-// Import blog data for dynamic blog URLs
-import blogDataRaw from "../src/core/Blogs/Templates/LocalSEO/database_content.json" assert { type: "json" };
-
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
 const SITE_URL = "https://nashandsmashed.com";
 
-// Extract blog URLs dynamically
-const blogRoutes = blogDataRaw
-  .filter((blog) => blog.url && blog.title)
-  .map((blog) => `/${blog.url}`);
+// Blog posts have their own sharded sitemap, written by the Local-SEO-Generator
+// exporter (`exporter_cli.py --sitemap`) to public/sitemaps; the production
+// build copies that folder to dist/sitemaps
+const BLOG_SITEMAP_INDEX = `${SITE_URL}/sitemaps/sitemap-blogs.xml`;
 
 function generateSitemap() {
   const currentDate = new Date().toISOString();
@@ -25,10 +22,7 @@ function generateSitemap() {
   );
 
   // Add /blog as a static page, but not individual posts
-  const allStaticRoutes = [...staticTopLevelRoutes, "/blog"];
-
-  // Combine static and dynamic blog routes
-  const allRoutes = [...allStaticRoutes, ...blogRoutes];
+  const allRoutes = [...staticTopLevelRoutes, "/blog"];
 
   const getRouteConfig = (route) => {
     if (route === "/") {
@@ -41,8 +35,6 @@ function generateSitemap() {
       ["/calories", "/terms-of-service", "/privacy-policy"].includes(route)
     ) {
       return { priority: "0.6", changefreq: "yearly" };
-    } else if (route.startsWith("/blog/")) {
-      return { priority: "0.7", changefreq: "monthly" };
     } else {
       return { priority: "0.7", changefreq: "monthly" };
     }
@@ -86,7 +78,8 @@ function generateRobotsTxt() {
   const robotsTxt = `User-agent: *
 Allow: /
 
-Sitemap: ${SITE_URL}/sitemap.xml`;
+Sitemap: ${SITE_URL}/sitemap.xml
+Sitemap: ${BLOG_SITEMAP_INDEX}`;
 
   const publicDir = path.resolve(__dirname, "../public");
   const robotsPath = path.join(publicDir, "robots.txt");
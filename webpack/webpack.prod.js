@@ -8,6 +8,7 @@ import { generateStaticHtmlPlugins } from "./prod/staticRoutes-blog.js";
 import { fileURLToPath } from "url";
 import path from "path";
 import webpack from "webpack";
+import CopyWebpackPlugin from "copy-webpack-plugin";
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -33,6 +34,17 @@ const filteredCommonConfig = {
 // SIMPLIFIED: Reduce plugin complexity during source map debugging
 const productionPlugins = [
   ...staticHtmlPlugins,
+  // Blog sitemap shards and index from `exporter_cli.py --sitemap`; dist is
+  // cleaned on every build, so they are kept in public/sitemaps and copied here
+  new CopyWebpackPlugin({
+    patterns: [
+      {
+        from: path.resolve(__dirname, "../public/sitemaps"),
+        to: "sitemaps",
+        noErrorOnMissing: true,
+      },
+    ],
+  }),
   // Temporarily disable S3 plugin to isolate source map issue
   // Add back after confirming source maps work
   // ...(s3Plugin ? [s3Plugin] : []),